@@ -0,0 +1,134 @@
+import asyncio
+import random
+from abc import ABC, abstractmethod
+from typing import Protocol
+
+from .models import Campaign, CampaignState
+
+# Fields the content crew's MarketingBrief requires; 'usp' may also be sent as 'unique_selling_proposition'
+REQUIRED_BRIEF_FIELDS = (
+    "product_name", "category", "detailed_description", "problem_statement",
+    "primary_audience", "usp", "tone_and_personality", "budget_range",
+)
+
+
+class AgentClient(Protocol):
+    """
+    A downstream agent. `run` does the work of the campaign's current state
+    and returns the artifacts to add to the campaign.
+    """
+
+    async def run(self, state: CampaignState, campaign: Campaign) -> dict: ...
+
+
+class LocalAgent(ABC):
+    """
+    Base class for the offline stand-ins below. Each call waits `latency`
+    seconds and fails with probability `failure_rate`, so retries and
+    worker pool sizing can be exercised without any real service.
+    """
+
+    def __init__(self, latency: float = 0.0, failure_rate: float = 0.0):
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.calls = 0
+
+    async def run(self, state: CampaignState, campaign: Campaign) -> dict:
+        self.calls += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if self.failure_rate and random.random() < self.failure_rate:
+            raise RuntimeError(f"{type(self).__name__} failed on purpose")
+        return self.respond(state, campaign)
+
+    @abstractmethod
+    def respond(self, state: CampaignState, campaign: Campaign) -> dict:
+        """
+        Returns the artifacts the real agent would, for the campaign's current state.
+        """
+
+
+def _padded(items: list[str], count: int, filler: str) -> list[str]:
+    items = list(items)[:count]
+    return items + [f"{filler} {i + 1}" for i in range(count - len(items))]
+
+
+class LocalContentCrew(LocalAgent):
+    """
+    Stands in for the content crew: a research report, then the drafted content.
+    The brief and both artifacts use the field names and list lengths of the
+    crew's MarketingBrief, ResearchReport and MarketingContent models.
+    """
+
+    def respond(self, state: CampaignState, campaign: Campaign) -> dict:
+        brief = {"usp": campaign.brief.get("unique_selling_proposition"), **campaign.brief}
+        missing = [name for name in REQUIRED_BRIEF_FIELDS if not brief.get(name)]
+        if missing:
+            raise ValueError(f"The brief of '{campaign.name}' is missing {', '.join(missing)}")
+
+        if state == CampaignState.RESEARCHING:
+            competitors = brief.get("known_competitors") or []
+            return {
+                "research_report": {
+                    "audience_insights": f"{brief['primary_audience']} looking for {brief['category'].lower()}.",
+                    "market_trends": [f"Growing demand for {brief['category'].lower()}", "More buying online"],
+                    "key_pain_points": _padded(
+                        brief.get("target_pain_points") or [brief["problem_statement"]], 3, "Pain point"
+                    ),
+                    "competitor_analysis": f"Known competitors: {', '.join(competitors) or 'none listed'}.",
+                    "seo_keywords": _padded(
+                        [campaign.name.lower(), brief["category"].lower(), *(brief.get("key_features") or [])],
+                        10, f"{campaign.name.lower()} keyword",
+                    ),
+                }
+            }
+
+        blog_post = f"# {campaign.name}\n\n{brief['problem_statement']}\n\n{brief['detailed_description']}"
+        if campaign.feedback:
+            blog_post += f"\n\n<!-- Revised after review: {campaign.feedback} -->"
+        return {
+            "marketing_content": {
+                "blog_post_markdown": blog_post,
+                "landing_page": {
+                    "headline": campaign.name,
+                    "sub_headline": brief.get("one_line_summary") or brief["usp"],
+                    "feature_blurbs": _padded(brief.get("main_benefits") or [brief["usp"]], 3, "Feature"),
+                },
+            }
+        }
+
+
+class LocalLandingPageDeveloper(LocalAgent):
+    """
+    Stands in for the landing page developer: renders the approved copy as HTML.
+    """
+
+    def respond(self, state: CampaignState, campaign: Campaign) -> dict:
+        page = campaign.artifacts.get("marketing_content", {}).get("landing_page", {})
+        blurbs = "".join(f"<li>{blurb}</li>" for blurb in page.get("feature_blurbs", []))
+        html = (
+            f"<html><body><h1>{page.get('headline', '')}</h1>"
+            f"<p>{page.get('sub_headline', '')}</p>"
+            f"<ul>{blurbs}</ul></body></html>"
+        )
+        return {"landing_page_files": {"index.html": html}}
+
+
+class LocalAdGateway(LocalAgent):
+    """
+    Stands in for the ad platform gateway: returns a fake campaign id.
+    """
+
+    def respond(self, state: CampaignState, campaign: Campaign) -> dict:
+        return {"ad_campaign_id": f"local-{campaign.id[:12]}", "ad_budget": campaign.budget}
+
+
+def local_agents(latency: float = 0.0, failure_rate: float = 0.0) -> dict[str, AgentClient]:
+    """
+    Returns a stand-in for every downstream agent, keyed like STATE_AGENTS.
+    """
+    return {
+        "content_crew": LocalContentCrew(latency, failure_rate),
+        "landing_page_dev": LocalLandingPageDeveloper(latency, failure_rate),
+        "ad_gateway": LocalAdGateway(latency, failure_rate),
+    }
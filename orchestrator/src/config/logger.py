@@ -0,0 +1,18 @@
+import logging
+import sys
+
+from logging import Formatter, StreamHandler, getLogger
+
+log_format = "[%(asctime)s] - [%(name)s] - [%(levelname)s] - %(message)s"
+date_format = "%Y-%m-%d %H:%M:%S"
+
+console_handler = StreamHandler(sys.stdout)
+console_handler.setFormatter(Formatter(log_format, date_format))
+
+logger = getLogger("orchestrator")
+logger.setLevel(logging.INFO)
+
+# Add the handler to the logger
+if not logger.hasHandlers():
+    logger.addHandler(console_handler)
+    logger.propagate = False # Prevent logs from bubbling up to the root logger
@@ -0,0 +1,51 @@
+import os
+from dataclasses import dataclass, fields
+from pathlib import Path
+
+env_path = Path(__file__).parent.parent.parent
+
+
+def _parse(value: str, default):
+    if isinstance(default, bool):
+        return value.strip().lower() in ("1", "true", "yes", "on")
+    if isinstance(default, Path):
+        return Path(value)
+    return type(default)(value)
+
+
+@dataclass(frozen=True)
+class Settings:
+    """
+    Orchestrator settings, overridden by environment variables of the same name.
+    """
+
+    # SQLite file holding every campaign and its state
+    DB_PATH: Path = env_path / ".data" / "campaigns.sqlite3"
+
+    # Size of the worker pool for each downstream agent
+    CONTENT_CREW_WORKERS: int = 8
+    LANDING_PAGE_WORKERS: int = 4
+    AD_GATEWAY_WORKERS: int = 2
+
+    # Failed agent calls are retried on the next poll, the campaign fails after this many
+    MAX_ATTEMPTS: int = 3
+
+    # How often the store is checked for new, approved or retried campaigns
+    POLL_INTERVAL_SECONDS: float = 1.0
+
+    # Skip the human review step, e.g. for offline runs
+    AUTO_APPROVE: bool = False
+
+    # Simulated seconds per call of the local stand-in agents
+    STANDIN_LATENCY_SECONDS: float = 0.05
+
+    @classmethod
+    def from_env(cls) -> "Settings":
+        values = {}
+        for field in fields(cls):
+            if field.name in os.environ:
+                values[field.name] = _parse(os.environ[field.name], field.default)
+        return cls(**values)
+
+
+settings = Settings.from_env()
@@ -1,6 +1,147 @@
-def main():
-    print("Hello from orchestrator!")
+import argparse
+import asyncio
+import json
+import logging
+import sys
+import time
+from pathlib import Path
+
+from .agents import local_agents
+from .config.logger import logger
+from .config.settings import settings
+from .models import Campaign, CampaignState
+from .orchestrator import Orchestrator, review_campaign
+from .store import CampaignStore
+
+SAMPLE_BRIEF = {
+    "product_name": "TrailMate",
+    "category": "Outdoor & Fitness Apps",
+    "one_line_summary": "AI hiking boot recommendations from your trail history.",
+    "detailed_description": "TrailMate recommends hiking boots based on the trails you walk.",
+    "problem_statement": "Hikers buy boots that do not suit their trails and get blisters.",
+    "target_pain_points": ["Blisters on long hikes", "Confusing boot specs", "Costly returns"],
+    "primary_audience": "Weekend hikers",
+    "key_features": ["Trail history import", "Boot matching"],
+    "main_benefits": ["Fewer blisters", "Confident purchases", "Fewer returns"],
+    "usp": "Boot advice tuned to the trails you actually walk.",
+    "known_competitors": ["REI Expert Advice", "AllTrails"],
+    "tone_and_personality": "Friendly and expert",
+    "budget_range": "$1000",
+}
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Campaign orchestrator")
+    parser.add_argument("--db", default=str(settings.DB_PATH), help="Campaign store (default: DB_PATH).")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="Run the orchestrator with the local stand-in agents.")
+    run.add_argument("--until-idle", action="store_true", help="Exit once no campaign is left to work on.")
+    run.add_argument("--auto-approve", action="store_true", default=settings.AUTO_APPROVE,
+                     help="Skip the human review step.")
+
+    submit = commands.add_parser("submit", help="Submit campaigns from a JSONL file.")
+    submit.add_argument("file", help="One JSON object per line: a brief, or {\"brief\": {...}, \"budget\": 1000}.")
+
+    approve = commands.add_parser("approve", help="Approve a campaign that is in review.")
+    approve.add_argument("campaign_id")
+
+    reject = commands.add_parser("reject", help="Send a campaign in review back to drafting.")
+    reject.add_argument("campaign_id")
+    reject.add_argument("--feedback", required=True)
+
+    status = commands.add_parser("status", help="Show campaign counts per state, or one campaign.")
+    status.add_argument("campaign_id", nargs="?")
+
+    demo = commands.add_parser("demo", help="Run sample campaigns offline from start to finish.")
+    demo.add_argument("--campaigns", type=int, default=200)
+    demo.add_argument("--failure-rate", type=float, default=0.0, help="Chance that a stand-in call fails.")
+    return parser.parse_args(argv)
+
+
+def build_orchestrator(store: CampaignStore, auto_approve: bool, failure_rate: float = 0.0) -> Orchestrator:
+    return Orchestrator(
+        store,
+        local_agents(settings.STANDIN_LATENCY_SECONDS, failure_rate),
+        workers={
+            "content_crew": settings.CONTENT_CREW_WORKERS,
+            "landing_page_dev": settings.LANDING_PAGE_WORKERS,
+            "ad_gateway": settings.AD_GATEWAY_WORKERS,
+        },
+        max_attempts=settings.MAX_ATTEMPTS,
+        poll_interval=settings.POLL_INTERVAL_SECONDS,
+        auto_approve=auto_approve,
+    )
+
+
+def load_submissions(path: str | Path) -> list[tuple[dict, float]]:
+    submissions = []
+    for line_number, line in enumerate(Path(path).read_text(encoding="utf-8").splitlines(), start=1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"{path}:{line_number} is not valid JSON: {e}") from e
+        if "brief" in record:
+            submissions.append((record["brief"], float(record.get("budget", 0))))
+        else:
+            submissions.append((record, 0.0))
+    return submissions
+
+
+async def run_demo(store: CampaignStore, campaigns: int, failure_rate: float):
+    orchestrator = build_orchestrator(store, auto_approve=True, failure_rate=failure_rate)
+    started = time.perf_counter()
+    for i in range(campaigns):
+        await orchestrator.submit({**SAMPLE_BRIEF, "product_name": f"TrailMate #{i + 1}"}, budget=1000)
+
+    # One log line per state change would drown the summary
+    logger.setLevel(logging.WARNING)
+    try:
+        await orchestrator.run(until_idle=True)
+    finally:
+        logger.setLevel(logging.INFO)
+
+    elapsed = time.perf_counter() - started
+    logger.info(f"{campaigns} campaigns in {elapsed:.2f}s ({campaigns / elapsed:.1f} campaigns/s): {store.counts()}")
+
+
+def run(argv=None) -> int:
+    args = parse_args(argv)
+    store = CampaignStore(args.db)
+
+    try:
+        if args.command == "run":
+            asyncio.run(build_orchestrator(store, args.auto_approve).run(until_idle=args.until_idle))
+        elif args.command == "submit":
+            for brief, budget in load_submissions(args.file):
+                campaign = Campaign.new(brief, budget)
+                store.save(campaign)
+                print(campaign.id)
+        elif args.command == "approve":
+            review_campaign(store, args.campaign_id, CampaignState.CODING)
+        elif args.command == "reject":
+            review_campaign(store, args.campaign_id, CampaignState.DRAFTING, args.feedback)
+        elif args.command == "status":
+            if args.campaign_id:
+                campaign = store.get(args.campaign_id)
+                if campaign is None:
+                    logger.error(f"No campaign with id '{args.campaign_id}'")
+                    return 1
+                print(json.dumps(campaign.to_dict(), indent=2))
+            else:
+                print(json.dumps(store.counts(), indent=2))
+        elif args.command == "demo":
+            asyncio.run(run_demo(store, args.campaigns, args.failure_rate))
+    except KeyboardInterrupt:
+        logger.info("Orchestrator stopped.")
+    except (KeyError, ValueError) as e:
+        logger.error(str(e))
+        return 1
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(run())
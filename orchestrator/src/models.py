@@ -0,0 +1,67 @@
+import time
+import uuid
+from dataclasses import asdict, dataclass, field
+from enum import Enum
+
+
+class CampaignState(str, Enum):
+    RESEARCHING = "RESEARCHING"
+    DRAFTING = "DRAFTING"
+    IN_REVIEW = "IN_REVIEW"
+    CODING = "CODING"
+    PUBLISHING = "PUBLISHING"
+    DONE = "DONE"
+    FAILED = "FAILED"
+
+
+# Downstream agent that does the work of each working state
+STATE_AGENTS = {
+    CampaignState.RESEARCHING: "content_crew",
+    CampaignState.DRAFTING: "content_crew",
+    CampaignState.CODING: "landing_page_dev",
+    CampaignState.PUBLISHING: "ad_gateway",
+}
+
+# State a campaign moves to once the agent of its current state returns
+NEXT_STATE = {
+    CampaignState.RESEARCHING: CampaignState.DRAFTING,
+    CampaignState.DRAFTING: CampaignState.IN_REVIEW,
+    CampaignState.CODING: CampaignState.PUBLISHING,
+    CampaignState.PUBLISHING: CampaignState.DONE,
+}
+
+WORKING_STATES = frozenset(STATE_AGENTS)
+TERMINAL_STATES = frozenset({CampaignState.DONE, CampaignState.FAILED})
+
+
+@dataclass
+class Campaign:
+    """
+    A single campaign moving through the orchestrator's state machine.
+    `artifacts` collects what every agent returned, keyed by artifact name.
+    """
+    id: str
+    brief: dict
+    budget: float = 0.0
+    state: CampaignState = CampaignState.RESEARCHING
+    artifacts: dict = field(default_factory=dict)
+    feedback: str | None = None  # Reviewer notes for the next draft
+    attempts: int = 0  # Failed attempts at the current state
+    error: str | None = None
+    created_at: float = field(default_factory=time.time)
+    updated_at: float = field(default_factory=time.time)
+
+    @classmethod
+    def new(cls, brief: dict, budget: float = 0.0) -> "Campaign":
+        return cls(id=uuid.uuid4().hex, brief=brief, budget=budget)
+
+    @property
+    def name(self) -> str:
+        return self.brief.get("product_name") or self.id[:8]
+
+    def to_dict(self) -> dict:
+        return {**asdict(self), "state": self.state.value}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Campaign":
+        return cls(**{**data, "state": CampaignState(data["state"])})
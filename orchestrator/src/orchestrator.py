@@ -0,0 +1,187 @@
+import asyncio
+
+from .agents import AgentClient
+from .config.logger import logger
+from .models import NEXT_STATE, STATE_AGENTS, WORKING_STATES, Campaign, CampaignState
+from .store import CampaignStore
+
+
+class Orchestrator:
+    """
+    Runs many campaigns through the state machine at once.
+
+    Every downstream agent has its own queue and a bounded pool of worker
+    tasks, so a slow agent only holds up the campaigns waiting for it.
+    Campaigns in review are parked in the store and hold no worker until
+    they are approved or rejected. All state lives in the store, so a
+    restarted orchestrator picks up where the last one stopped.
+    """
+
+    def __init__(
+        self,
+        store: CampaignStore,
+        agents: dict[str, AgentClient],
+        workers: dict[str, int],
+        max_attempts: int = 3,
+        poll_interval: float = 1.0,
+        auto_approve: bool = False,
+    ):
+        missing = {STATE_AGENTS[state] for state in WORKING_STATES} - agents.keys()
+        if missing:
+            raise ValueError(f"No client for agents: {', '.join(sorted(missing))}")
+
+        self.store = store
+        self.agents = agents
+        self.workers = workers
+        self.max_attempts = max_attempts
+        self.poll_interval = poll_interval
+        self.auto_approve = auto_approve
+        self.logger = logger
+
+        self._queues: dict[str, asyncio.Queue] = {}
+        self._in_flight: set[str] = set()
+        # When this orchestrator last saved each campaign, so a stale read from the store is not run again
+        self._saved_at: dict[str, float] = {}
+        self._wakeup: asyncio.Event | None = None
+
+    async def submit(self, brief: dict, budget: float = 0.0) -> Campaign:
+        campaign = Campaign.new(brief, budget)
+        await asyncio.to_thread(self.store.save, campaign)
+        self.logger.debug(f"Campaign '{campaign.name}' ({campaign.id}) submitted.")
+        self._enqueue(campaign)
+        return campaign
+
+    async def approve(self, campaign_id: str) -> Campaign:
+        return await self._review(campaign_id, CampaignState.CODING)
+
+    async def reject(self, campaign_id: str, feedback: str) -> Campaign:
+        """
+        Sends the campaign back to drafting with the reviewer's feedback.
+        """
+        return await self._review(campaign_id, CampaignState.DRAFTING, feedback)
+
+    async def _review(self, campaign_id: str, state: CampaignState, feedback: str | None = None) -> Campaign:
+        campaign = await asyncio.to_thread(review_campaign, self.store, campaign_id, state, feedback)
+        self._enqueue(campaign)
+        return campaign
+
+    async def run(self, until_idle: bool = False):
+        """
+        Starts the worker pools and keeps feeding them from the store.
+        With `until_idle`, returns once no campaign is left in a working state,
+        otherwise runs until cancelled.
+        """
+        self._queues = {name: asyncio.Queue() for name in self.agents}
+        self._wakeup = asyncio.Event()
+        tasks = [
+            asyncio.create_task(self._worker(name), name=f"{name}-{i}")
+            for name in self.agents
+            for i in range(max(1, self.workers.get(name, 1)))
+        ]
+        self.logger.info(
+            "Orchestrator started with workers: "
+            + ", ".join(f"{name}={max(1, self.workers.get(name, 1))}" for name in self.agents)
+        )
+
+        try:
+            while True:
+                runnable = await asyncio.to_thread(self.store.list, WORKING_STATES)
+                for campaign in runnable:
+                    self._enqueue(campaign)
+
+                if until_idle and not self._in_flight:
+                    break
+
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            self._in_flight.clear()
+
+    def _enqueue(self, campaign: Campaign):
+        if not self._queues or campaign.state not in WORKING_STATES or campaign.id in self._in_flight:
+            return
+        if campaign.updated_at < self._saved_at.get(campaign.id, 0):
+            return
+        self._in_flight.add(campaign.id)
+        self._queues[STATE_AGENTS[campaign.state]].put_nowait(campaign)
+
+    async def _worker(self, agent_name: str):
+        queue = self._queues[agent_name]
+        while True:
+            campaign = await queue.get()
+            advanced = False
+            try:
+                campaign = await self._advance(campaign)
+                advanced = campaign.attempts == 0
+            except Exception as e:
+                self.logger.error(f"Campaign '{campaign.name}' could not be saved: {e}", exc_info=True)
+            finally:
+                self._in_flight.discard(campaign.id)
+                queue.task_done()
+                self._wakeup.set()
+
+            # Move straight on to the next state instead of waiting for the next poll
+            if advanced:
+                self._enqueue(campaign)
+
+    async def _advance(self, campaign: Campaign) -> Campaign:
+        """
+        Runs the agent of the campaign's current state and moves it to the next state.
+        A failed call is retried on a later poll until MAX_ATTEMPTS is reached.
+        """
+        state = campaign.state
+        agent_name = STATE_AGENTS[state]
+        try:
+            artifacts = await self.agents[agent_name].run(state, campaign)
+        except Exception as e:
+            campaign.attempts += 1
+            campaign.error = f"{agent_name}: {e}"
+            if campaign.attempts >= self.max_attempts:
+                campaign.state = CampaignState.FAILED
+                self.logger.error(f"Campaign '{campaign.name}' failed in {state.value}: {e}")
+            else:
+                self.logger.warning(
+                    f"Campaign '{campaign.name}' {state.value} attempt {campaign.attempts} failed: {e}"
+                )
+        else:
+            campaign.artifacts.update(artifacts)
+            campaign.attempts = 0
+            campaign.error = None
+            campaign.state = NEXT_STATE[state]
+            if campaign.state == CampaignState.IN_REVIEW:
+                campaign.feedback = None
+                if self.auto_approve:
+                    campaign.state = CampaignState.CODING
+            self.logger.info(f"Campaign '{campaign.name}': {state.value} -> {campaign.state.value}")
+
+        await asyncio.to_thread(self.store.save, campaign)
+        self._saved_at[campaign.id] = campaign.updated_at
+        return campaign
+
+
+def review_campaign(
+    store: CampaignStore,
+    campaign_id: str,
+    state: CampaignState,
+    feedback: str | None = None,
+) -> Campaign:
+    """
+    Moves a campaign out of review. Works from any process sharing the store;
+    a running orchestrator picks the campaign up on its next poll.
+    """
+    campaign = store.get(campaign_id)
+    if campaign is None:
+        raise KeyError(f"No campaign with id '{campaign_id}'")
+    if campaign.state != CampaignState.IN_REVIEW:
+        raise ValueError(f"Campaign '{campaign.name}' is {campaign.state.value}, not in review")
+
+    campaign.state = state
+    campaign.feedback = feedback
+    store.save(campaign)
+    return campaign
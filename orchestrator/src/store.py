@@ -0,0 +1,70 @@
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from .models import Campaign, CampaignState
+
+
+class CampaignStore:
+    """
+    Persists every campaign in a local SQLite file, so the orchestrator can
+    restart without losing track of them. Other processes (e.g. the CLI
+    approving a review) change campaigns through the same file.
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            str(self.path),
+            timeout=30,
+            check_same_thread=False,
+            isolation_level=None,  # autocommit, every statement is its own transaction
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS campaigns (
+                id TEXT PRIMARY KEY,
+                state TEXT NOT NULL,
+                data TEXT NOT NULL,
+                updated_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_campaigns_state ON campaigns (state)")
+
+    def save(self, campaign: Campaign):
+        campaign.updated_at = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO campaigns (id, state, data, updated_at) VALUES (?, ?, ?, ?)",
+                (campaign.id, campaign.state.value, json.dumps(campaign.to_dict()), campaign.updated_at),
+            )
+
+    def get(self, campaign_id: str) -> Campaign | None:
+        with self._lock:
+            row = self._conn.execute("SELECT data FROM campaigns WHERE id = ?", (campaign_id,)).fetchone()
+        return Campaign.from_dict(json.loads(row[0])) if row else None
+
+    def list(self, states=None) -> list[Campaign]:
+        """
+        Returns the campaigns in any of `states`, or all of them, oldest first.
+        """
+        query = "SELECT data FROM campaigns"
+        params = []
+        if states is not None:
+            states = [CampaignState(state).value for state in states]
+            query += f" WHERE state IN ({','.join('?' * len(states))})"
+            params = states
+        with self._lock:
+            rows = self._conn.execute(query + " ORDER BY updated_at", params).fetchall()
+        return [Campaign.from_dict(json.loads(data)) for data, in rows]
+
+    def counts(self) -> dict[str, int]:
+        with self._lock:
+            rows = self._conn.execute("SELECT state, COUNT(*) FROM campaigns GROUP BY state").fetchall()
+        return dict(rows)
@@ -0,0 +1,81 @@
+"""
+Offline benchmarks for the content crews.
+
+    python -m benchmarks                          # fake LLM and fake search
+    python -m benchmarks --llm record --search record
+    python -m benchmarks --llm replay --search replay --baseline bench.json
+"""
+import argparse
+import json
+import os
+import sys
+
+# No telemetry or first-run prompts from crewAI while benchmarking
+os.environ.setdefault("CREWAI_DISABLE_TELEMETRY", "true")
+os.environ.setdefault("OTEL_SDK_DISABLED", "true")
+os.environ.setdefault("CREWAI_TESTING", "true")
+# The pipeline publishes every benchmarked brief, keep the artifacts in memory
+os.environ["STORAGE_BACKEND"] = "memory"
+
+from .harness import MODES, BenchmarkConfig, compare, format_report, run_benchmarks  # noqa: E402
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    defaults = BenchmarkConfig()
+    parser = argparse.ArgumentParser(description="Content Crew offline benchmarks")
+    parser.add_argument("--llm", choices=MODES, default=defaults.llm_mode,
+                        help="fake: scripted LLM, record: real LLM into the cassette, replay: from the cassette.")
+    parser.add_argument("--search", choices=MODES, default=defaults.search_mode,
+                        help="fake: canned results, record: real Tavily into the cassette, replay: from the cassette.")
+    parser.add_argument("--cassette", default=defaults.cassette, help="Cassette file to record into or replay from.")
+    parser.add_argument("--llm-latency", type=float, default=defaults.llm_latency,
+                        help="Simulated seconds per fake LLM call.")
+    parser.add_argument("--search-latency", type=float, default=defaults.search_latency,
+                        help="Simulated seconds per fake search.")
+    parser.add_argument("--iterations", type=int, default=defaults.iterations,
+                        help="Repetitions of each overhead phase.")
+    parser.add_argument("--concurrency", default=",".join(map(str, defaults.concurrency)),
+                        help="Comma separated concurrency levels for the throughput run.")
+    parser.add_argument("--briefs", type=int, default=defaults.briefs_per_level,
+                        help="Briefs run at each concurrency level.")
+    parser.add_argument("--output", metavar="FILE", help="Write the report as JSON, e.g. to keep as a baseline.")
+    parser.add_argument("--baseline", metavar="FILE", help="Compare against an earlier JSON report.")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="Allowed slowdown against the baseline before failing (default: 0.2 = 20%%).")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    config = BenchmarkConfig(
+        llm_mode=args.llm,
+        search_mode=args.search,
+        llm_latency=args.llm_latency,
+        search_latency=args.search_latency,
+        iterations=args.iterations,
+        concurrency=[int(level) for level in args.concurrency.split(",") if level.strip()],
+        briefs_per_level=args.briefs,
+        cassette=args.cassette,
+    )
+
+    report = run_benchmarks(config)
+    print(format_report(report))
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            regressions = compare(report, json.load(f), args.tolerance)
+        if regressions:
+            print("\nRegressions against the baseline:")
+            for regression in regressions:
+                print(f"  {regression}")
+            return 1
+        print("\nNo regressions against the baseline.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
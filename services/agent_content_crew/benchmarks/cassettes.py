@@ -0,0 +1,152 @@
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Any, Type
+
+from crewai.llms.base_llm import BaseLLM
+from crewai.tools import BaseTool
+from pydantic import BaseModel, ConfigDict
+
+from src.llm.delegating_llm import DelegatingLLM
+from src.utils.sqlite_cache import make_cache_key
+
+CASSETTE_DIR = Path(__file__).parent / "cassettes"
+
+
+class CassetteMiss(KeyError):
+    """Raised in replay mode when a request was never recorded."""
+
+
+class Cassette:
+    """
+    A JSON file of recorded LLM responses and tool outputs, keyed by a hash
+    of the request. Recording adds entries, replaying only reads them.
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self.entries = {"llm": {}, "tool": {}}
+        if self.path.exists():
+            self.entries.update(json.loads(self.path.read_text(encoding="utf-8")))
+
+    def get(self, kind: str, key: str) -> str:
+        with self._lock:
+            if key not in self.entries[kind]:
+                raise CassetteMiss(f"No recorded {kind} response in '{self.path}' for request {key[:12]}")
+            return self.entries[kind][key]
+
+    def put(self, kind: str, key: str, value: str):
+        with self._lock:
+            self.entries[kind][key] = value
+
+    def save(self):
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.write_text(json.dumps(self.entries, indent=2, sort_keys=True), encoding="utf-8")
+
+
+def llm_key(agent_name: str, messages, task_name: str | None) -> str:
+    # The model id is left out on purpose, so a cassette replays after a model switch
+    return make_cache_key("llm", agent_name, task_name, messages)
+
+
+def tool_key(tool_name: str, arguments: dict) -> str:
+    return make_cache_key("tool", tool_name, arguments)
+
+
+class RecordingLLM(DelegatingLLM):
+    """
+    Forwards calls to the real LLM and records every text response,
+    along with the time spent waiting for the model.
+    """
+
+    def __init__(self, llm: BaseLLM, agent_name: str, cassette: Cassette):
+        super().__init__(llm)
+        self.agent_name = agent_name
+        self.cassette = cassette
+        self.calls = 0
+        self.model_seconds = 0.0
+        self._lock = threading.Lock()
+
+    def call(
+        self,
+        messages,
+        tools: list[dict] | None = None,
+        callbacks: list[Any] | None = None,
+        available_functions: dict[str, Any] | None = None,
+        from_task: Any | None = None,
+        from_agent: Any | None = None,
+    ) -> str | Any:
+        started = time.perf_counter()
+        response = super().call(messages, tools, callbacks, available_functions, from_task, from_agent)
+        with self._lock:
+            self.calls += 1
+            self.model_seconds += time.perf_counter() - started
+
+        if isinstance(response, str):
+            self.cassette.put("llm", llm_key(self.agent_name, messages, getattr(from_task, "name", None)), response)
+        return response
+
+
+class ReplayLLM(BaseLLM):
+    """
+    Answers every call from a cassette, without any network access.
+    """
+
+    def __init__(self, agent_name: str, cassette: Cassette):
+        super().__init__(model=f"replay/{agent_name}", temperature=0)
+        self.agent_name = agent_name
+        self.cassette = cassette
+        self.calls = 0
+        self.model_seconds = 0.0
+
+    def call(
+        self,
+        messages,
+        tools: list[dict] | None = None,
+        callbacks: list[Any] | None = None,
+        available_functions: dict[str, Any] | None = None,
+        from_task: Any | None = None,
+        from_agent: Any | None = None,
+    ) -> str:
+        self.calls += 1
+        return self.cassette.get("llm", llm_key(self.agent_name, messages, getattr(from_task, "name", None)))
+
+    def supports_function_calling(self) -> bool:
+        return False
+
+    def get_context_window_size(self) -> int:
+        return 128_000
+
+
+class CassetteTool(BaseTool):
+    """
+    Takes the name and arguments of a real tool. Records its outputs when
+    `tool` is given, otherwise replays them from the cassette.
+    """
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    cassette: Any
+    tool: Any = None
+
+    def _run(self, **kwargs) -> str:
+        key = tool_key(self.name, kwargs)
+        if self.tool is None:
+            return self.cassette.get("tool", key)
+
+        output = self.tool.run(**kwargs)
+        self.cassette.put("tool", key, output if isinstance(output, str) else json.dumps(output, default=str))
+        return output
+
+
+def cassette_tool(tool: BaseTool, cassette: Cassette, record: bool) -> CassetteTool:
+    args_schema: Type[BaseModel] = tool.args_schema
+    return CassetteTool(
+        name=tool.name,
+        description=tool.description,
+        args_schema=args_schema,
+        cassette=cassette,
+        tool=tool if record else None,
+    )
@@ -0,0 +1,114 @@
+import threading
+import time
+from typing import Any, Type
+
+from crewai.llms.base_llm import BaseLLM
+from crewai.tools import BaseTool
+from pydantic import BaseModel, Field
+
+from .fixtures import SEARCH_RESULTS, TASK_RESPONSES
+
+SEARCH_TOOL_NAME = "Tavily Search"
+
+
+def message_text(messages) -> str:
+    if isinstance(messages, str):
+        return messages
+    return "\n".join(str(message.get("content", "")) for message in messages)
+
+
+class FakeLLM(BaseLLM):
+    """
+    Scripted LLM that answers every task with its canned JSON from the fixtures.
+
+    Agents listed in `search_agents` first ask for one web search, so the tool
+    loop is exercised too. Each call sleeps `latency` seconds to stand in for
+    the model, and that time is counted separately from the pipeline's own.
+    """
+
+    def __init__(self, agent_name: str, latency: float = 0.0, search_agents=("validator", "researcher")):
+        super().__init__(model=f"fake/{agent_name}", temperature=0)
+        self.agent_name = agent_name
+        self.latency = latency
+        self.search = agent_name in search_agents
+        self.calls = 0
+        self.model_seconds = 0.0
+        self._lock = threading.Lock()
+
+    def call(
+        self,
+        messages,
+        tools: list[dict] | None = None,
+        callbacks: list[Any] | None = None,
+        available_functions: dict[str, Any] | None = None,
+        from_task: Any | None = None,
+        from_agent: Any | None = None,
+    ) -> str:
+        if self.latency:
+            time.sleep(self.latency)
+        with self._lock:
+            self.calls += 1
+            self.model_seconds += self.latency
+
+        # After a tool call the executor appends the tool result as the last message
+        last_message = message_text(messages[-1:] if isinstance(messages, list) else messages)
+        task_name = getattr(from_task, "name", None)
+        if self.search and "Observation:" not in last_message:
+            return (
+                "Thought: I should look up current market data first.\n"
+                f"Action: {SEARCH_TOOL_NAME}\n"
+                f'Action Input: {{"query": "{task_name or "market"} research"}}'
+            )
+
+        response = TASK_RESPONSES.get(task_name)
+        if response is None:
+            raise KeyError(f"FakeLLM has no scripted response for task '{task_name}'")
+        return f"Thought: I now know the final answer\nFinal Answer: {response.model_dump_json()}"
+
+    def supports_function_calling(self) -> bool:
+        return False
+
+    def supports_stop_words(self) -> bool:
+        return True
+
+    def get_context_window_size(self) -> int:
+        return 128_000
+
+
+class FakeSearchInput(BaseModel):
+    query: str = Field(..., description="The search query.")
+
+
+class FakeSearchTool(BaseTool):
+    """
+    Stands in for the Tavily search tool and returns canned results.
+    """
+    name: str = SEARCH_TOOL_NAME
+    description: str = "Searches the web and returns the most relevant results as JSON."
+    args_schema: Type[BaseModel] = FakeSearchInput
+    latency: float = 0.0
+
+    def _run(self, query: str) -> str:
+        if self.latency:
+            time.sleep(self.latency)
+        return SEARCH_RESULTS
+
+
+def fake_llm_factory(latency: float = 0.0, registry: list | None = None):
+    """
+    Returns an llm_factory for the crews that builds one FakeLLM per agent.
+    Every created LLM is appended to `registry` so its model time can be read back.
+    """
+    def factory(agent_name: str, llm_config: dict) -> FakeLLM:
+        llm = FakeLLM(agent_name, latency=latency)
+        if registry is not None:
+            registry.append(llm)
+        return llm
+    return factory
+
+
+def fake_tool_factory(latency: float = 0.0):
+    # Web search is the only tool the crews are configured with
+    def factory(tool_path: str) -> FakeSearchTool:
+        return FakeSearchTool(latency=latency)
+    return factory
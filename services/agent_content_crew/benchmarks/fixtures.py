@@ -0,0 +1,100 @@
+import json
+
+from src.models.content_models import (
+    AudienceResearch,
+    BlogPost,
+    CompetitorResearch,
+    LandingPageContent,
+    MarketingContent,
+    MarketTrendsResearch,
+    PainPointsResearch,
+    ResearchReport,
+    SeoKeywordsResearch,
+)
+from src.models.validation_models import ValidationReport
+
+# The brief every benchmark run uses, so cassettes recorded once replay on every run
+SAMPLE_BRIEF = {
+    "product_name": "TrailMate",
+    "category": "Outdoor & Fitness Apps",
+    "one_line_summary": "AI hiking boot recommendations from a photo of your feet and trails.",
+    "detailed_description": (
+        "TrailMate recommends hiking boots by combining a foot scan taken with the phone camera "
+        "with the terrain and weather of the trails a hiker plans to walk."
+    ),
+    "problem_statement": "Hikers buy boots that do not fit their feet or their trails and get blisters.",
+    "target_pain_points": ["Blisters on long hikes", "Confusing boot specs", "Costly returns"],
+    "primary_audience": "Weekend hikers aged 25-45",
+    "demographics": "25-45, middle income, urban",
+    "key_features": ["Foot scan", "Trail matching", "Price comparison"],
+    "main_benefits": ["Fewer blisters", "Confident purchases"],
+    "unique_selling_proposition": "The only boot finder that matches your feet to your trails.",
+    "known_competitors": ["REI Expert Advice", "AllTrails"],
+    "tone_and_personality": "Friendly and expert",
+    "main_goal": "Get app installs",
+    "budget_range": "$1000",
+}
+
+VALIDATION_REPORT = ValidationReport(
+    market_demand="Steady search interest in hiking boots with seasonal peaks in spring.",
+    competitor_density="Medium",
+    monetization_potential="Affiliate commissions from boot retailers and a premium tier.",
+    viability_score=72,
+    recommendation="High potential, proceed.",
+)
+
+RESEARCH_REPORT = ResearchReport(
+    audience_insights="Urban weekend hikers who value comfort and buy gear online after reading reviews.",
+    market_trends=["Lightweight trail runners replacing boots", "Online gear fitting tools"],
+    key_pain_points=["Blisters", "Sizing differs per brand", "Returns are slow"],
+    competitor_analysis=(
+        "REI offers expert advice but no personal fitting. AllTrails knows trails but not gear. "
+        "Retailer size guides are generic."
+    ),
+    seo_keywords=[
+        "hiking boots", "best hiking boots", "hiking boot fit", "trail shoes", "boot finder",
+        "hiking gear app", "blister prevention", "waterproof boots", "hiking boot sizing", "trail running shoes",
+    ],
+)
+
+MARKETING_CONTENT = MarketingContent(
+    blog_post_markdown="# Find Boots That Fit Your Trails\n\n" + "TrailMate matches your feet to your trails. " * 60,
+    landing_page=LandingPageContent(
+        headline="Boots that fit your feet and your trails",
+        sub_headline="Scan your feet, pick your trails, get the right boots.",
+        feature_blurbs=["Scan your feet in seconds.", "Match boots to terrain.", "Compare prices instantly."],
+    ),
+)
+
+# Canned final answers for every task the crews run
+TASK_RESPONSES = {
+    "validation_task": VALIDATION_REPORT,
+    "research_task": RESEARCH_REPORT,
+    "audience_research_task": AudienceResearch(audience_insights=RESEARCH_REPORT.audience_insights),
+    "pain_points_research_task": PainPointsResearch(key_pain_points=RESEARCH_REPORT.key_pain_points),
+    "market_trends_research_task": MarketTrendsResearch(market_trends=RESEARCH_REPORT.market_trends),
+    "competitor_research_task": CompetitorResearch(competitor_analysis=RESEARCH_REPORT.competitor_analysis),
+    "seo_keywords_research_task": SeoKeywordsResearch(seo_keywords=RESEARCH_REPORT.seo_keywords),
+    "writing_task": MARKETING_CONTENT,
+    "blog_post_task": BlogPost(blog_post_markdown=MARKETING_CONTENT.blog_post_markdown),
+    "landing_page_task": MARKETING_CONTENT.landing_page,
+    "editing_task": MARKETING_CONTENT,
+}
+
+SEARCH_RESULTS = json.dumps({
+    "query": "hiking boots market",
+    "results": [
+        {
+            "title": "Hiking boot market size and trends",
+            "url": "https://example.com/hiking-boots-market",
+            "content": "The hiking footwear market keeps growing, driven by lightweight designs.",
+            "score": 0.9,
+        },
+        {
+            "title": "How to choose hiking boots",
+            "url": "https://example.com/choose-hiking-boots",
+            "content": "Fit is the most common reason hikers return boots.",
+            "score": 0.8,
+        },
+    ],
+})
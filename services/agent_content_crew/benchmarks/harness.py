@@ -0,0 +1,273 @@
+import statistics
+import tempfile
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from crewai.events.event_listener import event_listener
+
+from src.crew import ContentCrew, ValidationCrew, build_llm, resolve_object
+from src.models.content_models import MarketingBrief, MarketingContent, ResearchReport
+from src.models.validation_models import ValidationReport
+from src.pipeline import ContentPipeline
+from src.storage.factory import get_storage
+from src.storage.memory_storage import MemoryStorage
+from src.utils.brief_index import BriefIndex
+from src.utils.checkpoints import CheckpointStore
+from src.utils.sqlite_cache import SQLiteCache
+
+from .cassettes import CASSETTE_DIR, Cassette, RecordingLLM, ReplayLLM, cassette_tool
+from .fakes import fake_llm_factory, fake_tool_factory
+from .fixtures import MARKETING_CONTENT, RESEARCH_REPORT, SAMPLE_BRIEF, VALIDATION_REPORT
+
+MODES = ("fake", "record", "replay")
+
+
+@dataclass
+class BenchmarkConfig:
+    llm_mode: str = "fake"
+    search_mode: str = "fake"
+    llm_latency: float = 0.0  # Simulated seconds per fake LLM call
+    search_latency: float = 0.0  # Simulated seconds per fake search
+    iterations: int = 20  # Repetitions of each overhead phase
+    concurrency: list[int] = field(default_factory=lambda: [1, 2, 4, 8])
+    briefs_per_level: int = 8
+    cassette: str = str(CASSETTE_DIR / "sample_brief.json")
+
+
+class Factories:
+    """
+    The llm_factory and tool_factory handed to the crews for one brief,
+    plus every LLM they created so the model time can be read back.
+    """
+
+    def __init__(self, config: BenchmarkConfig, cassette: Cassette | None):
+        self.llms = []
+        self.config = config
+        self.cassette = cassette
+
+    def llm(self, agent_name: str, llm_config: dict):
+        mode = self.config.llm_mode
+        if mode == "fake":
+            llm = fake_llm_factory(self.config.llm_latency)(agent_name, llm_config)
+        elif mode == "record":
+            llm = RecordingLLM(build_llm(agent_name, llm_config), agent_name, self.cassette)
+        else:
+            llm = ReplayLLM(agent_name, self.cassette)
+        self.llms.append(llm)
+        return llm
+
+    def tool(self, tool_path: str):
+        mode = self.config.search_mode
+        if mode == "fake":
+            return fake_tool_factory(self.config.search_latency)(tool_path)
+        return cassette_tool(resolve_object(tool_path), self.cassette, record=mode == "record")
+
+    def model_seconds(self) -> float:
+        return sum(llm.model_seconds for llm in self.llms)
+
+
+class BenchmarkPipeline(ContentPipeline):
+    """
+    The ContentPipeline with the benchmark's factories, quiet crews and its
+    own checkpoints and brief index below `work_dir`. Every run is fresh, so
+    each stage really runs instead of resuming from an earlier brief.
+    """
+
+    def __init__(self, factories: "Factories", work_dir: Path):
+        super().__init__(show_spinner=False, fresh=True, llm_factory=factories.llm, tool_factory=factories.tool)
+        self.checkpoints = CheckpointStore(SQLiteCache(work_dir / "checkpoints.sqlite3"))
+        self.brief_index = BriefIndex(work_dir / "brief_index.sqlite3")
+
+    def build_crew(self, crew_class, task_name: str | None = None):
+        return _quiet(super().build_crew(crew_class, task_name))
+
+
+def _quiet(crew):
+    # Console output would dominate the timings. Building a crew copies its
+    # verbose flag onto crewAI's global console listener, so reset that too.
+    crew.verbose = False
+    for agent in crew.agents:
+        agent.verbose = False
+    event_listener.verbose = False
+    event_listener.formatter.verbose = False
+    return crew
+
+
+def _timed(fn, iterations: int) -> dict:
+    samples = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return {
+        "avg_ms": round(statistics.fmean(samples), 3),
+        "min_ms": round(min(samples), 3),
+        "max_ms": round(max(samples), 3),
+    }
+
+
+def measure_overhead(config: BenchmarkConfig, cassette: Cassette | None) -> dict:
+    """
+    Times the pipeline's own work, without any model calls.
+    """
+    pipeline = ContentPipeline(show_spinner=False)
+    brief = MarketingBrief(**SAMPLE_BRIEF)
+    validation_json = VALIDATION_REPORT.model_dump_json()
+    research_json = RESEARCH_REPORT.model_dump_json()
+    content_json = MARKETING_CONTENT.model_dump_json()
+
+    def crew_construction():
+        factories = Factories(config, cassette)
+        ValidationCrew(factories.llm, factories.tool).create_crew()
+        ContentCrew(factories.llm, factories.tool).create_crew()
+
+    def prompt_rendering():
+        pipeline.build_validation_inputs(brief)
+        pipeline.build_writing_inputs(brief, RESEARCH_REPORT)
+
+    def pydantic_validation():
+        MarketingBrief(**SAMPLE_BRIEF)
+        ValidationReport.model_validate_json(validation_json)
+        ResearchReport.model_validate_json(research_json)
+        MarketingContent.model_validate_json(content_json)
+
+    phases = {
+        "crew_construction": crew_construction,
+        "prompt_rendering": prompt_rendering,
+        "pydantic_validation": pydantic_validation,
+    }
+    return {name: _timed(fn, config.iterations) for name, fn in phases.items()}
+
+
+def run_brief(config: BenchmarkConfig, cassette: Cassette | None, work_dir: Path) -> dict:
+    """
+    Runs the sample brief through the whole ContentPipeline, from validation
+    to publishing, and splits the wall time into model time and pipeline
+    overhead. Each run publishes to a campaign of its own, so no upload is
+    skipped as already published.
+    """
+    factories = Factories(config, cassette)
+    pipeline = BenchmarkPipeline(factories, work_dir)
+    started = time.perf_counter()
+
+    brief = MarketingBrief(**SAMPLE_BRIEF)
+    report = pipeline.run_validation(brief)
+    if report is None:
+        raise RuntimeError("Validation did not return a ValidationReport")
+    if not pipeline.passes_threshold(report):
+        raise RuntimeError(f"The sample brief scored {report.viability_score}, below VALIDATION_THRESHOLD")
+
+    campaign_id = f"benchmark-{uuid.uuid4().hex[:12]}"
+    if pipeline.run_content_generation(brief, report, campaign_id=campaign_id) is None:
+        raise RuntimeError("Content generation failed, see the log for the stage")
+
+    wall = time.perf_counter() - started
+    model = factories.model_seconds()
+    return {
+        "wall_s": round(wall, 4),
+        "model_s": round(model, 4),
+        "overhead_s": round(max(0.0, wall - model), 4),
+        "llm_calls": sum(llm.calls for llm in factories.llms),
+    }
+
+
+def measure_throughput(config: BenchmarkConfig, cassette: Cassette | None, work_dir: Path) -> list[dict]:
+    """
+    Runs `briefs_per_level` briefs at each concurrency level.
+    """
+    levels = []
+    for concurrency in config.concurrency:
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="bench") as pool:
+            runs = list(pool.map(lambda _: run_brief(config, cassette, work_dir), range(config.briefs_per_level)))
+        wall = time.perf_counter() - started
+        levels.append({
+            "concurrency": concurrency,
+            "briefs": len(runs),
+            "wall_s": round(wall, 3),
+            "briefs_per_s": round(len(runs) / wall, 3),
+            "avg_brief_s": round(statistics.fmean(run["wall_s"] for run in runs), 4),
+            "avg_overhead_s": round(statistics.fmean(run["overhead_s"] for run in runs), 4),
+        })
+    return levels
+
+
+def run_benchmarks(config: BenchmarkConfig) -> dict:
+    uses_cassette = "record" in (config.llm_mode, config.search_mode) or "replay" in (
+        config.llm_mode, config.search_mode
+    )
+    cassette = Cassette(config.cassette) if uses_cassette else None
+
+    # Published artifacts must never leave the process
+    storage = get_storage()
+    if not isinstance(storage, MemoryStorage):
+        raise RuntimeError(f"Benchmarks publish to the 'memory' storage backend, not to {storage.location()}")
+
+    with tempfile.TemporaryDirectory(prefix="content-crew-bench-") as work_dir:
+        work_dir = Path(work_dir)
+        # One warm-up brief, so imports and first-use setup do not skew the numbers.
+        # In record mode it is also the run that fills the cassette.
+        warmup = run_brief(config, cassette, work_dir)
+        if cassette is not None and "record" in (config.llm_mode, config.search_mode):
+            cassette.save()
+
+        report = {
+            "config": asdict(config),
+            "overhead": measure_overhead(config, cassette),
+            "single_brief": warmup,
+        }
+        # Recording hits the real services, so throughput is only measured offline
+        if "record" not in (config.llm_mode, config.search_mode):
+            report["single_brief"] = run_brief(config, cassette, work_dir)
+            report["throughput"] = measure_throughput(config, cassette, work_dir)
+    return report
+
+
+def compare(report: dict, baseline: dict, tolerance: float) -> list[str]:
+    """
+    Lists every overhead phase or throughput level that is more than
+    `tolerance` (a fraction) worse than in the baseline report.
+    """
+    regressions = []
+    for phase, timing in report.get("overhead", {}).items():
+        before = baseline.get("overhead", {}).get(phase)
+        if before and timing["avg_ms"] > before["avg_ms"] * (1 + tolerance):
+            regressions.append(f"{phase}: {before['avg_ms']} ms -> {timing['avg_ms']} ms")
+
+    baseline_levels = {level["concurrency"]: level for level in baseline.get("throughput", [])}
+    for level in report.get("throughput", []):
+        before = baseline_levels.get(level["concurrency"])
+        if before and level["briefs_per_s"] < before["briefs_per_s"] * (1 - tolerance):
+            regressions.append(
+                f"throughput @{level['concurrency']}: {before['briefs_per_s']} -> {level['briefs_per_s']} briefs/s"
+            )
+    return regressions
+
+
+def format_report(report: dict) -> str:
+    lines = ["Pipeline overhead (no model calls):"]
+    for phase, timing in report["overhead"].items():
+        lines.append(
+            f"  {phase:<22} avg {timing['avg_ms']:>9.3f} ms   min {timing['min_ms']:>9.3f} ms"
+            f"   max {timing['max_ms']:>9.3f} ms"
+        )
+
+    brief = report["single_brief"]
+    lines.append("")
+    lines.append(
+        f"Single brief: {brief['wall_s']} s wall = {brief['model_s']} s model + "
+        f"{brief['overhead_s']} s overhead ({brief['llm_calls']} LLM calls)"
+    )
+
+    if "throughput" in report:
+        lines.append("")
+        lines.append("Throughput:")
+        for level in report["throughput"]:
+            lines.append(
+                f"  concurrency {level['concurrency']:>3}: {level['briefs_per_s']:>8.3f} briefs/s"
+                f"   avg brief {level['avg_brief_s']} s   avg overhead {level['avg_overhead_s']} s"
+            )
+    return "\n".join(lines)
@@ -0,0 +1,133 @@
+"""
+Import time budget for the CLI entry points.
+
+    python -m benchmarks.import_time
+    python -m benchmarks.import_time --module src.pipeline --budget 300 --package-limit 80
+
+Imports every module in a fresh interpreter under `python -X importtime`,
+adds up the time per top-level package and fails if a package or the whole
+import goes over its limit, or if a package that should only load with its
+stage (crewAI, the Tavily tools, MinIO, the prompts) is imported at all.
+"""
+import argparse
+import os
+import subprocess
+import sys
+from collections import defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+
+PROJECT_DIR = Path(__file__).parent.parent
+
+# Entry points that must start fast, the heavy stages are imported inside them on demand
+DEFAULT_MODULES = ("src.main", "src.pipeline", "src.cli.batch_runner")
+
+# Packages only the stage that uses them may load
+DEFAULT_FORBIDDEN = ("crewai", "crewai_tools", "litellm", "minio", "questionary", "halo")
+
+
+@dataclass
+class ImportProfile:
+    module: str
+    total_ms: float  # Cumulative import time of the module itself
+    packages: dict[str, float]  # Self time per top-level package, in ms
+
+
+def _import_times(statement: str) -> dict[str, tuple[float, float]]:
+    """
+    Runs `statement` under -X importtime and returns the self and cumulative
+    microseconds of every module it imported.
+    """
+    env = dict(os.environ, PYTHONPATH=str(PROJECT_DIR), PYTHONDONTWRITEBYTECODE="1")
+    env.setdefault("CREWAI_DISABLE_TELEMETRY", "true")
+    env.setdefault("OTEL_SDK_DISABLED", "true")
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=PROJECT_DIR, env=env, capture_output=True, text=True,
+    )
+    if process.returncode != 0:
+        raise RuntimeError(f"'{statement}' failed:\n{process.stderr[-2000:]}")
+
+    times = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        if self_us.strip().isdigit():
+            times[name.strip()] = (float(self_us), float(cumulative_us))
+    return times
+
+
+def profile_import(module: str, runs: int = 3) -> ImportProfile:
+    """
+    Imports `module` `runs` times and keeps the fastest time of every module,
+    leaving out what the interpreter imports on its own before any code runs.
+    """
+    startup = set(_import_times("pass"))
+    best: dict[str, tuple[float, float]] = {}
+    for _ in range(runs):
+        for name, (self_us, cumulative_us) in _import_times(f"import {module}").items():
+            if name not in startup and (name not in best or self_us < best[name][0]):
+                best[name] = (self_us, cumulative_us)
+    if module not in best:
+        raise RuntimeError(f"'{module}' was already imported at interpreter startup")
+
+    packages = defaultdict(float)
+    for name, (self_us, _) in best.items():
+        packages[name.split(".")[0]] += self_us / 1000
+    return ImportProfile(module, best[module][1] / 1000, dict(packages))
+
+
+def check_profile(profile: ImportProfile, budget_ms: float, package_limit_ms: float, forbidden) -> list[str]:
+    problems = []
+    if profile.total_ms > budget_ms:
+        problems.append(f"{profile.module} takes {profile.total_ms:.0f}ms to import, over the {budget_ms:.0f}ms budget")
+    for package, ms in sorted(profile.packages.items(), key=lambda item: -item[1]):
+        if package in forbidden:
+            problems.append(f"{profile.module} imports '{package}' ({ms:.0f}ms), which should load with its stage")
+        elif ms > package_limit_ms:
+            problems.append(f"{profile.module} spends {ms:.0f}ms in '{package}', over the {package_limit_ms:.0f}ms limit")
+    return problems
+
+
+def format_profile(profile: ImportProfile, top: int = 8) -> str:
+    lines = [f"{profile.module}: {profile.total_ms:.0f}ms"]
+    for package, ms in sorted(profile.packages.items(), key=lambda item: -item[1])[:top]:
+        lines.append(f"  {package:<24}{ms:>8.1f}ms")
+    return "\n".join(lines)
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Content Crew import time budget")
+    parser.add_argument("--module", action="append", dest="modules",
+                        help=f"Module to import, can be repeated (default: {', '.join(DEFAULT_MODULES)}).")
+    parser.add_argument("--budget", type=float, default=500.0,
+                        help="Allowed cumulative import time per module in ms (default: 500).")
+    parser.add_argument("--package-limit", type=float, default=150.0,
+                        help="Allowed import time of any single top-level package in ms (default: 150).")
+    parser.add_argument("--forbid", action="append",
+                        help=f"Package that must not be imported, can be repeated (default: {', '.join(DEFAULT_FORBIDDEN)}).")
+    parser.add_argument("--runs", type=int, default=3, help="Imports per module, the fastest counts.")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    forbidden = set(args.forbid or DEFAULT_FORBIDDEN)
+    problems = []
+    for module in args.modules or DEFAULT_MODULES:
+        profile = profile_import(module, args.runs)
+        print(format_profile(profile))
+        problems += check_profile(profile, args.budget, args.package_limit, forbidden)
+
+    if problems:
+        print("\nOver the import time budget:")
+        for problem in problems:
+            print(f"  {problem}")
+        return 1
+    print("\nAll modules are within the import time budget.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,138 @@
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+import yaml
+
+from ..config.logger import logger, run_context
+from ..config.settings import settings
+from ..models.content_models import MarketingBrief
+from ..pipeline import ContentPipeline
+from ..publisher import campaign_id_for
+from ..utils.latency import model_latency
+from ..utils.prompt_inputs import template_tokens
+from ..utils.output_repair import output_repairs
+from ..utils.rate_limiter import rate_limit_stats
+
+
+def load_brief_records(path: str | Path) -> list[dict]:
+    """
+    Loads raw brief records from a JSONL file (one brief per line) or a YAML
+    file containing either a list of briefs or a mapping with a 'briefs' list.
+    """
+    path = Path(path)
+    text = path.read_text(encoding="utf-8")
+
+    if path.suffix.lower() in (".yaml", ".yml"):
+        data = yaml.safe_load(text) or []
+        if isinstance(data, dict):
+            data = data.get("briefs", [data])
+        return list(data)
+
+    records = []
+    for line_number, line in enumerate(text.splitlines(), start=1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        try:
+            records.append(json.loads(line))
+        except json.JSONDecodeError as e:
+            raise ValueError(f"{path}:{line_number} is not valid JSON: {e}") from e
+    return records
+
+
+class BatchRunner:
+    """
+    Runs many marketing briefs without any interactive prompts.
+
+    Each brief goes through validation and, when its viability score passes
+    VALIDATION_THRESHOLD, content generation. Up to `concurrency` briefs run
+    at the same time and each result is appended to the output JSONL file as
+    soon as its brief finishes.
+    """
+
+    def __init__(
+        self, input_path: str | Path, output_path: str | Path, concurrency: int | None = None, fresh: bool = False
+    ):
+        self.input_path = Path(input_path)
+        self.output_path = Path(output_path)
+        self.concurrency = max(1, concurrency or settings.BATCH_CONCURRENCY)
+        self.logger = logger
+        self.pipeline = ContentPipeline(show_spinner=False, fresh=fresh)
+
+    def run(self) -> dict:
+        """
+        Processes every brief in the input file and returns a status summary.
+        """
+        records = load_brief_records(self.input_path)
+        self.logger.info(
+            f"Running {len(records)} briefs from '{self.input_path}' with concurrency {self.concurrency}..."
+        )
+
+        summary: dict[str, int] = {}
+        self.output_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.output_path, "a", encoding="utf-8") as output, \
+                ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="brief") as pool:
+            futures = [pool.submit(self._process, index, record) for index, record in enumerate(records)]
+            for future in as_completed(futures):
+                result = future.result()
+                self._write_result(output, result)
+                summary[result["status"]] = summary.get(result["status"], 0) + 1
+
+        self.logger.info(f"Batch finished. Results written to '{self.output_path}': {summary}")
+        self.logger.info(f"Template token stats (task and agent text only): {template_tokens.stats()}")
+        self.logger.info(f"Rate limit stats: {rate_limit_stats()}")
+        self.logger.info(f"Model latency stats: {model_latency.stats()}")
+        self.logger.info(f"Output repair stats: {output_repairs.stats()}")
+        return summary
+
+    def _process(self, index: int, record: dict) -> dict:
+        # Every brief gets its own run id, so its log records can be told apart from the others'
+        with run_context() as run_id:
+            return self._process_brief(index, record, run_id)
+
+    def _process_brief(self, index: int, record: dict, run_id: str) -> dict:
+        started = time.perf_counter()
+        result = {"index": index, "run_id": run_id, "product_name": record.get("product_name")}
+
+        try:
+            brief = MarketingBrief(**record)
+        except Exception as e:
+            return self._finish(result, started, status="invalid_brief", error=str(e))
+
+        try:
+            report = self.pipeline.run_validation(brief)
+            if report is None:
+                return self._finish(result, started, status="validation_failed")
+
+            result["validation_report"] = report.model_dump()
+            if not self.pipeline.passes_threshold(report):
+                return self._finish(result, started, status="below_threshold")
+
+            content = self.pipeline.run_content_generation(brief, report)
+            if content is None:
+                return self._finish(result, started, status="content_failed")
+
+            result["campaign_id"] = campaign_id_for(brief)
+            result["content"] = content.model_dump()
+            return self._finish(result, started, status="completed")
+
+        except Exception as e:
+            self.logger.error(f"Brief #{index} ('{brief.product_name}') failed: {e}", exc_info=True)
+            return self._finish(result, started, status="error", error=str(e))
+
+    @staticmethod
+    def _finish(result: dict, started: float, status: str, error: str | None = None) -> dict:
+        result["status"] = status
+        if error:
+            result["error"] = error
+        result["duration_seconds"] = round(time.perf_counter() - started, 2)
+        return result
+
+    def _write_result(self, output, result: dict):
+        output.write(json.dumps(result, ensure_ascii=False, default=str) + "\n")
+        output.flush()
+        self.logger.info(
+            f"Brief #{result['index']} ('{result.get('product_name')}') finished: {result['status']}"
+        )
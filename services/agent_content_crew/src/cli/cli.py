@@ -1,12 +1,17 @@
 import questionary
 
 from ..cli.brief_collector import collect_brief
-from ..config.logger import logger
+from ..config.logger import flush_logs, logger, run_context
 from ..config.settings import settings
-from ..models.content_models import MarketingBrief
+from ..models.content_models import MarketingBrief, ResearchReport
 from ..models.validation_models import ValidationReport
-from ..crew import ValidationCrew, ContentCrew
-from ..utils.crew_runner import run_crew
+from ..pipeline import ContentPipeline, run_research_stage
+from ..publisher import campaign_id_for, campaign_prefix
+from ..utils.latency import model_latency
+from ..utils.prompt_inputs import template_tokens
+from ..utils.output_repair import output_repairs
+from ..utils.rate_limiter import rate_limit_stats
+from ..utils.speculative import SpeculativeTask
 
 
 class CLI:
@@ -15,9 +20,10 @@ class CLI:
     for the ContentCrew service through CLI
     """
 
-    def __init__(self):
+    def __init__(self, fresh: bool = False):
         self.settings = settings
         self.logger = logger
+        self.pipeline = ContentPipeline(fresh=fresh)
 
     @staticmethod
     def _print(message: str = "", **kwargs):
@@ -26,27 +32,41 @@ class CLI:
 
     def _run(self):
         """
-        Runs the main application loop.
+        Runs the main application loop. Every brief gets its own run id in the logs.
         """
         while True:
-            brief = self._collect_and_validate_brief()
-            if brief is None:  # User cancelled
-                break
+            with run_context():
+                if not self._run_brief():
+                    break
 
-            validation_result = self._run_validation(brief)
-            if validation_result is None:  # Validation failed
-                continue
+    def _run_brief(self) -> bool:
+        """
+        Takes one brief from collection to published content.
+        Returns False once the user wants to stop.
+        """
+        brief = self._collect_and_validate_brief()
+        if brief is None:  # User cancelled
+            return False
 
-            proceed = self._confirm_with_user(validation_result)
-            if not proceed:  # User rejected or wants to restart
-                continue
+        validation_result = self._run_validation(brief)
+        if validation_result is None:  # Validation failed
+            return True
 
-            content_result = self._run_content_generation(brief, validation_result)
-            if content_result:
-                self._log_final_result(content_result)
+        speculative_research = self._start_speculative_research(brief, validation_result)
 
-            if not self._ask_to_run_again():
-                break
+        proceed = self._confirm_with_user(brief, validation_result)
+        if not proceed:  # User rejected or wants to restart
+            if speculative_research is not None:
+                speculative_research.cancel()
+                self.logger.info("Speculative research cancelled.")
+            return True
+
+        research = self._collect_speculative_research(speculative_research)
+        content_result = self._run_content_generation(brief, validation_result, research)
+        if content_result:
+            self._log_final_result(brief, content_result)
+
+        return self._ask_to_run_again()
 
     def _collect_and_validate_brief(self) -> MarketingBrief | None:
         """
@@ -54,6 +74,7 @@ class CLI:
         Returns a valid MarketingBrief object or None if user cancels.
         """
         try:
+            flush_logs()
             brief_data = collect_brief()
             return MarketingBrief(**brief_data)
         except KeyboardInterrupt:
@@ -65,36 +86,48 @@ class CLI:
 
     def _run_validation(self, brief: MarketingBrief) -> ValidationReport | None:
         """
-        Runs the ValidationCrew.
+        Runs the ValidationCrew, or reuses the report of a near-duplicate brief if the user agrees.
         Returns a ValidationReport or None if it fails.
         """
-        validation_inputs = {
-            **brief.dict(),
-            'validator_model_provider': self.settings.VALIDATOR_LLM_PROVIDER,
-            'validator_model_name': self.settings.VALIDATOR_LLM_MODEL,
-        }
-
-        validation_crew = ValidationCrew().create_crew()
-        result = run_crew(
-            validation_crew,
-            validation_inputs,
-            f"🚀 Running Market Validation for '{brief.product_name}'...",
-            "Validation Complete!",
-            "Validation Failed"
-        )
-
-        if result is None or not isinstance(result, ValidationReport):
-            self.logger.error("Validation failed to return a valid report. Please try again.")
+        if self.settings.VALIDATION_REUSE == "offer":
+            report = self._offer_similar_validation(brief)
+            if report is not None:
+                return report
+
+        report = self.pipeline.run_validation(brief)
+        if report is None:
+            self.logger.error("Please try again.")
+        return report
+
+    def _offer_similar_validation(self, brief: MarketingBrief) -> ValidationReport | None:
+        """
+        Offers the report of an earlier, near-duplicate brief.
+        Returns it if the user accepts, otherwise None.
+        """
+        match = self.pipeline.find_similar_validation(brief)
+        if match is None:
+            return None
+
+        try:
+            flush_logs()
+            reuse = questionary.confirm(
+                f"'{match.product_name}' was validated {match.age_hours:.1f} hours ago and is "
+                f"{match.similarity:.0%} similar. Reuse its validation report instead of running a new one?"
+            ).unsafe_ask()
+        except KeyboardInterrupt:
             return None
 
-        return result
+        if reuse:
+            self.logger.info(f"♻️ Reusing the validation of '{match.product_name}'.")
+            return match.report
+        return None
 
-    def _confirm_with_user(self, report: ValidationReport) -> bool:
+    def _confirm_with_user(self, brief: MarketingBrief, report: ValidationReport) -> bool:
         """
         Shows the validation report and asks the user for confirmation to proceed.
         Returns True to proceed, False to restart.
         """
-        self.logger.info(f"--- Validation Report for: {report.product_name} ---")
+        self.logger.info(f"--- Validation Report for: {brief.product_name} ---")
         self.logger.info(f"  Market Demand: {report.market_demand}")
         self.logger.info(f"  Competitor Density: {report.competitor_density}")
         self.logger.info(f"  Monetization Potential: {report.monetization_potential}")
@@ -103,7 +136,8 @@ class CLI:
         self.logger.info("--------------------------------------------------")
 
         try:
-            if report.viability_score < self.settings.VALIDATION_THRESHOLD:
+            flush_logs()
+            if not self.pipeline.passes_threshold(report):
                 self.logger.warning(
                     f"Idea scored {report.viability_score}, which is below the threshold of {self.settings.VALIDATION_THRESHOLD}.")
                 proceed = questionary.confirm(
@@ -126,36 +160,61 @@ class CLI:
             self.logger.info("\nUser aborted. Exiting.")
             return False
 
-    def _run_content_generation(self, brief: MarketingBrief, report: ValidationReport):
-        """
-        Runs the ContentCrew.
-        """
-        content_inputs = {
-            **brief.dict(),
-            'validation_report': report.dict(),
-            'bucket_name': self.settings.MINIO_BUCKET_NAME,
-            'researcher_model_provider': self.settings.RESEARCHER_LLM_PROVIDER,
-            'researcher_model_name': self.settings.RESEARCHER_LLM_MODEL,
-            'copywriter_model_provider': self.settings.COPYWRITER_LLM_PROVIDER,
-            'copywriter_model_name': self.settings.COPYWRITER_LLM_MODEL,
-            'editor_model_provider': self.settings.EDITOR_LLM_PROVIDER,
-            'editor_model_name': self.settings.EDITOR_LLM_MODEL,
-        }
-
-        content_crew = ContentCrew().create_crew()
-        return run_crew(
-            content_crew,
-            content_inputs,
-            "✍️ Running Content Generation (This may take a few minutes)...",
-            "Content Generation Complete!",
-            "Content Generation Failed"
-        )
-
-    def _log_final_result(self, content_result):
+    def _start_speculative_research(self, brief: MarketingBrief, report: ValidationReport) -> SpeculativeTask | None:
+        """
+        Starts research in the background while the user reviews a passing
+        validation report. Returns None when speculation is off or the score is too low.
+        """
+        if not self.settings.SPECULATIVE_RESEARCH or not self.pipeline.passes_threshold(report):
+            return None
+
+        self.logger.info("Starting market research in the background while you review the report...")
+        return SpeculativeTask(run_research_stage, brief.model_dump(), report.model_dump(), self.pipeline.fresh)
+
+    def _collect_speculative_research(self, task: SpeculativeTask | None) -> ResearchReport | None:
+        """
+        Waits for the speculative research and returns its report.
+        Returns None if there was none or it failed, so research runs again in the foreground.
+        """
+        if task is None:
+            return None
+
+        self.logger.info("Waiting for background research to finish...")
+        try:
+            research_data = task.result()
+        except Exception as e:
+            self.logger.warning(f"Background research failed ({e}). Running it again.")
+            return None
+
+        if research_data is None:
+            self.logger.warning("Background research returned no report. Running it again.")
+            return None
+
+        self.logger.info("Background research complete!")
+        return ResearchReport(**research_data)
+
+    def _run_content_generation(
+        self,
+        brief: MarketingBrief,
+        report: ValidationReport,
+        research: ResearchReport | None = None,
+    ):
+        """
+        Runs research (unless it is already done), writing and editing.
+        """
+        return self.pipeline.run_content_generation(brief, report, research)
+
+    def _log_final_result(self, brief: MarketingBrief, content_result):
         self.logger.info("\n--- Content Crew Finished ---")
-        self.logger.SHOW_FINAL_RESULT = True
-        self.logger.info(f"Final Result:\n{content_result}")
-        self.logger.info("--- Check your MinIO bucket for the output ---")
+        self.logger.info(f"Final Result:\n{content_result.model_dump_json(indent=2)}", extra={"raw": True})
+        self.logger.info(f"--- Check '{campaign_prefix(campaign_id_for(brief))}' in your MinIO bucket for the output ---")
+        if self.settings.SEARCH_CACHE_ENABLED:
+            from ..tools.search_tools import search_cache
+            self.logger.info(f"Search cache stats: {search_cache.stats()}")
+        self.logger.info(f"Template token stats (task and agent text only): {template_tokens.stats()}")
+        self.logger.info(f"Rate limit stats: {rate_limit_stats()}")
+        self.logger.info(f"Model latency stats: {model_latency.stats()}")
+        self.logger.info(f"Output repair stats: {output_repairs.stats()}")
 
     def _ask_to_run_again(self) -> bool:
         """
@@ -163,6 +222,7 @@ class CLI:
         Returns True to continue, False to exit.
         """
         try:
+            flush_logs()
             run_again = questionary.confirm("Do you want to run a new idea brief?").unsafe_ask()
             if not run_again:
                 self.logger.info("Goodbye!")
@@ -175,9 +235,9 @@ class CLI:
             return False
 
     @classmethod
-    def run(cls):
+    def run(cls, fresh: bool = False):
         try:
-            cli = cls()
+            cli = cls(fresh)
             cli._run()
         except Exception as e:
             cls._print(str(e))
\ No newline at end of file
@@ -1,15 +1,66 @@
+import atexit
+import contextvars
+import copy
+import json
 import logging
+import queue
 import sys
-import types
+import threading
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, timezone
 
 from logging import Formatter, StreamHandler, getLogger
+from logging.handlers import QueueHandler, QueueListener
 
-log_format = "[%(asctime)s] - [%(name)s] - [%(levelname)s] - %(message)s"
+log_format = "[%(asctime)s] - [%(name)s] - [%(levelname)s] - %(run_tag)s%(message)s"
 date_format = "%Y-%m-%d %H:%M:%S"
 
+# The brief or job a record belongs to, so interleaved runs can be told apart
+_run_id: contextvars.ContextVar[str | None] = contextvars.ContextVar("run_id", default=None)
+
+# Attributes every LogRecord has, anything else was passed through `extra`
+_RECORD_ATTRIBUTES = set(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "run_id", "run_tag", "raw"}
+
+
+def new_run_id() -> str:
+    return uuid.uuid4().hex[:12]
+
+
+def get_run_id() -> str | None:
+    return _run_id.get()
+
+
+@contextmanager
+def run_context(run_id: str | None = None):
+    """
+    Tags every record logged inside the block, in this thread and in the
+    threads started through propagate_context(), with `run_id` (or a new one).
+    """
+    run_id = run_id or new_run_id()
+    token = _run_id.set(run_id)
+    try:
+        yield run_id
+    finally:
+        _run_id.reset(token)
+
+
+def propagate_context(fn):
+    """
+    Wraps `fn` so that it runs with the caller's run id when a thread pool
+    or a new thread calls it. Every call gets its own copy of the context.
+    """
+    context = contextvars.copy_context()
+
+    def run(*args, **kwargs):
+        return context.copy().run(fn, *args, **kwargs)
+
+    return run
+
+
 class CustomFormatter(Formatter):
     """Custom formatter to add colors to log levels."""
-    
+
     grey = "\x1b[38;20m"
     yellow = "\x1b[33;20m"
     red = "\x1b[31;20m"
@@ -24,29 +75,100 @@ class CustomFormatter(Formatter):
         logging.CRITICAL: bold_red + log_format + reset
     }
 
+    def __init__(self):
+        super().__init__(log_format, date_format)
+        self._formatters = {level: Formatter(fmt, date_format) for level, fmt in self.FORMATS.items()}
+
+    def format(self, record):
+        # Records marked raw, like the final result, are printed as they are
+        if getattr(record, "raw", False):
+            return record.getMessage()
+        run_id = getattr(record, "run_id", None)
+        record.run_tag = f"[{run_id}] " if run_id else ""
+        return self._formatters.get(record.levelno, self).format(record)
+
+
+class JsonFormatter(Formatter):
+    """
+    One JSON object per line, with the run id and any `extra` fields.
+    """
+
     def format(self, record):
-        log_fmt = self.FORMATS.get(record.levelno, log_format)
-        formatter = Formatter(log_fmt, date_format)
-        return formatter.format(record)
-    
+        entry = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "run_id": getattr(record, "run_id", None),
+            "message": record.getMessage(),
+            "thread": record.threadName,
+        }
+        entry.update({key: value for key, value in vars(record).items() if key not in _RECORD_ATTRIBUTES})
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class RunContextHandler(QueueHandler):
+    """
+    Hands records to the background writer. Only the message is rendered
+    on the calling thread, formatting and writing happen on the listener's.
+    """
+
+    def prepare(self, record):
+        record = copy.copy(record)
+        record.run_id = _run_id.get()
+        record.message = record.getMessage()
+        if record.exc_info:
+            record.exc_text = Formatter().formatException(record.exc_info)
+        record.msg, record.args, record.exc_info = record.message, None, None
+        return record
+
+
+class FlushableQueueListener(QueueListener):
+    """
+    A QueueListener that can be asked to confirm when it has caught up.
+    """
+
+    def handle(self, record):
+        if isinstance(record, threading.Event):
+            record.set()
+            return
+        super().handle(record)
+
+
 console_handler = StreamHandler(sys.stdout)
 console_handler.setFormatter(CustomFormatter())
 
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_listener = FlushableQueueListener(_log_queue, console_handler, respect_handler_level=True)
+
 logger = getLogger("agent.content_crew")
 logger.setLevel(logging.INFO)
 
-def custom_info(self, msg, *args, **kwargs):
-    if getattr(self, 'SHOW_FINAL_RESULT', False):
-        # If this flag is set, just print the raw message
-        print(msg)
-        self.SHOW_FINAL_RESULT = False
-    else:
-        # Otherwise, use the standard log method
-        super(type(self), self).info(msg, *args, **kwargs)
-
-logger.info = types.MethodType(custom_info, logger)
-
 # Add the handler to the logger
 if not logger.hasHandlers():
-    logger.addHandler(console_handler)
-    logger.propagate = False # Prevent logs from bubbling up to the root logger
\ No newline at end of file
+    logger.addHandler(RunContextHandler(_log_queue))
+    logger.propagate = False # Prevent logs from bubbling up to the root logger
+    _listener.start()
+    # Stopping the listener writes out whatever is still queued
+    atexit.register(_listener.stop)
+
+
+def flush_logs(timeout: float = 2.0):
+    """
+    Waits until every record logged so far has been written, e.g. before an
+    interactive prompt that must not be drawn over.
+    """
+    written = threading.Event()
+    _log_queue.put(written)
+    written.wait(timeout)
+
+
+def configure_logging(log_format: str = "text", level: str | int = logging.INFO):
+    """
+    Switches the console output between the colored text format and JSON lines.
+    """
+    console_handler.setFormatter(JsonFormatter() if log_format == "json" else CustomFormatter())
+    logger.setLevel(level)
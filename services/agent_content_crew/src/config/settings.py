@@ -1,12 +1,26 @@
-from pydantic import SecretStr
+from pydantic import SecretStr, field_validator
 from pathlib import Path
+from typing import Literal
+import os
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
-from .logger import logger
+from .logger import configure_logging, logger
 
 
 env_path = Path(__file__).parent.parent.parent
 
+# API key each LLM provider needs, and the environment variable CrewAI reads it from
+PROVIDER_API_KEYS = {
+    "google": "GEMINI_API_KEY",
+    "gemini": "GEMINI_API_KEY",
+    "openai": "OPENAI_API_KEY",
+}
+
+
+class SettingsError(ValueError):
+    """Raised when the settings a stage needs are missing or invalid."""
+
+
 class Settings(BaseSettings):
     """
     Pydantic settings class to load environment variables from a .env file.
@@ -15,38 +29,164 @@ class Settings(BaseSettings):
     # Model config to load from .env file
     # It automatically finds the .env file in the current directory.
     model_config = SettingsConfigDict(
-        env_file=env_path, 
+        env_file=env_path / ".env",
         env_file_encoding='utf-8',
         extra='ignore'
     )
 
+    # Credentials are only checked by the stage that uses them, see require()
     OPENAI_API_KEY: SecretStr | None = None
-    GEMINI_API_KEY: SecretStr
-    TAVILY_API_KEY: SecretStr
+    GEMINI_API_KEY: SecretStr | None = None
+    TAVILY_API_KEY: SecretStr | None = None
     
-    # Per agent LLM Configuration
+    # Per agent LLM Configuration. Fallback models are 'provider/model_id' entries, tried
+    # in order when the models before them are slow or fail
     VALIDATOR_MODEL_PROVIDER: str = "google"
-    VALIDATOR_MODEL_id: str = "gemini-2.0-flash"
+    VALIDATOR_MODEL_ID: str = "gemini-2.0-flash"
+    VALIDATOR_FALLBACK_MODELS: list[str] = []
 
     RESEARCHER_MODEL_PROVIDER: str = "google"
     RESEARCHER_MODEL_ID: str = "gemini-2.0-flash"
+    RESEARCHER_FALLBACK_MODELS: list[str] = []
     
     COPYWRITER_MODEL_PROVIDER: str = "google"
     COPYWRITER_MODEL_ID: str = "gemini-2.0-flash"
+    COPYWRITER_FALLBACK_MODELS: list[str] = []
     
     EDITOR_MODEL_PROVIDER: str = "google"
     EDITOR_MODEL_ID: str = "gemini-2.0-flash"
+    EDITOR_FALLBACK_MODELS: list[str] = []
 
     # MinIO Configuration
-    MINIO_ENDPOINT: str
-    MINIO_ACCESS_KEY: str
-    MINIO_SECRET_KEY: SecretStr
-    MINIO_BUCKET_NAME: str
+    MINIO_ENDPOINT: str | None = None
+    MINIO_ACCESS_KEY: str | None = None
+    MINIO_SECRET_KEY: SecretStr | None = None
+    MINIO_BUCKET_NAME: str | None = None
+    MINIO_SECURE: bool = False  # Set to True if using HTTPS
+    MINIO_POOL_MAXSIZE: int = 10  # Keep-alive connections shared by all uploads
+    MINIO_TIMEOUT_SECONDS: int = 300
+    MINIO_UPLOAD_MAX_WORKERS: int = 4  # Concurrent transfers per batch upload
+    MINIO_CAMPAIGN_PREFIX: str = "campaigns"  # Artifacts go under '<prefix>/<campaign_id>/'
+
+    # Where artifacts are stored: 'minio', 'local' (files below STORAGE_LOCAL_DIR) or 'memory'
+    STORAGE_BACKEND: Literal["minio", "local", "memory"] = "minio"
+    STORAGE_LOCAL_DIR: Path = env_path / ".data" / "storage"
+
+    # Logging: 'text' is colored console output, 'json' one object per line with the run id of every record
+    LOG_FORMAT: Literal["text", "json"] = "text"
+    LOG_LEVEL: str = "INFO"
+    CREW_OUTPUT_MAX_PER_SECOND: float = 5.0  # Verbose crew output blocks shown per second, the rest is skipped
 
     VALIDATION_THRESHOLD: int = 50  # Minimum viability score to pass validation
+
+    # Repair malformed structured output locally (code fences, trailing commas, overlong lists,
+    # out of range scores) before CrewAI re-prompts the LLM to convert it
+    OUTPUT_REPAIR_ENABLED: bool = True
+
+    # Headless batch mode
+    BATCH_CONCURRENCY: int = 4  # Briefs processed at the same time
+
+    # HTTP job server
+    SERVER_HOST: str = "0.0.0.0"
+    SERVER_PORT: int = 8000
+    JOB_WORKERS: int = 2  # Worker processes, each runs one brief at a time
+    JOB_QUEUE_SIZE: int = 20  # Waiting jobs before new ones are refused with 429
+    JOB_HISTORY_SIZE: int = 1000  # Finished jobs kept for status and event lookups
+
+    # Start research in the background while the user reviews a passing validation report
+    SPECULATIVE_RESEARCH: bool = False
+
+    # 'sequential' runs research as one agent loop, 'parallel' runs one sub-task per report section
+    RESEARCH_MODE: Literal["sequential", "parallel"] = "sequential"
+
+    # 'sequential' writes all content in one generation, 'parallel' writes blog post and landing page concurrently
+    WRITING_MODE: Literal["sequential", "parallel"] = "sequential"
+
+    # Per-stage spans for crews, agents, tasks, LLM and tool calls, exported when the app exits
+    TRACING_ENABLED: bool = False
+    TRACE_DIR: Path = env_path / "traces"
+
+    # Directory for the persistent local caches
+    CACHE_DIR: Path = env_path / ".cache"
+
+    # Process-wide rate limits, shared by every agent and crew using the same provider and model
+    LLM_REQUESTS_PER_MINUTE: int = 60
+    LLM_RATE_LIMITS: dict[str, int] = {}  # Per 'provider/model_id', e.g. {"google/gemini-2.0-flash": 15}
+    TAVILY_REQUESTS_PER_MINUTE: int = 100
+    RATE_LIMIT_BURST: int = 5  # Requests allowed back to back before the rate applies
+    RATE_LIMIT_MAX_RETRIES: int = 5  # Retries of a rate limited call
+    RATE_LIMIT_BACKOFF_BASE_SECONDS: float = 1.0
+    RATE_LIMIT_BACKOFF_MAX_SECONDS: float = 60.0
+
+    # Hedged LLM calls: a call still running after its model's latency percentile is raced
+    # against the agent's next fallback model, and the first valid response wins
+    LLM_HEDGE_PERCENTILE: float = 95.0
+    LLM_LATENCY_SLO_SECONDS: float = 30.0  # Hedge delay until a model has enough history, and its upper bound
+    LLM_HEDGE_MIN_SECONDS: float = 2.0  # Never hedge sooner than this
+    LLM_LATENCY_MIN_SAMPLES: int = 20  # Calls of a model needed before its own percentile is used
+    LLM_LATENCY_WINDOW: int = 200  # Latest calls per model the percentiles are computed over
+
+    # Persistent cache for Tavily web searches
+    SEARCH_CACHE_ENABLED: bool = True
+    SEARCH_CACHE_TTL_SECONDS: int = 24 * 60 * 60
+    SEARCH_CACHE_MAX_ENTRIES: int = 5000
+
+    # Opt-in LLM response cache, only the listed tasks are served from it
+    LLM_CACHE_ENABLED: bool = False
+    LLM_CACHE_TASKS: list[str] = ["validation_task", "research_task"]
+    LLM_CACHE_MAX_BYTES: int = 256 * 1024 * 1024
+    LLM_CACHE_TTL_SECONDS: int = 0  # 0 keeps entries until they are evicted
+
+    # Saved output of every pipeline stage, so a failed run resumes from the first unfinished stage. Writing and
+    # editing checkpoints are dropped once the content is published, --fresh (or ?fresh=true) skips them all
+    CHECKPOINTS_ENABLED: bool = True
+    CHECKPOINT_TTL_SECONDS: int = 7 * 24 * 60 * 60
+
+    # Reuse of validation reports from near-duplicate briefs: 'off', 'offer' (the CLI asks first) or 'auto'
+    VALIDATION_REUSE: Literal["off", "offer", "auto"] = "offer"
+    VALIDATION_REUSE_MIN_SIMILARITY: float = 0.8  # Estimated Jaccard similarity of the identifying fields
+    VALIDATION_REUSE_MAX_AGE_HOURS: int = 7 * 24
+
+    @field_validator("STORAGE_LOCAL_DIR", "TRACE_DIR", "CACHE_DIR")
+    @classmethod
+    def resolve_directory(cls, path: Path) -> Path:
+        # Relative directories from .env are below the service directory, like the defaults,
+        # not below wherever the process was started
+        return path if path.is_absolute() else env_path / path
+
+    def require(self, *names: str, purpose: str):
+        """
+        Raises a SettingsError listing every one of `names` that is not set.
+        Called by each stage for the settings it needs, so e.g. validation
+        runs without MinIO credentials.
+        """
+        missing = [name for name in names if not getattr(self, name)]
+        if missing:
+            raise SettingsError(
+                f"{purpose} needs {', '.join(missing)}. "
+                "Please set them in the .env file in 'services/agent_content_crew'."
+            )
+
+    def export_api_key(self, name: str, purpose: str):
+        """
+        Requires the API key `name` and puts it into the environment, where
+        CrewAI and the Tavily client look it up.
+        """
+        self.require(name, purpose=purpose)
+        os.environ[name] = getattr(self, name).get_secret_value()
+
+    def export_provider_key(self, provider: str):
+        """
+        Exports the API key of an LLM provider. Providers without a known key are left alone.
+        """
+        if name := PROVIDER_API_KEYS.get(provider):
+            self.export_api_key(name, purpose=f"The '{provider}' LLM provider")
+
 try:
     settings = Settings()
 except Exception as e:
     logger.error(f"Error loading settings: {e}")
     logger.error("Please ensure your .env file is correctly set up in 'services/agent_content_crew'.")
-    exit(1)
\ No newline at end of file
+    raise SettingsError(f"Invalid settings: {e}") from e
+
+configure_logging(settings.LOG_FORMAT, settings.LOG_LEVEL)
@@ -1,94 +1,375 @@
-import os
-from crewai import Crew, Process
-from crewai.project import CrewBase, crew, agent, task
+import importlib
+import importlib.util
+import json
+import threading
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Callable, Mapping
+
+import yaml
+from pydantic import BaseModel
 
 from .config.settings import settings
+from .utils.rate_limiter import llm_bucket
+
+# CrewAI takes seconds to import, so it is only loaded once the first crew is built
+if TYPE_CHECKING:
+    from crewai import Agent, Crew, Task
+    from .llm.rate_limited_llm import RateLimitedLLM
+    from .llm.routed_llm import RoutedLLM
+    from .llm.usage_scoped_llm import UsageScopedLLM
+
+CONFIG_DIR = Path(__file__).parent / "config"
 
-os.environ["TAVILY_API_KEY"] = settings.TAVILY_API_KEY.get_secret_value()
+# Provider names used in the settings, mapped to CrewAI's model prefixes
+LLM_PROVIDER_PREFIXES = {
+    "google": "gemini",
+    "gemini": "gemini",
+    "openai": "openai",
+}
 
-if settings.GEMINI_API_KEY:
-    os.environ["GEMINI_API_KEY"] = settings.GEMINI_API_KEY.get_secret_value()
 
-if settings.OPENAI_API_KEY:
-    os.environ["OPENAI_API_KEY"] = settings.OPENAI_API_KEY.get_secret_value()
+def load_config(name: str, config_dir: Path = CONFIG_DIR) -> dict:
+    with open(config_dir / name, encoding="utf-8") as f:
+        return yaml.safe_load(f) or {}
 
 
-class ValidationCrew:
+def resolve_object(path: str) -> Any:
     """
-    The Market Validation Crew.
-    This crew takes the initial brief and returns a validation report.
+    Imports an object from a dotted path like 'src.tools.search_tools.tavily_tool'.
+    """
+    module_name, _, attribute = path.rpartition(".")
+    return getattr(importlib.import_module(module_name), attribute)
+
+
+def check_object_path(path: str):
+    """
+    Checks that the module of a dotted path exists without importing it.
+    Raises ImportError if it does not, ValueError if the path is malformed.
     """
-    agents_config = "config/agents.yaml"
-    tasks_config = "config/tasks.yaml"
+    module_name, _, attribute = path.rpartition(".")
+    if not module_name or not attribute:
+        raise ValueError("expected a dotted path like 'package.module.name'")
+    if importlib.util.find_spec(module_name) is None:
+        raise ImportError(f"No module named '{module_name}'")
 
-    # Define the agents and tasks this crew uses
-    @agent
-    def validator(self):
-        from crewai.agent import Agent  # Local import
-        return Agent(config=self.agents_config['validator'])
 
-    @task
-    def validation_task(self):
-        from crewai.task import Task  # Local import
-        return Task(config=self.tasks_config['validation_task'])
+@lru_cache(maxsize=None)
+def _prepare_crewai():
+    """
+    Runs the one-time CrewAI setup the first time a crew is built.
+    """
+    from .utils.crew_output import sample_crew_output
+
+    # Verbose crew output is sampled, and in JSON log mode it goes into the log records
+    sample_crew_output(settings.CREW_OUTPUT_MAX_PER_SECOND, as_log_records=settings.LOG_FORMAT == "json")
+
+
+# Shared LLM stacks per agent, model list and llm_config, see build_llm()
+_llm_stacks: dict[tuple, "RoutedLLM"] = {}
+_llm_stacks_lock = threading.Lock()
+
+
+def build_model(provider: str, model_id: str, llm_config: dict) -> "RateLimitedLLM":
+    from crewai import LLM
+    from .llm.rate_limited_llm import RateLimitedLLM
+    from .llm.usage_scoped_llm import report_usage_to_scope
+
+    settings.export_provider_key(provider)
+    prefix = LLM_PROVIDER_PREFIXES.get(provider, provider)
+    llm = report_usage_to_scope(LLM(model=f"{prefix}/{model_id}", **llm_config))
+    return RateLimitedLLM(llm, llm_bucket(provider, model_id))
+
+
+def agent_models(agent_name: str) -> list[tuple[str, str]]:
+    """
+    The (provider, model_id) pairs an agent routes over: its '<AGENT>_MODEL_PROVIDER'
+    and '<AGENT>_MODEL_ID' settings, followed by its '<AGENT>_FALLBACK_MODELS'.
+    """
+    models = [(
+        getattr(settings, f"{agent_name.upper()}_MODEL_PROVIDER"),
+        getattr(settings, f"{agent_name.upper()}_MODEL_ID"),
+    )]
+    for entry in getattr(settings, f"{agent_name.upper()}_FALLBACK_MODELS", []):
+        fallback_provider, _, fallback_model_id = entry.partition("/")
+        if not fallback_model_id:
+            raise ValueError(f"Fallback model '{entry}' of agent '{agent_name}' is not in 'provider/model_id' form")
+        models.append((fallback_provider, fallback_model_id))
+    return models
+
+
+def build_llm(agent_name: str, llm_config: dict) -> "UsageScopedLLM":
+    """
+    Returns an agent's LLM, routed over its models with the sampling
+    parameters from agents.yaml. Agents using the same provider and model
+    share one rate limit.
+
+    The stack of CrewAI LLMs, rate limiters and router is built once per
+    agent, model list and llm_config, and then shared: it keeps no per-crew
+    state. Each call only wraps it in a new UsageScopedLLM, which keeps the
+    token usage of the crew it is built for.
+    """
+    from .llm.routed_llm import RoutedLLM
+    from .llm.usage_scoped_llm import UsageScopedLLM
+
+    models = agent_models(agent_name)
+    key = (agent_name, tuple(models), json.dumps(llm_config, sort_keys=True, default=str))
+    stack = _llm_stacks.get(key)
+    if stack is None:
+        with _llm_stacks_lock:
+            stack = _llm_stacks.get(key)
+            if stack is None:
+                stack = _llm_stacks[key] = RoutedLLM([
+                    (f"{provider}/{model_id}", build_model(provider, model_id, llm_config))
+                    for provider, model_id in models
+                ])
+    return UsageScopedLLM(stack)
+
+
+# Keys every agent and task entry must define
+REQUIRED_AGENT_KEYS = ("role", "goal", "backstory")
+REQUIRED_TASK_KEYS = ("description", "expected_output", "agent")
+
+
+@dataclass(frozen=True)
+class AgentTemplate:
+    """
+    A validated agents.yaml entry. Builds a fresh Agent on every call, so
+    nothing that CrewAI mutates during a kickoff is shared between crews,
+    while the LLM stack behind it is shared, see build_llm().
+    Its tools are kept as dotted paths and imported on the first build.
+    """
+    name: str
+    config: Mapping[str, Any]
+    llm_config: Mapping[str, Any]
+    tools: tuple[str, ...]
+
+    def build(self, llm_factory, tool_factory=None) -> "Agent":
+        from crewai import Agent
+        from .llm.cached_llm import with_llm_cache
+
+        tools = [(tool_factory or resolve_object)(path) for path in self.tools]
+        agent = Agent(**self.config, llm=llm_factory(self.name, dict(self.llm_config)), tools=tools)
+        return with_llm_cache(agent)
+
+
+@dataclass(frozen=True)
+class TaskTemplate:
+    """
+    A validated tasks.yaml entry with its output model already resolved.
+    """
+    name: str
+    agent: str
+    config: Mapping[str, Any]
+    output_pydantic: type[BaseModel] | None
+
+    def build(self, agent: "Agent") -> "Task":
+        from crewai import Task
+        from .llm.repairing_converter import RepairingConverter
+
+        converter_cls = RepairingConverter if settings.OUTPUT_REPAIR_ENABLED else None
+        return Task(
+            name=self.name, agent=agent, output_pydantic=self.output_pydantic, converter_cls=converter_cls, **self.config
+        )
+
+
+class CrewTemplates:
+    """
+    Loads and validates agents.yaml and tasks.yaml once per process and keeps
+    an immutable template per agent and task. Crews are built from the
+    templates, which is safe from several threads at once.
+    """
+
+    def __init__(self, config_dir: Path = CONFIG_DIR):
+        self.config_dir = config_dir
+        self._lock = threading.Lock()
+        self._agents: dict[str, AgentTemplate] | None = None
+        self._tasks: dict[str, TaskTemplate] | None = None
+
+    @property
+    def agents(self) -> Mapping[str, AgentTemplate]:
+        self._ensure_loaded()
+        return self._agents
+
+    @property
+    def tasks(self) -> Mapping[str, TaskTemplate]:
+        self._ensure_loaded()
+        return self._tasks
+
+    def load(self) -> "CrewTemplates":
+        """
+        Loads the templates now instead of on first use, so configuration errors surface at startup.
+        """
+        self._ensure_loaded()
+        return self
+
+    def _ensure_loaded(self):
+        if self._tasks is not None:
+            return
+        with self._lock:
+            if self._tasks is None:
+                agents, tasks = self._load()
+                self._agents = MappingProxyType(agents)
+                self._tasks = MappingProxyType(tasks)
+
+    def _load(self) -> tuple[dict, dict]:
+        """
+        Parses both files, checks that every tool module exists and resolves
+        every output model. Tools are only imported when an agent is built,
+        since e.g. the search tool pulls in crewai_tools.
+        Raises a ValueError listing all problems found.
+        """
+        agents_config = load_config("agents.yaml", self.config_dir)
+        tasks_config = load_config("tasks.yaml", self.config_dir)
+        errors = []
+
+        agents = {}
+        for name, config in agents_config.items():
+            errors += [f"agent '{name}' is missing '{key}'" for key in REQUIRED_AGENT_KEYS if not config.get(key)]
+            config = dict(config)
+            llm_config = config.pop("llm", None) or {}
+            if not isinstance(llm_config, dict):
+                errors.append(f"agent '{name}' has an 'llm' entry that is not a mapping")
+                llm_config = {}
+            tools = []
+            for path in config.pop("tools", None) or []:
+                try:
+                    check_object_path(path)
+                    tools.append(path)
+                except (ImportError, AttributeError, ValueError) as e:
+                    errors.append(f"agent '{name}' has an unknown tool '{path}': {e}")
+            agents[name] = AgentTemplate(name, MappingProxyType(config), MappingProxyType(llm_config), tuple(tools))
+
+        tasks = {}
+        for name, config in tasks_config.items():
+            errors += [f"task '{name}' is missing '{key}'" for key in REQUIRED_TASK_KEYS if not config.get(key)]
+            config = dict(config)
+            agent_name = config.pop("agent", None)
+            if agent_name and agent_name not in agents:
+                errors.append(f"task '{name}' uses an unknown agent '{agent_name}'")
+
+            output_pydantic = None
+            if path := config.pop("output_pydantic", None):
+                try:
+                    output_pydantic = resolve_object(path)
+                except (ImportError, AttributeError, ValueError) as e:
+                    errors.append(f"task '{name}' has an unknown output_pydantic '{path}': {e}")
+                else:
+                    if not (isinstance(output_pydantic, type) and issubclass(output_pydantic, BaseModel)):
+                        errors.append(f"task '{name}' output_pydantic '{path}' is not a pydantic model")
+            tasks[name] = TaskTemplate(name, agent_name, MappingProxyType(config), output_pydantic)
+
+        if errors:
+            raise ValueError("Invalid crew configuration:\n  " + "\n  ".join(errors))
+        return agents, tasks
+
+    def build_crew(
+        self,
+        name: str,
+        task_names: list[str],
+        llm_factory: Callable[[str, dict], Any] | None = None,
+        tool_factory: Callable[[str], Any] | None = None,
+    ) -> "Crew":
+        """
+        Builds a crew running `task_names`, with one agent per distinct agent name.
+        `llm_factory(agent_name, llm_config)` and `tool_factory(tool_path)` replace
+        how LLMs and tools are created, e.g. with fakes in the benchmarks.
+        """
+        from crewai import Crew, Process
+
+        _prepare_crewai()
+        agents = {}
+        tasks = []
+        for task_name in task_names:
+            template = self.tasks[task_name]
+            if template.agent not in agents:
+                agents[template.agent] = self.agents[template.agent].build(llm_factory or build_llm, tool_factory)
+            tasks.append(template.build(agents[template.agent]))
 
-    @crew
-    def create_crew(self):
         return Crew(
-            agents=[self.validator()],
-            tasks=[self.validation_task()],
+            name=name,
+            agents=list(agents.values()),
+            tasks=tasks,
             process=Process.sequential,
-            verbose=2,
+            verbose=True,
         )
 
-@CrewBase
-class ContentCrew:
+
+crew_templates = CrewTemplates()
+
+
+class ConfiguredCrew:
+    """
+    Base class for the crews below. Builds them from the shared, already
+    validated crew templates.
+    """
+
+    def __init__(
+        self,
+        llm_factory: Callable[[str, dict], Any] | None = None,
+        tool_factory: Callable[[str], Any] | None = None,
+    ):
+        self.llm_factory = llm_factory
+        self.tool_factory = tool_factory
+
+    def _crew(self, name: str, task_names: list[str]) -> "Crew":
+        return crew_templates.build_crew(name, task_names, self.llm_factory, self.tool_factory)
+
+
+class ValidationCrew(ConfiguredCrew):
+    """
+    The Market Validation Crew.
+    This crew takes the initial brief and returns a validation report.
+    """
+
+    def create_crew(self):
+        return self._crew("validation_crew", ["validation_task"])
+
+
+class ResearchCrew(ConfiguredCrew):
+    """
+    The Market Research Crew.
+    This crew assumes validation has passed and returns a research report
+    that the Content Generation Crew builds on.
+    """
+
+    def create_crew(self):
+        return self._crew("research_crew", ["research_task"])
+
+    def create_section_crew(self, task_name: str):
+        """
+        Builds a crew that runs a single research sub-task.
+        Every crew gets its own agent, so concurrent section crews never share one.
+        """
+        return self._crew("research_crew", [task_name])
+
+
+class ContentCrew(ConfiguredCrew):
     """
     The Content Generation Crew.
-    This crew assumes validation has passed and executes the full
-    research, writing, and editing pipeline.
-    """
-    agents_config = "config/agents.yaml"
-    tasks_config = "config/tasks.yaml"
-
-    # Define the agents this crew uses
-    @agent
-    def researcher(self):
-        from crewai.agent import Agent
-        return Agent(config=self.agents_config['researcher'])
-
-    @agent
-    def copywriter(self):
-        from crewai.agent import Agent
-        return Agent(config=self.agents_config['copywriter'])
-
-    @agent
-    def editor(self):
-        from crewai.agent import Agent
-        return Agent(config=self.agents_config['editor'])
-
-    # Define the tasks this crew uses
-    @task
-    def research_task(self):
-        from crewai.task import Task
-        return Task(config=self.tasks_config['research_task'])
-
-    @task
-    def writing_task(self):
-        from crewai.task import Task
-        return Task(config=self.tasks_config['writing_task'])
-
-    @task
-    def editing_task(self):
-        from crewai.task import Task
-        return Task(config=self.tasks_config['editing_task'])
-
-    # The @crew decorator defines the crew process
-    @crew
+    This crew takes the research report as an input and writes the
+    blog post and landing page copy.
+    """
+
     def create_crew(self):
-        return Crew(
-            agents=[self.researcher(), self.copywriter(), self.editor()],  # self.agents and self.tasks are loaded from the YAMLs
-            tasks=[self.research_task(), self.writing_task(), self.editing_task()],
-            process=Process.sequential,
-            verbose=2
-        )
\ No newline at end of file
+        return self._crew("content_crew", ["writing_task"])
+
+    def create_section_crew(self, task_name: str):
+        """
+        Builds a crew that runs a single writing sub-task.
+        Every crew gets its own agent, so concurrent section crews never share one.
+        """
+        return self._crew("content_crew", [task_name])
+
+
+class EditingCrew(ConfiguredCrew):
+    """
+    The Editing Crew.
+    This crew takes the drafted marketing content as an input and applies
+    the guardrails and final polish before it is published.
+    """
+
+    def create_crew(self):
+        return self._crew("editing_crew", ["editing_task"])
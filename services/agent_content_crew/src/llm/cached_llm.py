@@ -0,0 +1,81 @@
+from typing import Any
+
+from ..config.logger import logger
+from ..config.settings import settings
+from ..utils.sqlite_cache import SQLiteCache, make_cache_key
+from .delegating_llm import DelegatingLLM
+
+# LLM attributes that change the generated output, and therefore belong in the cache key
+SAMPLING_PARAMS = (
+    "temperature",
+    "top_p",
+    "top_k",
+    "max_tokens",
+    "max_output_tokens",
+    "max_completion_tokens",
+    "seed",
+    "presence_penalty",
+    "frequency_penalty",
+    "stop",
+)
+
+llm_cache = SQLiteCache(
+    settings.CACHE_DIR / "llm_cache.sqlite3",
+    max_bytes=settings.LLM_CACHE_MAX_BYTES,
+    default_ttl=settings.LLM_CACHE_TTL_SECONDS or None,
+) if settings.LLM_CACHE_ENABLED else None
+
+
+class CachedLLM(DelegatingLLM):
+    """
+    Content-addressed response cache in front of an agent's LLM.
+
+    Responses are keyed on the provider, model id, fully rendered messages,
+    tool schemas and sampling parameters. Only calls made on behalf of a task
+    listed in `cacheable_tasks` are served from or written to the cache, so
+    creative tasks keep producing fresh output.
+    """
+
+    def __init__(self, llm, cache: SQLiteCache, cacheable_tasks: list[str]):
+        super().__init__(llm)
+        self.cache = cache
+        self.cacheable_tasks = set(cacheable_tasks)
+
+    def _cache_key(self, messages, tools: list[dict] | None) -> str:
+        params = {name: getattr(self.llm, name, None) for name in SAMPLING_PARAMS}
+        return make_cache_key(self.llm.provider, self.llm.model, messages, tools, params)
+
+    def call(
+        self,
+        messages,
+        tools: list[dict] | None = None,
+        callbacks: list[Any] | None = None,
+        available_functions: dict[str, Any] | None = None,
+        from_task: Any | None = None,
+        from_agent: Any | None = None,
+    ) -> str | Any:
+        task_name = getattr(from_task, "name", None)
+        if task_name not in self.cacheable_tasks:
+            return super().call(messages, tools, callbacks, available_functions, from_task, from_agent)
+
+        key = self._cache_key(messages, tools)
+        cached = self.cache.get(key)
+        if cached is not None:
+            logger.debug(f"LLM cache hit for task '{task_name}' ({self.llm.model})")
+            return cached
+
+        response = super().call(messages, tools, callbacks, available_functions, from_task, from_agent)
+
+        # Native tool-call results are not plain text and are not safe to replay
+        if isinstance(response, str) and response:
+            self.cache.set(key, response)
+        return response
+
+
+def with_llm_cache(agent):
+    """
+    Wraps the agent's LLM in a CachedLLM when the LLM cache is enabled.
+    """
+    if llm_cache is not None and not isinstance(agent.llm, CachedLLM):
+        agent.llm = CachedLLM(agent.llm, llm_cache, settings.LLM_CACHE_TASKS)
+    return agent
@@ -0,0 +1,63 @@
+from typing import Any
+
+from crewai.llms.base_llm import BaseLLM
+
+
+class DelegatingLLM(BaseLLM):
+    """
+    Base class for LLM wrappers that add behaviour around another LLM.
+    Every call and capability query is forwarded to the wrapped LLM, so a
+    wrapper can be dropped onto an agent without changing how CrewAI drives it.
+    """
+
+    def __init__(self, llm: BaseLLM):
+        self.llm = llm
+        super().__init__(
+            model=llm.model,
+            temperature=getattr(llm, "temperature", None),
+            provider=getattr(llm, "provider", None),
+            stop=list(getattr(llm, "stop", None) or []),
+        )
+        self.is_litellm = getattr(llm, "is_litellm", False)
+
+    # CrewAI's executor sets stop words on the agent's LLM, keep them in sync
+    @property
+    def stop(self) -> list[str]:
+        return self.llm.stop
+
+    @stop.setter
+    def stop(self, value: list[str]):
+        self.llm.stop = value
+
+    def call(
+        self,
+        messages,
+        tools: list[dict] | None = None,
+        callbacks: list[Any] | None = None,
+        available_functions: dict[str, Any] | None = None,
+        from_task: Any | None = None,
+        from_agent: Any | None = None,
+    ) -> str | Any:
+        return self.llm.call(
+            messages,
+            tools=tools,
+            callbacks=callbacks,
+            available_functions=available_functions,
+            from_task=from_task,
+            from_agent=from_agent,
+        )
+
+    def supports_stop_words(self) -> bool:
+        return self.llm.supports_stop_words()
+
+    def get_context_window_size(self) -> int:
+        return self.llm.get_context_window_size()
+
+    def get_token_usage_summary(self):
+        return self.llm.get_token_usage_summary()
+
+    def __getattr__(self, name: str):
+        # Only reached for attributes the wrapper does not define itself
+        if name == "llm":
+            raise AttributeError(name)
+        return getattr(self.llm, name)
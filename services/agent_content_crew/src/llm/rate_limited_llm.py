@@ -0,0 +1,31 @@
+from typing import Any
+
+from crewai.llms.base_llm import BaseLLM
+
+from ..utils.rate_limiter import TokenBucket, call_with_rate_limit
+from .delegating_llm import DelegatingLLM
+
+
+class RateLimitedLLM(DelegatingLLM):
+    """
+    Takes a slot from the token bucket shared by every LLM of the same
+    provider and model before each call, and retries rate limited calls
+    with adaptive, jittered backoff.
+    """
+
+    def __init__(self, llm: BaseLLM, bucket: TokenBucket):
+        super().__init__(llm)
+        self.bucket = bucket
+
+    def call(
+        self,
+        messages,
+        tools: list[dict] | None = None,
+        callbacks: list[Any] | None = None,
+        available_functions: dict[str, Any] | None = None,
+        from_task: Any | None = None,
+        from_agent: Any | None = None,
+    ) -> str | Any:
+        return call_with_rate_limit(
+            self.bucket, super().call, messages, tools, callbacks, available_functions, from_task, from_agent
+        )
@@ -0,0 +1,24 @@
+from crewai.utilities.converter import Converter
+from pydantic import BaseModel
+
+from ..config.logger import logger
+from ..utils.output_repair import output_repairs, repair_output
+
+
+class RepairingConverter(Converter):
+    """
+    CrewAI calls a task's converter once an answer does not parse into its
+    output_pydantic model as is, and the converter re-prompts the LLM.
+    This one tries repair_output first and only re-prompts when that fails.
+    """
+
+    def to_pydantic(self, current_attempt: int = 1) -> BaseModel:
+        if current_attempt == 1:
+            output, fixes = repair_output(self.text, self.model)
+            if output is not None:
+                output_repairs.record(fixes)
+                logger.info(f"Repaired the {self.model.__name__} output locally: {', '.join(fixes)}.")
+                return output
+            output_repairs.record(None)
+            logger.warning(f"Could not repair the {self.model.__name__} output, asking the LLM to convert it.")
+        return super().to_pydantic(current_attempt)
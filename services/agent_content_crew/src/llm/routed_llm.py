@@ -0,0 +1,203 @@
+import copy
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from typing import Any
+
+from crewai.llms.base_llm import BaseLLM
+
+from ..config.logger import logger, propagate_context
+from ..config.settings import settings
+from ..utils.latency import model_latency
+from ..utils.output_repair import repair_output
+from ..utils.rate_limiter import CallAbandoned, CallMeter, metered_call
+from .delegating_llm import DelegatingLLM
+
+FINAL_ANSWER_MARKER = "Final Answer:"
+
+
+def is_valid_response(response: Any, from_task: Any | None = None) -> bool:
+    """
+    False for empty responses, and for final answers that do not parse into
+    the task's output_pydantic model, even after a local repair. Intermediate
+    steps only need content.
+    """
+    if response is None or (isinstance(response, str) and not response.strip()):
+        return False
+
+    output_model = getattr(from_task, "output_pydantic", None)
+    if output_model is None or not isinstance(response, str) or FINAL_ANSWER_MARKER not in response:
+        return True
+
+    output, _ = repair_output(response.split(FINAL_ANSWER_MARKER, 1)[1], output_model)
+    return output is not None
+
+
+class RoutedLLM(DelegatingLLM):
+    """
+    Routes an agent's calls over an ordered list of models.
+
+    The first model gets every call. Once a call has been running longer
+    than that model's usual latency (LLM_HEDGE_PERCENTILE of its recent
+    calls, capped by LLM_LATENCY_SLO_SECONDS) the same request is also sent
+    to the next model, and the first valid response wins. A model that fails
+    or answers with something invalid hands over to the next one right away.
+
+    A hedged call gets no callbacks, so token usage is not reported twice.
+    Calls that run tools natively (with `available_functions`) are never
+    hedged, only handed over on failure, so a tool never runs twice. Calls
+    that lost the race finish in the background but are not retried.
+    """
+
+    def __init__(self, tiers: list[tuple[str, BaseLLM]]):
+        if not tiers:
+            raise ValueError("RoutedLLM needs at least one model")
+        # Set first, the base class assigns the stop words
+        self.tiers = tiers
+        super().__init__(tiers[0][1])
+
+    @property
+    def stop(self) -> list[str]:
+        return self.llm.stop
+
+    @stop.setter
+    def stop(self, value: list[str]):
+        for _, llm in self.tiers:
+            llm.stop = value
+
+    def hedge_delay(self, model: str) -> float:
+        """
+        Seconds to wait on a call to `model` before racing the next model against it.
+        """
+        delay = settings.LLM_LATENCY_SLO_SECONDS
+        usual = model_latency.percentile(model, settings.LLM_HEDGE_PERCENTILE, settings.LLM_LATENCY_MIN_SAMPLES)
+        if usual is not None:
+            delay = min(delay, usual)
+        return max(delay, settings.LLM_HEDGE_MIN_SECONDS)
+
+    def _call_tier(
+        self, index: int, meter: CallMeter, messages, tools, callbacks, available_functions, from_task, from_agent
+    ):
+        """
+        Calls the model of tier `index`, records its latency and returns the
+        response with whether it is valid. Time spent waiting for the rate
+        limiter is left out of the latency, throttling alone is no reason to hedge.
+        """
+        model, llm = self.tiers[index]
+        started = time.perf_counter()
+        try:
+            with metered_call(meter):
+                response = llm.call(
+                    copy.deepcopy(messages) if index else messages,
+                    tools=tools,
+                    callbacks=callbacks,
+                    available_functions=available_functions,
+                    from_task=from_task,
+                    from_agent=from_agent,
+                )
+        except CallAbandoned:
+            raise
+        except BaseException:
+            model_latency.record(model, time.perf_counter() - started - meter.waited_seconds, "error")
+            raise
+        valid = is_valid_response(response, from_task)
+        model_latency.record(model, time.perf_counter() - started - meter.waited_seconds, "ok" if valid else "invalid")
+        return response, valid
+
+    def _start(self, index: int, meter: CallMeter, *arguments) -> Future:
+        """
+        Runs _call_tier in a daemon thread, so a stuck call never holds up
+        the caller or the interpreter's exit.
+        """
+        future: Future = Future()
+
+        def run():
+            try:
+                future.set_result(self._call_tier(index, meter, *arguments))
+            except BaseException as e:
+                future.set_exception(e)
+
+        threading.Thread(target=propagate_context(run), name=f"llm-{self.tiers[index][0]}", daemon=True).start()
+        return future
+
+    def call(
+        self,
+        messages,
+        tools: list[dict] | None = None,
+        callbacks: list[Any] | None = None,
+        available_functions: dict[str, Any] | None = None,
+        from_task: Any | None = None,
+        from_agent: Any | None = None,
+    ) -> str | Any:
+        arguments = (messages, tools, callbacks, available_functions, from_task, from_agent)
+        if len(self.tiers) == 1:
+            # Nothing to race against, the call is only timed
+            return self._call_tier(0, CallMeter(), *arguments)[0]
+
+        pending: dict[Future, int] = {}
+        meters: list[CallMeter] = []
+
+        def start(index: int, hedged: bool = False):
+            meters.append(CallMeter())
+            # A hedged call runs alongside another one, only that one reports to the callbacks
+            call_arguments = (messages, tools, None, None, from_task, from_agent) if hedged else arguments
+            pending[self._start(index, meters[-1], *call_arguments)] = index
+
+        try:
+            return self._route(pending, start, hedge=not available_functions)
+        finally:
+            # Whatever is still running lost, it must not retry and take more rate limit slots
+            for meter in meters:
+                meter.abandoned.set()
+
+    def _route(self, pending: dict[Future, int], start, hedge: bool):
+        """
+        Waits for the calls `start` launches, hedging slow ones when `hedge`
+        is set and falling back after failures, and returns the first valid response.
+        """
+        start(0)
+        launched, launched_at = 0, time.monotonic()
+        invalid: list = []
+        error: BaseException | None = None
+
+        while pending:
+            timeout = None
+            if hedge and launched + 1 < len(self.tiers):
+                model = self.tiers[launched][0]
+                timeout = max(0.0, launched_at + self.hedge_delay(model) - time.monotonic())
+
+            done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            if not done:
+                slow, launched = self.tiers[launched][0], launched + 1
+                logger.warning(f"{slow} is slower than usual, hedging with {self.tiers[launched][0]}.")
+                model_latency.count(slow, "hedged")
+                start(launched, hedged=True)
+                launched_at = time.monotonic()
+                continue
+
+            for future in done:
+                index = pending.pop(future)
+                model = self.tiers[index][0]
+                try:
+                    response, valid = future.result()
+                except Exception as e:
+                    logger.warning(f"{model} failed: {e}")
+                    error = e
+                    continue
+                if valid:
+                    if launched:
+                        model_latency.count(model, "wins")
+                    return response
+                logger.warning(f"{model} returned an invalid response.")
+                invalid.append(response)
+
+            if not pending and launched + 1 < len(self.tiers):
+                launched += 1
+                logger.warning(f"Falling back to {self.tiers[launched][0]}.")
+                start(launched)
+                launched_at = time.monotonic()
+
+        # No model gave a valid response, let CrewAI's own parsing and retries deal with the first answer
+        if invalid:
+            return invalid[0]
+        raise error
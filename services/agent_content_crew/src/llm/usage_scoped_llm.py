@@ -0,0 +1,66 @@
+import contextvars
+import threading
+from typing import Any
+
+from crewai.llms.base_llm import BaseLLM
+from crewai.types.usage_metrics import UsageMetrics
+
+from .delegating_llm import DelegatingLLM
+
+# The agent LLM whose call is running, the shared models report their token usage to it
+_usage_scope: contextvars.ContextVar["UsageScopedLLM | None"] = contextvars.ContextVar(
+    "llm_usage_scope", default=None
+)
+
+
+def report_usage_to_scope(llm: BaseLLM) -> BaseLLM:
+    """
+    Makes a shared LLM also count the token usage of each call on the
+    UsageScopedLLM that made it. The LLM keeps its own process-wide totals.
+    """
+    track = llm._track_token_usage_internal
+
+    def track_in_scope(usage_data: dict[str, Any]):
+        track(usage_data)
+        scope = _usage_scope.get()
+        if scope is not None:
+            scope.record_usage(usage_data)
+
+    llm._track_token_usage_internal = track_in_scope
+    return llm
+
+
+class UsageScopedLLM(DelegatingLLM):
+    """
+    An agent's own front to an LLM stack that every crew shares. CrewAI sums
+    the token usage of each agent's LLM into the crew's usage metrics, so this
+    wrapper keeps the usage of its own calls, including the ones made from
+    hedging threads, instead of the shared models' running totals.
+    """
+
+    def __init__(self, llm: BaseLLM):
+        super().__init__(llm)
+        self._usage_lock = threading.Lock()
+
+    def call(
+        self,
+        messages,
+        tools: list[dict] | None = None,
+        callbacks: list[Any] | None = None,
+        available_functions: dict[str, Any] | None = None,
+        from_task: Any | None = None,
+        from_agent: Any | None = None,
+    ) -> str | Any:
+        token = _usage_scope.set(self)
+        try:
+            return super().call(messages, tools, callbacks, available_functions, from_task, from_agent)
+        finally:
+            _usage_scope.reset(token)
+
+    def record_usage(self, usage_data: dict[str, Any]):
+        with self._usage_lock:
+            BaseLLM._track_token_usage_internal(self, usage_data)
+
+    def get_token_usage_summary(self) -> UsageMetrics:
+        with self._usage_lock:
+            return UsageMetrics(**self._token_usage)
@@ -1,17 +1,74 @@
-from .cli.cli import CLI
+import argparse
+
 from .config.logger import logger
+from .config.settings import settings
+from .crew import crew_templates
+from .utils.tracing import enable_tracing, export_traces, tracer
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Content Crew pipeline")
+    parser.add_argument(
+        "--batch",
+        metavar="FILE",
+        help="Run briefs from a JSONL or YAML file without interactive prompts.",
+    )
+    parser.add_argument(
+        "--output",
+        metavar="FILE",
+        default="batch_results.jsonl",
+        help="JSONL file the batch results are appended to (default: batch_results.jsonl).",
+    )
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="Run the HTTP job server instead of the interactive CLI.",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=None,
+        help="Number of briefs to run at the same time (default: BATCH_CONCURRENCY).",
+    )
+    parser.add_argument(
+        "--fresh",
+        action="store_true",
+        help="Run every stage again instead of resuming from checkpoints or reusing similar validations.",
+    )
+    return parser.parse_args(argv)
 
-def run():
+def run(argv=None):
     """
     Initializes and runs the main Content Pipeline.
     """
+    args = parse_args(argv)
+    if settings.TRACING_ENABLED:
+        enable_tracing()
     try:
-        CLI.run()
+        crew_templates.load()
+        if args.serve:
+            from .server.app import serve
+            serve()
+        elif args.batch:
+            from .cli.batch_runner import BatchRunner
+            BatchRunner(args.batch, args.output, args.concurrency, fresh=args.fresh).run()
+        else:
+            from .cli.cli import CLI
+            CLI.run(fresh=args.fresh)
     except Exception as e:
             logger.error(f"A critical unhandled error occurred: {e}", exc_info=True)
     finally:
+        if settings.TRACING_ENABLED:
+            _export_traces()
         logger.info("Application shutting down.")
 
+def _export_traces():
+    try:
+        paths = export_traces(settings.TRACE_DIR)
+        logger.info(f"Run summary:\n{tracer.summary_table()}")
+        logger.info(f"Traces written to '{paths['spans']}' and '{paths['metrics']}'.")
+    except Exception as e:
+        logger.error(f"Failed to export traces: {e}")
+
 if __name__ == "__main__":
     logger.info("Logger initialized. Starting Content Pipeline...")
     run()
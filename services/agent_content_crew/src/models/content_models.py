@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Optional
 
 
@@ -12,6 +12,15 @@ class LandingPageContent(BaseModel):
     
     feature_blurbs: List[str] = Field(...,description="A list of 3 short feature blurbs, each under 25 words.")
     
+class BlogPost(BaseModel):
+    """
+    The blog post part of the marketing content, written on its own
+    when writing runs in parallel.
+    """
+    blog_post_markdown: str = Field(
+        description="The full, 500-word SEO-friendly blog post, formatted in markdown."
+    )
+
 class MarketingContent(BaseModel):
     """
     The complete, structured marketing content output.
@@ -66,8 +75,7 @@ class MarketingBrief(BaseModel):
     budget_range: str = Field(..., description="For ads or initial marketing spend.")
     preferred_channels: Optional[List[str]] = Field(None, description="Channels to prioritize.")
 
-    class Config:
-        allow_population_by_field_name = True
+    model_config = ConfigDict(populate_by_name=True)
 
 class ResearchReport(BaseModel):
     """
@@ -98,4 +106,50 @@ class ResearchReport(BaseModel):
         description="A list of 10 primary SEO keywords.",
         min_items=10,
         max_items=10
-    )
\ No newline at end of file
+    )
+
+
+# --- Research sections ---
+# Each section is produced by its own research sub-task when research runs in
+# parallel, and the sections are merged back into a ResearchReport.
+
+class AudienceResearch(BaseModel):
+    """The audience section of a ResearchReport."""
+    audience_insights: str = Field(
+        ...,
+        description="A 2-3 sentence summary of the target audience's demographics and psychographics."
+    )
+
+class PainPointsResearch(BaseModel):
+    """The pain points section of a ResearchReport."""
+    key_pain_points: List[str] = Field(
+        ...,
+        description="A list of the top 3-5 pain points the product addresses.",
+        min_items=3,
+        max_items=5
+    )
+
+class MarketTrendsResearch(BaseModel):
+    """The market trends section of a ResearchReport."""
+    market_trends: List[str] = Field(
+        ...,
+        description="A list of 2-3 key market trends for the product's category.",
+        min_items=2,
+        max_items=3
+    )
+
+class CompetitorResearch(BaseModel):
+    """The competitor section of a ResearchReport."""
+    competitor_analysis: str = Field(
+        ...,
+        description="A 3-5 sentence paragraph analyzing 3-5 competitors and their strengths/weaknesses."
+    )
+
+class SeoKeywordsResearch(BaseModel):
+    """The SEO section of a ResearchReport."""
+    seo_keywords: List[str] = Field(
+        ...,
+        description="A list of 10 primary SEO keywords.",
+        min_items=10,
+        max_items=10
+    )
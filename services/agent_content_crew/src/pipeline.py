@@ -0,0 +1,516 @@
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable
+
+from pydantic import ValidationError
+
+from .config.logger import logger, propagate_context
+from .config.settings import settings
+from .crew import ValidationCrew, ResearchCrew, ContentCrew, EditingCrew, crew_templates
+from .models.content_models import (
+    AudienceResearch,
+    BlogPost,
+    CompetitorResearch,
+    LandingPageContent,
+    MarketingBrief,
+    MarketingContent,
+    MarketTrendsResearch,
+    PainPointsResearch,
+    ResearchReport,
+    SeoKeywordsResearch,
+)
+from .models.validation_models import ValidationReport
+from .publisher import campaign_id_for, publish_content
+from .utils.brief_index import BriefMatch, brief_index
+from .utils.checkpoints import checkpoints
+from .utils.crew_runner import run_crew
+from .utils.prompt_inputs import build_task_inputs, fields_read_by, record_template_tokens
+
+# Research sub-tasks used in parallel research mode, with the section each one returns
+RESEARCH_SECTIONS = {
+    'audience_research_task': AudienceResearch,
+    'pain_points_research_task': PainPointsResearch,
+    'market_trends_research_task': MarketTrendsResearch,
+    'competitor_research_task': CompetitorResearch,
+    'seo_keywords_research_task': SeoKeywordsResearch,
+}
+
+# Writing sub-tasks used in parallel writing mode, with the part each one returns
+WRITING_SECTIONS = {
+    'blog_post_task': BlogPost,
+    'landing_page_task': LandingPageContent,
+}
+
+
+class ContentPipeline:
+    """
+    Runs the validation, research, writing and editing crews for a single brief.
+    Shared by the interactive CLI and the headless batch runner.
+
+    With `fresh` every stage runs again instead of resuming from a checkpoint
+    or reusing the validation of a similar brief. What it produces is still
+    checkpointed, so a failed fresh run can be resumed by a plain one.
+
+    `llm_factory` and `tool_factory` are handed to every crew it builds, e.g.
+    to run the whole pipeline on fakes in the benchmarks.
+    """
+
+    def __init__(
+        self,
+        show_spinner: bool = True,
+        on_progress=None,
+        fresh: bool = False,
+        llm_factory: Callable[[str, dict], Any] | None = None,
+        tool_factory: Callable[[str], Any] | None = None,
+    ):
+        self.settings = settings
+        self.logger = logger
+        self.show_spinner = show_spinner
+        # Called as on_progress(event, stage) when a stage starts, completes, fails or is resumed
+        self.on_progress = on_progress
+        self.fresh = fresh
+        self.llm_factory = llm_factory
+        self.tool_factory = tool_factory
+        self.checkpoints = checkpoints
+        self.brief_index = brief_index
+
+    def build_crew(self, crew_class, task_name: str | None = None):
+        """
+        Builds the crew of `crew_class`, or its single-task crew for `task_name`.
+        """
+        configured = crew_class(self.llm_factory, self.tool_factory)
+        if task_name is None:
+            return configured.create_crew()
+        return configured.create_section_crew(task_name)
+
+    def _build_inputs(self, task_names, values: dict) -> dict:
+        """
+        Builds compact inputs for the given tasks and records the token count
+        of their rendered task and agent templates.
+        """
+        inputs = build_task_inputs(task_names, values)
+        counts = record_template_tokens(task_names, inputs)
+        self.logger.debug(f"Template tokens: {counts}")
+        return inputs
+
+    def build_validation_inputs(self, brief: MarketingBrief, task_names=('validation_task',)) -> dict:
+        return self._build_inputs(task_names, brief.model_dump())
+
+    def build_research_inputs(
+        self, brief: MarketingBrief, report: ValidationReport, task_names=('research_task',)
+    ) -> dict:
+        # Report fields are passed one by one, each task only gets the ones it references
+        return self._build_inputs(task_names, {**brief.model_dump(), **report.model_dump()})
+
+    def build_writing_inputs(
+        self, brief: MarketingBrief, research: ResearchReport, task_names=('writing_task',)
+    ) -> dict:
+        return self._build_inputs(task_names, {**brief.model_dump(), 'research_report': research})
+
+    def build_editing_inputs(
+        self, brief: MarketingBrief, content: MarketingContent, task_names=('editing_task',)
+    ) -> dict:
+        return self._build_inputs(task_names, {**brief.model_dump(), 'marketing_content': content})
+
+    def _model_config(self, task_names) -> dict:
+        """
+        The model settings the output of the given tasks depends on, per agent.
+        """
+        agent_names = sorted({crew_templates.tasks[task_name].agent for task_name in task_names})
+        return {
+            agent_name: {
+                'provider': getattr(self.settings, f"{agent_name.upper()}_MODEL_PROVIDER"),
+                'model_id': getattr(self.settings, f"{agent_name.upper()}_MODEL_ID"),
+                'fallback_models': getattr(self.settings, f"{agent_name.upper()}_FALLBACK_MODELS"),
+                'llm': dict(crew_templates.agents[agent_name].llm_config),
+            }
+            for agent_name in agent_names
+        }
+
+    def _progress(self, event: str, stage: str):
+        if self.on_progress is not None:
+            self.on_progress(event, stage)
+
+    def _checkpoint_key(self, stage: str, task_names, brief: MarketingBrief, upstream) -> str | None:
+        if self.checkpoints is None:
+            return None
+        return self.checkpoints.key(
+            stage, brief, self._model_config(task_names), upstream, fields=fields_read_by(task_names)
+        )
+
+    def _checkpointed(self, stage: str, task_names, brief: MarketingBrief, upstream, output_model, run, reuse=None):
+        """
+        Returns the stage's checkpointed output when there is one. Otherwise
+        returns what `reuse()` finds, if given, or calls `run()` and
+        checkpoints what it returns, unless it failed. Reused output belongs
+        to another brief, so it is never checkpointed as this one's.
+
+        Only the brief fields read by `task_names` are part of the key, so a
+        revised brief reruns just the stages that read a changed field, and
+        the stages after them.
+        """
+        key = self._checkpoint_key(stage, task_names, brief, upstream)
+        if key is not None and not self.fresh:
+            output = self.checkpoints.load(key, output_model)
+            if output is not None:
+                self.logger.info(f"⏩ Skipping {stage} for '{brief.product_name}', resuming from its checkpoint.")
+                self._progress("stage_resumed", stage)
+                return output
+
+        if reuse is not None:
+            output = reuse()
+            if output is not None:
+                self._progress("stage_reused", stage)
+                return output
+
+        self._progress("stage_started", stage)
+        output = run()
+        if not isinstance(output, output_model):
+            self._progress("stage_failed", stage)
+            return output
+
+        if key is not None:
+            self.checkpoints.save(key, output)
+        self._progress("stage_completed", stage)
+        return output
+
+    def run_validation(self, brief: MarketingBrief) -> ValidationReport | None:
+        """
+        Runs the ValidationCrew, unless a checkpoint for the brief exists or,
+        with VALIDATION_REUSE=auto, a near-duplicate brief was validated.
+        Returns a ValidationReport or None if it fails.
+        """
+        return self._checkpointed(
+            "validation", ('validation_task',), brief, None, ValidationReport,
+            partial(self._run_validation, brief), reuse=partial(self._reuse_validation, brief),
+        )
+
+    def find_similar_validation(self, brief: MarketingBrief) -> BriefMatch | None:
+        """
+        Looks up the report of an earlier, near-duplicate brief within the
+        configured similarity and age thresholds. Fresh runs never reuse one.
+        """
+        if self.brief_index is None or self.fresh:
+            return None
+        return self.brief_index.find(
+            brief,
+            self.settings.VALIDATION_REUSE_MIN_SIMILARITY,
+            self.settings.VALIDATION_REUSE_MAX_AGE_HOURS * 60 * 60,
+        )
+
+    def _reuse_validation(self, brief: MarketingBrief) -> ValidationReport | None:
+        """
+        The report of a near-duplicate brief when VALIDATION_REUSE is 'auto'. It
+        is neither checkpointed nor indexed for this brief, only reports the
+        validator wrote for a brief are.
+        """
+        if self.settings.VALIDATION_REUSE != "auto":
+            return None
+        match = self.find_similar_validation(brief)
+        if match is None:
+            return None
+        self.logger.info(
+            f"♻️ Reusing the validation of '{match.product_name}' for '{brief.product_name}' "
+            f"({match.similarity:.0%} similar, {match.age_hours:.1f} hours old)."
+        )
+        return match.report
+
+    def _run_validation(self, brief: MarketingBrief) -> ValidationReport | None:
+        validation_crew = self.build_crew(ValidationCrew)
+        result = run_crew(
+            validation_crew,
+            self.build_validation_inputs(brief),
+            f"🚀 Running Market Validation for '{brief.product_name}'...",
+            "Validation Complete!",
+            "Validation Failed",
+            show_spinner=self.show_spinner,
+        )
+
+        # kickoff() returns a CrewOutput, the typed report lives on `.pydantic`
+        report = getattr(result, "pydantic", result)
+        if not isinstance(report, ValidationReport):
+            self.logger.error(f"Validation for '{brief.product_name}' failed to return a valid report.")
+            return None
+
+        if self.brief_index is not None:
+            self.brief_index.add(brief, report)
+        return report
+
+    def passes_threshold(self, report: ValidationReport) -> bool:
+        return report.viability_score >= self.settings.VALIDATION_THRESHOLD
+
+    def run_research(self, brief: MarketingBrief, report: ValidationReport) -> ResearchReport | None:
+        """
+        Runs the ResearchCrew, as one agent loop or as parallel sub-tasks
+        depending on RESEARCH_MODE, unless a checkpoint for the brief exists.
+        Returns a ResearchReport or None if it fails.
+        """
+        task_names = tuple(RESEARCH_SECTIONS) if self.settings.RESEARCH_MODE == "parallel" else ('research_task',)
+        return self._checkpointed(
+            "research", task_names, brief, report, ResearchReport, partial(self._run_research, brief, report)
+        )
+
+    def _run_research(self, brief: MarketingBrief, report: ValidationReport) -> ResearchReport | None:
+        if self.settings.RESEARCH_MODE == "parallel":
+            return self._run_parallel_research(brief, report)
+
+        research_crew = self.build_crew(ResearchCrew)
+        result = run_crew(
+            research_crew,
+            self.build_research_inputs(brief, report),
+            f"🔎 Running Market Research for '{brief.product_name}'...",
+            "Research Complete!",
+            "Research Failed",
+            show_spinner=self.show_spinner,
+        )
+
+        research = getattr(result, "pydantic", result)
+        if not isinstance(research, ResearchReport):
+            self.logger.error(f"Research for '{brief.product_name}' failed to return a valid report.")
+            return None
+
+        return research
+
+    def _run_parallel_research(self, brief: MarketingBrief, report: ValidationReport) -> ResearchReport | None:
+        """
+        Runs one focused research sub-task per ResearchReport section at the
+        same time, then merges the sections and validates them as a whole.
+        """
+        self.logger.info(
+            f"🔎 Running {len(RESEARCH_SECTIONS)} research sub-tasks in parallel for '{brief.product_name}'..."
+        )
+        sections = self._run_sections(
+            ResearchCrew, RESEARCH_SECTIONS, partial(self.build_research_inputs, brief, report), brief, report
+        )
+        if sections is None:
+            self.logger.error(f"Research for '{brief.product_name}' failed.")
+            return None
+
+        merged = {}
+        for section in sections.values():
+            merged.update(section.model_dump())
+
+        try:
+            research = ResearchReport(**merged)
+        except ValidationError as e:
+            self.logger.error(f"Merged research for '{brief.product_name}' is not a valid report: {e}")
+            return None
+
+        self.logger.info("Research Complete!")
+        return research
+
+    def run_writing(self, brief: MarketingBrief, research: ResearchReport) -> MarketingContent | None:
+        """
+        Runs the ContentCrew, as one generation or as parallel blog post and
+        landing page sub-tasks depending on WRITING_MODE, unless a checkpoint
+        for the brief exists.
+        Returns the drafted MarketingContent or None if it fails.
+        """
+        return self._checkpointed(
+            "writing", self._writing_task_names(), brief, research, MarketingContent, partial(self._run_writing, brief, research)
+        )
+
+    def _writing_task_names(self) -> tuple:
+        return tuple(WRITING_SECTIONS) if self.settings.WRITING_MODE == "parallel" else ('writing_task',)
+
+    def _run_writing(self, brief: MarketingBrief, research: ResearchReport) -> MarketingContent | None:
+        if self.settings.WRITING_MODE == "parallel":
+            return self._run_parallel_writing(brief, research)
+
+        content_crew = self.build_crew(ContentCrew)
+        result = run_crew(
+            content_crew,
+            self.build_writing_inputs(brief, research),
+            f"✍️ Writing Content for '{brief.product_name}' (This may take a few minutes)...",
+            "Writing Complete!",
+            "Writing Failed",
+            show_spinner=self.show_spinner,
+        )
+
+        content = getattr(result, "pydantic", result)
+        if not isinstance(content, MarketingContent):
+            self.logger.error(f"Writing for '{brief.product_name}' failed to return valid content.")
+            return None
+
+        return content
+
+    def _run_parallel_writing(self, brief: MarketingBrief, research: ResearchReport) -> MarketingContent | None:
+        """
+        Writes the blog post and the landing page at the same time, so the
+        short landing page does not wait behind the long blog post.
+        """
+        self.logger.info(f"✍️ Writing blog post and landing page in parallel for '{brief.product_name}'...")
+        sections = self._run_sections(
+            ContentCrew, WRITING_SECTIONS, partial(self.build_writing_inputs, brief, research), brief, research
+        )
+        if sections is None:
+            self.logger.error(f"Writing for '{brief.product_name}' failed.")
+            return None
+
+        try:
+            content = MarketingContent(
+                blog_post_markdown=sections['blog_post_task'].blog_post_markdown,
+                landing_page=sections['landing_page_task'],
+            )
+        except ValidationError as e:
+            self.logger.error(f"Assembled content for '{brief.product_name}' is not valid: {e}")
+            return None
+
+        self.logger.info("Writing Complete!")
+        return content
+
+    def run_editing(self, brief: MarketingBrief, content: MarketingContent) -> MarketingContent | None:
+        """
+        Runs the EditingCrew on the drafted content, unless a checkpoint for it exists.
+        Returns the edited MarketingContent or None if it fails.
+        """
+        return self._checkpointed(
+            "editing", ('editing_task',), brief, content, MarketingContent, partial(self._run_editing, brief, content)
+        )
+
+    def _run_editing(self, brief: MarketingBrief, content: MarketingContent) -> MarketingContent | None:
+        editing_crew = self.build_crew(EditingCrew)
+        result = run_crew(
+            editing_crew,
+            self.build_editing_inputs(brief, content),
+            f"🧐 Editing Content for '{brief.product_name}'...",
+            "Editing Complete!",
+            "Editing Failed",
+            show_spinner=self.show_spinner,
+        )
+
+        edited = getattr(result, "pydantic", result)
+        if not isinstance(edited, MarketingContent):
+            self.logger.error(f"Editing for '{brief.product_name}' failed to return valid content.")
+            return None
+
+        return edited
+
+    def run_publishing(
+        self,
+        brief: MarketingBrief,
+        content: MarketingContent,
+        report: ValidationReport | None = None,
+        research: ResearchReport | None = None,
+        campaign_id: str | None = None,
+    ) -> bool:
+        """
+        Renders the edited content through the templates and uploads it, with
+        the reports it was built from, under the campaign's prefix.
+        This is plain code, no LLM is involved.
+        """
+        campaign_id = campaign_id or campaign_id_for(brief)
+        self.logger.info(f"📦 Publishing content for '{brief.product_name}' as campaign '{campaign_id}'...")
+        self._progress("stage_started", "publishing")
+        published = publish_content(content, campaign_id, report, research)
+        if not published:
+            self.logger.error(f"Publishing for '{brief.product_name}' failed.")
+        self._progress("stage_completed" if published else "stage_failed", "publishing")
+        return published
+
+    def run_content_generation(
+        self,
+        brief: MarketingBrief,
+        report: ValidationReport,
+        research: ResearchReport | None = None,
+        campaign_id: str | None = None,
+    ) -> MarketingContent | None:
+        """
+        Runs research (unless a research report is given), writing, editing and publishing.
+        Stages with a checkpoint are skipped, so a failed run picks up where it stopped.
+        Once the content is published its writing and editing checkpoints are
+        dropped, so running the brief again writes new copy.
+        Artifacts go under `campaign_id`, which defaults to one derived from the brief.
+        Returns the published MarketingContent or None if any stage fails.
+        """
+        if research is None:
+            research = self.run_research(brief, report)
+            if research is None:
+                return None
+
+        content = self.run_writing(brief, research)
+        if content is None:
+            return None
+
+        edited = self.run_editing(brief, content)
+        if edited is None:
+            return None
+
+        if not self.run_publishing(brief, edited, report, research, campaign_id):
+            return None
+
+        self._discard_content_checkpoints(brief, research, content)
+        return edited
+
+    def _discard_content_checkpoints(self, brief: MarketingBrief, research: ResearchReport, draft: MarketingContent):
+        """
+        Drops the checkpoints of the writing stage, its sections and the editing stage.
+        Copywriting is never cached, the checkpoints only exist to resume a failed run.
+        """
+        if self.checkpoints is None:
+            return
+        task_names = self._writing_task_names()
+        keys = [
+            self._checkpoint_key("writing", task_names, brief, research),
+            self._checkpoint_key("editing", ('editing_task',), brief, draft),
+        ]
+        if len(task_names) > 1:
+            keys += [self._checkpoint_key(task_name, (task_name,), brief, research) for task_name in task_names]
+        self.checkpoints.discard(keys)
+
+    def _run_sections(self, crew_class, sections: dict, build_inputs, brief: MarketingBrief, upstream) -> dict | None:
+        """
+        Runs one single-task crew per section concurrently, each with the
+        inputs `build_inputs` returns for its task alone. Every section is
+        checkpointed on its own, so only the sections whose inputs changed run again.
+        Returns the typed output of every section, or None if any of them failed.
+        """
+        with ThreadPoolExecutor(max_workers=len(sections), thread_name_prefix="section") as pool:
+            futures = {
+                task_name: pool.submit(
+                    propagate_context(self._checkpointed),
+                    task_name,
+                    (task_name,),
+                    brief,
+                    upstream,
+                    output_model,
+                    partial(self._run_section, crew_class, task_name, build_inputs((task_name,))),
+                )
+                for task_name, output_model in sections.items()
+            }
+            results = {task_name: future.result() for task_name, future in futures.items()}
+
+        failed = [
+            task_name for task_name, result in results.items()
+            if not isinstance(result, sections[task_name])
+        ]
+        if failed:
+            self.logger.error(f"Sub-tasks failed: {', '.join(failed)}")
+            return None
+
+        return results
+
+    def _run_section(self, crew_class, task_name: str, inputs: dict):
+        section_crew = self.build_crew(crew_class, task_name)
+        result = run_crew(
+            section_crew,
+            inputs,
+            f"Running sub-task '{task_name}'...",
+            f"Sub-task '{task_name}' complete.",
+            f"Sub-task '{task_name}' failed",
+            show_spinner=False,
+        )
+        return getattr(result, "pydantic", result)
+
+
+def run_research_stage(brief_data: dict, report_data: dict, fresh: bool = False) -> dict | None:
+    """
+    Runs only the research stage for a brief given as plain data.
+    Used as the entry point for speculative research in a background process.
+    """
+    pipeline = ContentPipeline(show_spinner=False, fresh=fresh)
+    research = pipeline.run_research(
+        MarketingBrief(**brief_data),
+        ValidationReport(**report_data),
+    )
+    return research.model_dump() if research is not None else None
@@ -0,0 +1,170 @@
+import hashlib
+import json
+import re
+from datetime import datetime, timezone
+from pathlib import Path
+from string import Template
+
+from pydantic import BaseModel
+
+from .config.logger import logger
+from .config.settings import settings
+from .models.content_models import LandingPageContent, MarketingContent, ResearchReport
+from .models.validation_models import ValidationReport
+from .storage.factory import get_storage
+from .storage.objects import list_object_names, put_text_objects
+from .utils.checkpoints import normalize_brief
+from .utils.sqlite_cache import make_cache_key
+
+TEMPLATES_DIR = Path(__file__).parent / "templates"
+
+BLOG_POST_OBJECT = "blog_post.md"
+LANDING_PAGE_OBJECT = "landing_page.md"
+VALIDATION_REPORT_OBJECT = "validation_report.json"
+RESEARCH_REPORT_OBJECT = "research_report.json"
+MANIFEST_OBJECT = "manifest.json"
+
+# The pipeline stage whose output each artifact holds
+ARTIFACT_STAGES = {
+    VALIDATION_REPORT_OBJECT: "validation",
+    RESEARCH_REPORT_OBJECT: "research",
+    BLOG_POST_OBJECT: "editing",
+    LANDING_PAGE_OBJECT: "editing",
+}
+
+# Hex digits of the content hash in an artifact's object name
+ARTIFACT_HASH_LENGTH = 16
+
+
+def _load_template(name: str) -> Template:
+    return Template((TEMPLATES_DIR / name).read_text(encoding="utf-8"))
+
+
+def render_blog_post(content: MarketingContent) -> str:
+    return _load_template("blog_post.md").substitute(
+        blog_post_markdown=content.blog_post_markdown.strip(),
+    )
+
+
+def render_landing_page(landing_page: LandingPageContent) -> str:
+    return _load_template("landing_page.md").substitute(
+        headline=landing_page.headline.strip(),
+        sub_headline=landing_page.sub_headline.strip(),
+        feature_blurbs="\n".join(f"- {blurb.strip()}" for blurb in landing_page.feature_blurbs),
+    )
+
+
+def render_artifacts(content: MarketingContent) -> dict[str, str]:
+    """
+    Renders the edited content into the markdown files that get published.
+    """
+    return {
+        BLOG_POST_OBJECT: render_blog_post(content),
+        LANDING_PAGE_OBJECT: render_landing_page(content.landing_page),
+    }
+
+
+def campaign_id_for(brief: BaseModel) -> str:
+    """
+    A readable, stable id for the brief's campaign: the product name plus a
+    hash of the brief, so a rerun of the same brief publishes to the same
+    place and different briefs never share one.
+    """
+    slug = re.sub(r"[^a-z0-9]+", "-", brief.product_name.lower()).strip("-")[:40] or "campaign"
+    return f"{slug}-{make_cache_key(normalize_brief(brief))[:12]}"
+
+
+def campaign_prefix(campaign_id: str) -> str:
+    return f"{settings.MINIO_CAMPAIGN_PREFIX.strip('/')}/{campaign_id}/"
+
+
+def artifact_object_name(campaign_id: str, name: str, digest: str) -> str:
+    """
+    'campaigns/<campaign_id>/blog_post.<hash>.md'. The name changes with the
+    content, so an object that already exists never needs uploading again.
+    """
+    stem, _, extension = name.rpartition(".")
+    return f"{campaign_prefix(campaign_id)}{stem}.{digest[:ARTIFACT_HASH_LENGTH]}.{extension}"
+
+
+def build_manifest(campaign_id: str, artifacts: dict[str, str]) -> dict:
+    """
+    Lists every artifact of a campaign with its object name, content hash, size and stage.
+    """
+    entries = []
+    for name, text in artifacts.items():
+        data = text.encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        entries.append({
+            "name": name,
+            "object_name": artifact_object_name(campaign_id, name, digest),
+            "sha256": digest,
+            "size": len(data),
+            "stage": ARTIFACT_STAGES.get(name),
+        })
+    return {
+        "campaign_id": campaign_id,
+        "published_at": datetime.now(timezone.utc).isoformat(),
+        "artifacts": entries,
+    }
+
+
+def list_campaign_artifacts(campaign_id: str) -> list[str]:
+    """
+    Every object under the campaign's prefix, including artifacts of earlier
+    runs that the current manifest no longer lists.
+    """
+    return list_object_names(campaign_prefix(campaign_id))
+
+
+def publish_content(
+    content: MarketingContent,
+    campaign_id: str,
+    report: ValidationReport | None = None,
+    research: ResearchReport | None = None,
+) -> bool:
+    """
+    Renders the edited content and uploads every artifact under the campaign's
+    prefix, skipping the ones whose content is already there. The manifest
+    goes last, so it only ever lists artifacts that exist.
+    Returns True if all uploads succeeded.
+    """
+    artifacts = {}
+    if report is not None:
+        artifacts[VALIDATION_REPORT_OBJECT] = report.model_dump_json(indent=2)
+    if research is not None:
+        artifacts[RESEARCH_REPORT_OBJECT] = research.model_dump_json(indent=2)
+    artifacts.update(render_artifacts(content))
+
+    manifest = build_manifest(campaign_id, artifacts)
+    try:
+        existing = set(list_campaign_artifacts(campaign_id))
+    except Exception as e:
+        logger.error(f"Failed to list the artifacts of campaign '{campaign_id}': {e}")
+        return False
+
+    uploads = {}
+    for entry in manifest["artifacts"]:
+        if entry["object_name"] in existing:
+            logger.info(f"Skipped '{entry['object_name']}', it is already in the bucket.")
+        else:
+            uploads[entry["object_name"]] = artifacts[entry["name"]]
+
+    errors = put_text_objects(uploads)
+    published = True
+    for object_name, error in errors.items():
+        if error is None:
+            logger.info(f"Uploaded '{object_name}' to {get_storage().location()}.")
+        else:
+            logger.error(f"Failed to upload '{object_name}': {error}")
+            published = False
+    if not published:
+        return False
+
+    manifest_name = campaign_prefix(campaign_id) + MANIFEST_OBJECT
+    errors = put_text_objects({manifest_name: json.dumps(manifest, indent=2)})
+    if errors[manifest_name] is not None:
+        logger.error(f"Failed to upload '{manifest_name}': {errors[manifest_name]}")
+        return False
+    logger.info(f"Published campaign '{campaign_id}' to '{campaign_prefix(campaign_id)}'.")
+    return True
@@ -0,0 +1,111 @@
+import json
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
+
+from ..config.settings import settings
+from ..models.content_models import MarketingBrief
+from ..utils.tracing import METRIC_PREFIX
+from .jobs import JobManager, QueueFull
+
+jobs = JobManager(settings.JOB_WORKERS, settings.JOB_QUEUE_SIZE, settings.JOB_HISTORY_SIZE)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await jobs.start()
+    try:
+        yield
+    finally:
+        await jobs.stop()
+
+
+app = FastAPI(title="Content Crew Job Server", lifespan=lifespan)
+
+
+def _get_job(job_id: str):
+    job = jobs.jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"No job with id '{job_id}'")
+    return job
+
+
+@app.post("/jobs", status_code=202)
+async def submit_job(brief: MarketingBrief, request: Request, fresh: bool = False):
+    """
+    Queues a brief. Answers 429 when the queue is full, retry after a while.
+    `?fresh=true` runs every stage again instead of resuming from checkpoints.
+    """
+    try:
+        job = jobs.submit(brief.model_dump(), fresh=fresh)
+    except QueueFull as e:
+        return JSONResponse(status_code=429, content={"detail": str(e)}, headers={"Retry-After": "30"})
+
+    return {
+        **job.to_dict(),
+        "status_url": str(request.url_for("get_job", job_id=job.id)),
+        "events_url": str(request.url_for("stream_job_events", job_id=job.id)),
+    }
+
+
+@app.get("/jobs/{job_id}")
+async def get_job(job_id: str):
+    return _get_job(job_id).to_dict()
+
+
+@app.get("/jobs/{job_id}/events")
+async def stream_job_events(job_id: str):
+    """
+    Streams the job's progress as server-sent events: the job, stage and
+    task events so far, then every new one until the job finishes.
+    """
+    job = _get_job(job_id)
+
+    async def event_stream():
+        async for event in jobs.subscribe(job):
+            yield f"event: {event['event']}\ndata: {json.dumps(event, default=str)}\n\n"
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """
+    Queue and worker metrics in the Prometheus text exposition format.
+    """
+    values = jobs.metrics()
+    gauges = [
+        ("job_queue_depth", "Jobs waiting for a worker.", values["queue_depth"]),
+        ("job_queue_capacity", "Jobs the queue holds before answering 429.", values["queue_capacity"]),
+        ("job_workers", "Worker processes.", values["workers"]),
+        ("job_workers_busy", "Worker processes running a job.", values["workers_busy"]),
+        ("job_worker_utilization", "Share of worker time spent on jobs since startup.", values["worker_utilization"]),
+    ]
+
+    lines = []
+    for name, help_text, value in gauges:
+        lines.append(f"# HELP {METRIC_PREFIX}_{name} {help_text}")
+        lines.append(f"# TYPE {METRIC_PREFIX}_{name} gauge")
+        lines.append(f"{METRIC_PREFIX}_{name} {value}")
+
+    lines.append(f"# HELP {METRIC_PREFIX}_jobs_total Jobs by outcome since startup.")
+    lines.append(f"# TYPE {METRIC_PREFIX}_jobs_total counter")
+    for outcome, count in values["jobs"].items():
+        lines.append(f'{METRIC_PREFIX}_jobs_total{{outcome="{outcome}"}} {count}')
+    return "\n".join(lines) + "\n"
+
+
+@app.get("/health")
+async def health():
+    return {"status": "ok", **jobs.metrics()}
+
+
+def serve(host: str | None = None, port: int | None = None):
+    import uvicorn
+
+    uvicorn.run(app, host=host or settings.SERVER_HOST, port=port or settings.SERVER_PORT)
@@ -0,0 +1,250 @@
+import asyncio
+import multiprocessing
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+
+from ..config.logger import logger
+from .worker import init_worker, run_job, warm_up
+
+TERMINAL_STATUSES = ("completed", "failed")
+# Events that end a job's progress stream
+FINAL_EVENTS = ("job_completed", "job_failed")
+
+
+class QueueFull(Exception):
+    """Raised when a job is submitted while the queue is at capacity."""
+
+
+@dataclass
+class Job:
+    id: str
+    brief: dict
+    status: str = "queued"  # queued, running, completed or failed
+    fresh: bool = False  # Run every stage again instead of resuming from checkpoints
+    result: dict | None = None
+    error: str | None = None
+    created_at: float = field(default_factory=time.time)
+    started_at: float | None = None
+    finished_at: float | None = None
+    events: list[dict] = field(default_factory=list)
+    subscribers: set = field(default_factory=set)
+
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "status": self.status,
+            "fresh": self.fresh,
+            "product_name": self.brief.get("product_name"),
+            "result": self.result,
+            "error": self.error,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+        }
+
+
+class JobManager:
+    """
+    Queues briefs and runs them in a pool of worker processes, since a crew
+    kickoff blocks for minutes. The queue is bounded: once `queue_size` jobs
+    are waiting, submit() raises QueueFull instead of accepting more work.
+
+    Workers send progress events over a multiprocessing queue. A reader
+    thread hands them to the event loop, which keeps each job's event
+    history and fans it out to every subscriber.
+    """
+
+    def __init__(self, workers: int, queue_size: int, history_size: int = 1000):
+        self.workers = max(1, workers)
+        self.queue_size = max(1, queue_size)
+        self.history_size = history_size
+        self.logger = logger
+
+        self.jobs: OrderedDict[str, Job] = OrderedDict()
+        self._queue: asyncio.Queue | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._context = multiprocessing.get_context("spawn")
+        self._events = None
+        self._pool: ProcessPoolExecutor | None = None
+        self._dispatchers: list[asyncio.Task] = []
+        self._reader: threading.Thread | None = None
+
+        self._busy = 0
+        self._busy_seconds = 0.0
+        self._started_at = time.time()
+        self._counts = {"submitted": 0, "rejected": 0, "completed": 0, "failed": 0}
+
+    async def start(self):
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        self._events = self._context.Queue()
+        self._pool = self._new_pool()
+        for _ in range(self.workers):
+            self._pool.submit(warm_up)
+        self._reader = threading.Thread(target=self._read_events, name="job-events", daemon=True)
+        self._reader.start()
+        self._dispatchers = [asyncio.create_task(self._dispatch()) for _ in range(self.workers)]
+        self._started_at = time.time()
+        self.logger.info(f"Job server started with {self.workers} workers and a queue of {self.queue_size}.")
+
+    async def stop(self):
+        for task in self._dispatchers:
+            task.cancel()
+        await asyncio.gather(*self._dispatchers, return_exceptions=True)
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self._events.put(None)  # Stops the reader thread
+        self._reader.join(timeout=5)
+
+    def _new_pool(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=self._context,
+            initializer=init_worker,
+            initargs=(self._events,),
+        )
+
+    def submit(self, brief: dict, fresh: bool = False) -> Job:
+        """
+        Queues a brief and returns its job. Raises QueueFull when the queue is at capacity.
+        """
+        job = Job(id=uuid.uuid4().hex, brief=brief, fresh=fresh)
+        try:
+            self._queue.put_nowait(job)
+        except asyncio.QueueFull:
+            self._counts["rejected"] += 1
+            raise QueueFull(f"The job queue is full ({self.queue_size} jobs waiting).") from None
+
+        self._counts["submitted"] += 1
+        self.jobs[job.id] = job
+        self._forget_old_jobs()
+        self._publish(job, {"event": "job_queued", "time": job.created_at})
+        return job
+
+    def _forget_old_jobs(self):
+        # Drops the oldest finished jobs, queued and running ones are skipped rather than waited for
+        excess = len(self.jobs) - self.history_size
+        if excess <= 0:
+            return
+        finished = [job_id for job_id, job in self.jobs.items() if job.status in TERMINAL_STATUSES]
+        for job_id in finished[:excess]:
+            del self.jobs[job_id]
+
+    async def _dispatch(self):
+        """
+        Feeds queued jobs to the pool, one at a time per worker process.
+        Every job ends as completed or failed, whatever interrupts it.
+        """
+        while True:
+            job = await self._queue.get()
+            job.status = "running"
+            job.started_at = time.time()
+            self._busy += 1
+            self._publish(job, {"event": "job_started", "time": job.started_at})
+            pool = self._pool
+            try:
+                job.result = await self._loop.run_in_executor(pool, run_job, job.id, job.brief, job.fresh)
+                job.status = "completed"
+            except BrokenProcessPool as e:
+                # A worker process died, the whole pool has to be replaced
+                job.status, job.error = "failed", f"Worker process crashed: {e}"
+                self.logger.error(f"Job {job.id} lost its worker process.")
+                self._replace_pool(pool)
+            except asyncio.CancelledError:
+                job.status, job.error = "failed", "The job was cancelled."
+                # Only stop when this dispatcher itself was cancelled, not just the job's future by a pool restart
+                if asyncio.current_task().cancelling():
+                    raise
+            except Exception as e:
+                job.status, job.error = "failed", str(e)
+            finally:
+                self._finish(job)
+
+    def _replace_pool(self, broken: ProcessPoolExecutor):
+        """
+        Replaces a pool one of whose workers died. Every dispatcher with a job
+        on it gets BrokenProcessPool, only the first one replaces it, so a new
+        pool that others have already submitted to is never shut down.
+        """
+        if self._pool is not broken:
+            return
+        self.logger.error("A worker process died. Restarting the pool.")
+        broken.shutdown(wait=False, cancel_futures=True)
+        self._pool = self._new_pool()
+
+    def _finish(self, job: Job):
+        if job.status not in TERMINAL_STATUSES:
+            job.status, job.error = "failed", job.error or "The job was interrupted."
+        job.finished_at = time.time()
+        self._busy -= 1
+        self._busy_seconds += job.finished_at - job.started_at
+        self._counts[job.status] += 1
+        self._queue.task_done()
+
+        final = {"event": "job_completed" if job.status == "completed" else "job_failed", "time": job.finished_at}
+        if job.status == "completed":
+            final["result_status"] = job.result.get("status")
+        else:
+            final["error"] = job.error
+        self._publish(job, final)
+
+    def _read_events(self):
+        while True:
+            event = self._events.get()
+            if event is None:
+                return
+            self._loop.call_soon_threadsafe(self._on_worker_event, event)
+
+    def _on_worker_event(self, event: dict):
+        job = self.jobs.get(event.pop("job_id", None))
+        # Late task events of a finished job are dropped
+        if job is not None and job.status == "running":
+            self._publish(job, event)
+
+    def _publish(self, job: Job, event: dict):
+        job.events.append(event)
+        for subscriber in job.subscribers:
+            subscriber.put_nowait(event)
+
+    async def subscribe(self, job: Job):
+        """
+        Yields the job's past events, then every new one until the job finishes.
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        history = list(job.events)
+        job.subscribers.add(queue)
+        try:
+            for event in history:
+                yield event
+            if history and history[-1]["event"] in FINAL_EVENTS:
+                return
+            while True:
+                event = await queue.get()
+                yield event
+                if event["event"] in FINAL_EVENTS:
+                    return
+        finally:
+            job.subscribers.discard(queue)
+
+    def metrics(self) -> dict:
+        """
+        Queue depth and worker utilization, for sizing the deployment.
+        Utilization is the share of worker time spent on jobs since startup.
+        """
+        now = time.time()
+        running = [job for job in self.jobs.values() if job.status == "running"]
+        busy_seconds = self._busy_seconds + sum(now - job.started_at for job in running)
+        uptime = max(now - self._started_at, 1e-9)
+        return {
+            "queue_depth": self._queue.qsize() if self._queue else 0,
+            "queue_capacity": self.queue_size,
+            "workers": self.workers,
+            "workers_busy": self._busy,
+            "worker_utilization": round(busy_seconds / (uptime * self.workers), 4),
+            "uptime_seconds": round(uptime, 1),
+            "jobs": dict(self._counts),
+        }
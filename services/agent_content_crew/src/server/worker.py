@@ -0,0 +1,110 @@
+import os
+import time
+
+from ..config.logger import logger, run_context
+from ..models.content_models import MarketingBrief
+from ..pipeline import ContentPipeline
+from ..publisher import campaign_id_for
+
+# Set once per worker process by init_worker
+_events = None
+_listener = None
+# A worker process runs one job at a time. Left set after the job, since crewAI
+# may still deliver its last task events from the event bus thread pool.
+_current_job_id: str | None = None
+
+
+def emit(event: str, **data):
+    """
+    Sends a progress event for the current job back to the server process.
+    """
+    if _events is not None and _current_job_id is not None:
+        _events.put({"job_id": _current_job_id, "event": event, "time": time.time(), **data})
+
+
+def init_worker(events):
+    """
+    Process pool initializer. Keeps the queue progress events are sent on and
+    subscribes to crewAI's task events, so every task start and finish is reported.
+    """
+    global _events, _listener
+    _events = events
+    if _listener is None:
+        _listener = _create_listener()
+
+
+def warm_up() -> int:
+    """
+    No-op job, submitted once per worker at startup so the processes are
+    spawned and have imported crewAI before the first real job arrives.
+    """
+    return os.getpid()
+
+
+def _create_listener():
+    from crewai.events import BaseEventListener
+    from crewai.events.types.task_events import TaskCompletedEvent, TaskFailedEvent, TaskStartedEvent
+
+    class ProgressListener(BaseEventListener):
+        """
+        Forwards crewAI task events of the running job to the server.
+        """
+
+        def setup_listeners(self, crewai_event_bus):
+            @crewai_event_bus.on(TaskStartedEvent)
+            def on_task_started(source, event):
+                emit("task_started", task=_task_name(event.task))
+
+            @crewai_event_bus.on(TaskCompletedEvent)
+            def on_task_completed(source, event):
+                emit("task_completed", task=_task_name(event.task))
+
+            @crewai_event_bus.on(TaskFailedEvent)
+            def on_task_failed(source, event):
+                emit("task_failed", task=_task_name(event.task), error=str(event.error))
+
+    return ProgressListener()
+
+
+def _task_name(task) -> str:
+    return getattr(task, "name", None) or "task"
+
+
+def run_job(job_id: str, brief_data: dict, fresh: bool = False) -> dict:
+    """
+    Runs the whole pipeline for one brief inside a worker process.
+    Returns the same result record the batch runner writes.
+    """
+    global _current_job_id
+    _current_job_id = job_id
+    with run_context(job_id):
+        return _run_job(job_id, brief_data, fresh)
+
+
+def _run_job(job_id: str, brief_data: dict, fresh: bool = False) -> dict:
+    try:
+        pipeline = ContentPipeline(
+            show_spinner=False,
+            on_progress=lambda event, stage: emit(event, stage=stage),
+            fresh=fresh,
+        )
+        brief = MarketingBrief(**brief_data)
+        result = {"product_name": brief.product_name}
+
+        report = pipeline.run_validation(brief)
+        if report is None:
+            return {**result, "status": "validation_failed"}
+
+        result["validation_report"] = report.model_dump()
+        if not pipeline.passes_threshold(report):
+            return {**result, "status": "below_threshold"}
+
+        content = pipeline.run_content_generation(brief, report)
+        if content is None:
+            return {**result, "status": "content_failed"}
+
+        return {**result, "status": "completed", "campaign_id": campaign_id_for(brief), "content": content.model_dump()}
+    except Exception as e:
+        logger.error(f"Job {job_id} failed: {e}", exc_info=True)
+        # Not every library exception survives pickling back to the server process
+        raise RuntimeError(f"{type(e).__name__}: {e}") from None
@@ -0,0 +1,41 @@
+import mimetypes
+from abc import ABC, abstractmethod
+
+mimetypes.add_type("text/markdown", ".md")
+
+
+def guess_content_type(name: str) -> str:
+    return mimetypes.guess_type(name)[0] or "text/markdown"
+
+
+class StorageBackend(ABC):
+    """
+    Where published artifacts are kept. Object names are '/'-separated
+    paths, and every method must be safe to call from several threads.
+    """
+
+    name: str = "storage"
+
+    @abstractmethod
+    def put_text(self, object_name: str, content: str, content_type: str | None = None):
+        """
+        Stores `content` under `object_name`, replacing what was there. Raises on failure.
+        """
+
+    @abstractmethod
+    def get_text(self, object_name: str) -> str | None:
+        """
+        Returns the object's content, or None if there is no such object.
+        """
+
+    @abstractmethod
+    def list_names(self, prefix: str = "") -> list[str]:
+        """
+        Returns the names of every object under `prefix`, in one listing.
+        """
+
+    def location(self) -> str:
+        """
+        Where the objects go, for log messages.
+        """
+        return self.name
@@ -0,0 +1,37 @@
+import threading
+
+from ..config.settings import settings
+from .base import StorageBackend
+
+_storage: StorageBackend | None = None
+_lock = threading.Lock()
+
+
+def build_storage(backend: str) -> StorageBackend:
+    if backend == "minio":
+        settings.require(
+            "MINIO_ENDPOINT", "MINIO_ACCESS_KEY", "MINIO_SECRET_KEY", "MINIO_BUCKET_NAME",
+            purpose="The 'minio' storage backend",
+        )
+        from .minio_storage import MinioStorage
+        return MinioStorage(settings.MINIO_BUCKET_NAME)
+    if backend == "local":
+        from .local_storage import LocalStorage
+        return LocalStorage(settings.STORAGE_LOCAL_DIR)
+    if backend == "memory":
+        from .memory_storage import MemoryStorage
+        return MemoryStorage()
+    raise ValueError(f"Unknown storage backend '{backend}', expected 'minio', 'local' or 'memory'")
+
+
+def get_storage() -> StorageBackend:
+    """
+    Returns the process-wide STORAGE_BACKEND, creating it on first use.
+    """
+    global _storage
+    if _storage is None:
+        with _lock:
+            if _storage is None:
+                _storage = build_storage(settings.STORAGE_BACKEND)
+    return _storage
+
@@ -0,0 +1,55 @@
+import os
+import tempfile
+from pathlib import Path
+
+from .base import StorageBackend
+
+
+class LocalStorage(StorageBackend):
+    """
+    Objects as files below a local directory, for offline runs and load
+    tests. Writes go to a temporary file first and are renamed into place,
+    so readers never see a half written object.
+    """
+
+    name = "local"
+
+    def __init__(self, root: str | Path):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, object_name: str) -> Path:
+        path = (self.root / object_name).resolve()
+        if not path.is_relative_to(self.root.resolve()):
+            raise ValueError(f"Object name '{object_name}' points outside of '{self.root}'")
+        return path
+
+    def put_text(self, object_name: str, content: str, content_type: str | None = None):
+        path = self._path(object_name)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(content)
+            os.replace(temp_path, path)
+        except BaseException:
+            Path(temp_path).unlink(missing_ok=True)
+            raise
+
+    def get_text(self, object_name: str) -> str | None:
+        try:
+            return self._path(object_name).read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None
+
+    def list_names(self, prefix: str = "") -> list[str]:
+        names = []
+        for path in self.root.rglob("*"):
+            if path.is_file() and not path.name.startswith("."):
+                name = path.relative_to(self.root).as_posix()
+                if name.startswith(prefix):
+                    names.append(name)
+        return sorted(names)
+
+    def location(self) -> str:
+        return f"directory '{self.root}'"
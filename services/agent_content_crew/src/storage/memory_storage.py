@@ -0,0 +1,32 @@
+import threading
+
+from .base import StorageBackend
+
+
+class MemoryStorage(StorageBackend):
+    """
+    Objects in a dict, gone when the process exits. Has no I/O at all, so
+    load tests measure the pipeline instead of the storage.
+    """
+
+    name = "memory"
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.objects: dict[str, tuple[str, str | None]] = {}
+
+    def put_text(self, object_name: str, content: str, content_type: str | None = None):
+        with self._lock:
+            self.objects[object_name] = (content, content_type)
+
+    def get_text(self, object_name: str) -> str | None:
+        with self._lock:
+            entry = self.objects.get(object_name)
+        return entry[0] if entry else None
+
+    def list_names(self, prefix: str = "") -> list[str]:
+        with self._lock:
+            return sorted(name for name in self.objects if name.startswith(prefix))
+
+    def location(self) -> str:
+        return "memory"
@@ -0,0 +1,59 @@
+import io
+
+from minio.error import S3Error
+
+from ..utils.minio_client import ensure_bucket, get_minio_client
+from ..utils.tracing import tracer
+from .base import StorageBackend, guess_content_type
+
+
+class MinioStorage(StorageBackend):
+    """
+    Objects in a MinIO (or any S3 compatible) bucket, over the process-wide
+    pooled client.
+    """
+
+    name = "minio"
+
+    def __init__(self, bucket_name: str):
+        self.bucket_name = bucket_name
+
+    def _client(self):
+        # Shared client, the bucket check only hits the server once per process
+        client = get_minio_client()
+        ensure_bucket(client, self.bucket_name)
+        return client
+
+    def put_text(self, object_name: str, content: str, content_type: str | None = None):
+        client = self._client()
+        content_bytes = content.encode("utf-8")
+        with tracer.span("minio", "put_object", object=object_name, bytes=len(content_bytes)):
+            client.put_object(
+                self.bucket_name,
+                object_name,
+                io.BytesIO(content_bytes),
+                len(content_bytes),
+                content_type=content_type or guess_content_type(object_name),
+            )
+
+    def get_text(self, object_name: str) -> str | None:
+        client = self._client()
+        try:
+            response = client.get_object(self.bucket_name, object_name)
+        except S3Error as e:
+            if e.code == "NoSuchKey":
+                return None
+            raise
+        try:
+            return response.read().decode("utf-8")
+        finally:
+            response.close()
+            response.release_conn()
+
+    def list_names(self, prefix: str = "") -> list[str]:
+        client = self._client()
+        with tracer.span("minio", "list_objects", prefix=prefix):
+            return [obj.object_name for obj in client.list_objects(self.bucket_name, prefix=prefix, recursive=True)]
+
+    def location(self) -> str:
+        return f"bucket '{self.bucket_name}'"
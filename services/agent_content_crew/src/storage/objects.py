@@ -0,0 +1,40 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from ..config.logger import propagate_context
+from ..config.settings import settings
+from .factory import get_storage
+
+
+def put_text_object(object_name: str, content: str):
+    """
+    Stores text content in the configured storage backend. Raises on failure.
+    """
+    get_storage().put_text(object_name, content)
+
+
+def list_object_names(prefix: str) -> list[str]:
+    """
+    Returns the names of every stored object under `prefix`, in one listing.
+    """
+    return get_storage().list_names(prefix)
+
+
+def put_text_objects(objects: dict[str, str]) -> dict[str, Exception | None]:
+    """
+    Uploads several text objects concurrently through a bounded thread pool.
+    Returns the error for each object name, or None if its upload succeeded.
+    """
+    if not objects:
+        return {}
+
+    def _put(item):
+        object_name, content = item
+        try:
+            put_text_object(object_name, content)
+            return object_name, None
+        except Exception as e:
+            return object_name, e
+
+    max_workers = max(1, min(settings.MINIO_UPLOAD_MAX_WORKERS, len(objects)))
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="minio-upload") as pool:
+        return dict(pool.map(propagate_context(_put), objects.items()))
@@ -1,3 +1,90 @@
+import re
+
 from crewai_tools import TavilySearchTool
 
-tavily_tool = TavilySearchTool()
\ No newline at end of file
+from ..config.logger import logger
+from ..config.settings import settings
+from ..utils.rate_limiter import acall_with_rate_limit, call_with_rate_limit, tavily_bucket
+from ..utils.sqlite_cache import SQLiteCache, make_cache_key
+from ..utils.tracing import tracer
+
+# Tool attributes that change the search results, and therefore belong in the cache key
+SEARCH_PARAMS = (
+    "search_depth",
+    "topic",
+    "time_range",
+    "days",
+    "max_results",
+    "include_domains",
+    "exclude_domains",
+    "include_answer",
+    "include_raw_content",
+    "include_images",
+    "max_content_length_per_result",
+)
+
+search_cache = SQLiteCache(
+    settings.CACHE_DIR / "search_cache.sqlite3",
+    max_entries=settings.SEARCH_CACHE_MAX_ENTRIES,
+    default_ttl=settings.SEARCH_CACHE_TTL_SECONDS,
+)
+
+
+def normalize_query(query: str) -> str:
+    """Collapses whitespace and case so near-identical queries share a cache entry."""
+    return re.sub(r"\s+", " ", query).strip().lower()
+
+
+class RateLimitedTavilySearchTool(TavilySearchTool):
+    """
+    TavilySearchTool that shares one Tavily quota between every agent and
+    crew in the process, and retries rate limited searches with backoff.
+    """
+
+    def _run(self, query: str) -> str:
+        return call_with_rate_limit(tavily_bucket(), super()._run, query)
+
+    async def _arun(self, query: str) -> str:
+        return await acall_with_rate_limit(tavily_bucket(), super()._arun, query)
+
+
+class CachedTavilySearchTool(RateLimitedTavilySearchTool):
+    """
+    TavilySearchTool backed by a persistent search cache.
+    The validator and researcher run overlapping queries for the same brief,
+    and reruns of a brief repeat them again, so identical searches are served
+    from the local cache instead of the Tavily API.
+    """
+
+    def _cache_key(self, query: str) -> str:
+        params = {name: getattr(self, name) for name in SEARCH_PARAMS}
+        return make_cache_key("tavily", normalize_query(query), params)
+
+    def _run(self, query: str) -> str:
+        key = self._cache_key(query)
+        cached = search_cache.get(key)
+        if cached is not None:
+            logger.debug(f"Search cache hit for '{query}'")
+            return cached
+
+        with tracer.span("tavily", "search"):
+            result = super()._run(query)
+        search_cache.set(key, result)
+        return result
+
+    async def _arun(self, query: str) -> str:
+        key = self._cache_key(query)
+        cached = search_cache.get(key)
+        if cached is not None:
+            logger.debug(f"Search cache hit for '{query}'")
+            return cached
+
+        with tracer.span("tavily", "search"):
+            result = await super()._arun(query)
+        search_cache.set(key, result)
+        return result
+
+
+# The Tavily client reads its key from the environment when the tool is created
+settings.export_api_key("TAVILY_API_KEY", purpose="The web search tool")
+tavily_tool = CachedTavilySearchTool() if settings.SEARCH_CACHE_ENABLED else RateLimitedTavilySearchTool()
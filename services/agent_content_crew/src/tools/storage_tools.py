@@ -1,63 +0,0 @@
-import io
-from typing import Type
-
-from minio import Minio
-from crewai.tools import BaseTool
-from pydantic import BaseModel, Field
-
-from ..config.settings import settings
-from ..config.logger import logger
-
-class MinioUploadToolInput(BaseModel):
-    """Input schema for MinioUploadTool."""
-    object_name: str = Field(..., description="The name of the object (file) to create in the MinIO bucket.")
-    content: str = Field(..., description="The text content to upload as the object.")
-
-# --- Tool 1: MinIO Upload Tool ---
-
-class MinioUploadTool(BaseTool):
-    name: str = "MinIO File Uploader"
-    description: str = "Uploads text content to a specified MinIO bucket as a new object (file)."
-    args_schema = Type[BaseModel] = MinioUploadToolInput
-
-    def _run(self, object_name: str, content: str) -> str:
-        try:
-            # Initialize MinIO client
-            client = Minio(
-                settings.MINIO_ENDPOINT,
-                access_key=settings.MINIO_ACCESS_KEY,
-                secret_key=settings.MINIO_SECRET_KEY.get_secret_value(),
-                secure=False # Set to True if using HTTPS
-            )
-            
-            bucket_name = settings.MINIO_BUCKET_NAME
-
-            # Check if bucket exists
-            found = client.bucket_exists(bucket_name)
-            if not found:
-                client.make_bucket(bucket_name)
-                logger.info(f"Bucket '{bucket_name}' did not exist. Created successfully.")
-            else:
-                logger.info(f"Bucket '{bucket_name}' already exists.")
-
-            # Convert string content to bytes
-            content_bytes = content.encode('utf-8')
-            content_stream = io.BytesIO(content_bytes)
-            content_length = len(content_bytes)
-
-            # Upload the object
-            client.put_object(
-                bucket_name,
-                object_name,
-                content_stream,
-                content_length,
-                content_type="text/markdown"
-            )
-
-            return f"Successfully uploaded '{object_name}' to bucket '{bucket_name}'."
-
-        except Exception as e:
-            return f"Error uploading to MinIO: {str(e)}"
-
-# Instantiate the tool so it can be imported in YAML
-minio_upload_tool = MinioUploadTool()
\ No newline at end of file
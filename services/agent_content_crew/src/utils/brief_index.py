@@ -0,0 +1,230 @@
+import hashlib
+import random
+import re
+import sqlite3
+import threading
+import time
+from array import array
+from dataclasses import dataclass
+from pathlib import Path
+
+from pydantic import BaseModel
+
+from ..config.settings import settings
+from ..models.validation_models import ValidationReport
+from .checkpoints import normalize_brief
+from .sqlite_cache import make_cache_key
+
+# Brief fields that identify a product idea, compared to find near-duplicates
+SIMILARITY_FIELDS = ("product_name", "category", "problem_statement", "usp")
+
+# 32 bands of 4 rows: briefs with a Jaccard similarity of about 0.5 or more
+# share a band with high probability, anything well below rarely does.
+NUM_PERMUTATIONS = 128
+BANDS = 32
+ROWS_PER_BAND = NUM_PERMUTATIONS // BANDS
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+# Fixed seed, signatures must stay comparable between processes and releases
+_rng = random.Random(2024)
+_PERMUTATIONS = [
+    (_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME))
+    for _ in range(NUM_PERMUTATIONS)
+]
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def _hash(text: str) -> int:
+    return int.from_bytes(hashlib.blake2b(text.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+def shingles(brief: BaseModel) -> set[str]:
+    """
+    Returns the word unigrams and bigrams of the identifying fields, lowercased.
+    """
+    data = brief.model_dump()
+    found = set()
+    for field in SIMILARITY_FIELDS:
+        words = TOKEN_PATTERN.findall(str(data.get(field) or "").lower())
+        found.update(words)
+        found.update(f"{a} {b}" for a, b in zip(words, words[1:]))
+    return found
+
+
+def minhash(items: set[str]) -> list[int]:
+    """
+    Returns the MinHash signature of a set of shingles.
+    """
+    if not items:
+        return [_MAX_HASH] * NUM_PERMUTATIONS
+    hashes = [_hash(item) for item in items]
+    return [
+        min(((a * h + b) % _MERSENNE_PRIME) & _MAX_HASH for h in hashes)
+        for a, b in _PERMUTATIONS
+    ]
+
+
+def band_buckets(signature: list[int]) -> list[int]:
+    """
+    Returns one LSH bucket per band. The band number is part of the hash, so
+    all buckets can live in a single indexed column.
+    """
+    buckets = []
+    for band in range(BANDS):
+        rows = signature[band * ROWS_PER_BAND:(band + 1) * ROWS_PER_BAND]
+        # Signed, so it fits SQLite's 64-bit INTEGER
+        buckets.append(_hash(f"{band}:{rows}") - (1 << 63))
+    return buckets
+
+
+def similarity(a: list[int], b: list[int]) -> float:
+    """
+    Estimates the Jaccard similarity of two MinHash signatures.
+    """
+    return sum(x == y for x, y in zip(a, b)) / NUM_PERMUTATIONS
+
+
+@dataclass
+class BriefMatch:
+    report: ValidationReport
+    similarity: float
+    product_name: str
+    created_at: float
+
+    @property
+    def age_hours(self) -> float:
+        return (time.time() - self.created_at) / 3600
+
+
+class BriefIndex:
+    """
+    A local MinHash/LSH index of validated briefs and their reports.
+
+    Only briefs that share at least one LSH bucket with the query are compared,
+    so a lookup touches a handful of rows however large the history grows.
+    Safe to share between threads and between processes.
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            str(self.path),
+            timeout=30,
+            check_same_thread=False,
+            isolation_level=None,  # autocommit, we manage transactions explicitly
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS briefs (
+                id INTEGER PRIMARY KEY,
+                fingerprint TEXT NOT NULL UNIQUE,
+                product_name TEXT NOT NULL,
+                signature BLOB NOT NULL,
+                report TEXT NOT NULL,
+                created_at REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS buckets (
+                bucket INTEGER NOT NULL,
+                brief_id INTEGER NOT NULL,
+                PRIMARY KEY (bucket, brief_id)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS idx_buckets_brief ON buckets (brief_id);
+            CREATE INDEX IF NOT EXISTS idx_briefs_created ON briefs (created_at);
+            """
+        )
+
+    def add(self, brief: BaseModel, report: ValidationReport):
+        """
+        Indexes a validated brief. Validating the same brief again replaces its report.
+        """
+        signature = minhash(shingles(brief))
+        fingerprint = make_cache_key(normalize_brief(brief, SIMILARITY_FIELDS))
+        blob = array("Q", signature).tobytes()
+
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute(
+                    "DELETE FROM buckets WHERE brief_id IN (SELECT id FROM briefs WHERE fingerprint = ?)",
+                    (fingerprint,),
+                )
+                self._conn.execute("DELETE FROM briefs WHERE fingerprint = ?", (fingerprint,))
+                brief_id = self._conn.execute(
+                    """
+                    INSERT INTO briefs (fingerprint, product_name, signature, report, created_at)
+                    VALUES (?, ?, ?, ?, ?)
+                    """,
+                    (fingerprint, brief.product_name, blob, report.model_dump_json(), time.time()),
+                ).lastrowid
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO buckets (bucket, brief_id) VALUES (?, ?)",
+                    [(bucket, brief_id) for bucket in band_buckets(signature)],
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def find(self, brief: BaseModel, min_similarity: float, max_age_seconds: float | None = None) -> BriefMatch | None:
+        """
+        Returns the most similar indexed brief at or above `min_similarity`
+        that is no older than `max_age_seconds`, or None.
+        """
+        signature = minhash(shingles(brief))
+        buckets = band_buckets(signature)
+        cutoff = time.time() - max_age_seconds if max_age_seconds else 0
+
+        with self._lock:
+            rows = self._conn.execute(
+                f"""
+                SELECT product_name, signature, report, created_at FROM briefs
+                WHERE created_at >= ? AND id IN (
+                    SELECT brief_id FROM buckets WHERE bucket IN ({",".join("?" * len(buckets))})
+                )
+                """,
+                (cutoff, *buckets),
+            ).fetchall()
+
+        best = None
+        for product_name, blob, report, created_at in rows:
+            score = similarity(signature, array("Q", blob).tolist())
+            if score >= min_similarity and (best is None or score > best[0]):
+                best = (score, product_name, report, created_at)
+
+        if best is None:
+            return None
+        score, product_name, report, created_at = best
+        return BriefMatch(ValidationReport.model_validate_json(report), score, product_name, created_at)
+
+    def prune(self, max_age_seconds: float) -> int:
+        """
+        Removes briefs older than `max_age_seconds` and returns how many were removed.
+        """
+        cutoff = time.time() - max_age_seconds
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute(
+                    "DELETE FROM buckets WHERE brief_id IN (SELECT id FROM briefs WHERE created_at < ?)", (cutoff,)
+                )
+                removed = self._conn.execute("DELETE FROM briefs WHERE created_at < ?", (cutoff,)).rowcount
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return removed
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM briefs").fetchone()[0]
+
+
+brief_index = BriefIndex(
+    settings.CACHE_DIR / "brief_index.sqlite3"
+) if settings.VALIDATION_REUSE != "off" else None
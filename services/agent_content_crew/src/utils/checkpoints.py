@@ -0,0 +1,91 @@
+import re
+
+from pydantic import BaseModel, ValidationError
+
+from ..config.logger import logger
+from ..config.settings import settings
+from .sqlite_cache import SQLiteCache, make_cache_key
+
+
+def normalize_brief(brief: BaseModel, fields=None) -> dict:
+    """
+    Returns the brief's fields (or only `fields`) with empty values dropped and
+    whitespace collapsed, so cosmetic edits do not change its fingerprint.
+    """
+    def normalize(value):
+        if isinstance(value, str):
+            return re.sub(r"\s+", " ", value).strip()
+        if isinstance(value, list):
+            return [normalize(item) for item in value if normalize(item) not in ("", None)]
+        return value
+
+    data = {
+        name: normalize(value) for name, value in brief.model_dump().items()
+        if fields is None or name in fields
+    }
+    return {name: value for name, value in data.items() if value not in (None, "", [])}
+
+
+def fingerprint(model: BaseModel) -> str:
+    return make_cache_key(model.model_dump(mode="json"))
+
+
+class CheckpointStore:
+    """
+    Keeps the typed output of every pipeline stage, so a failed or interrupted
+    run resumes from the first stage that did not finish.
+
+    A checkpoint is keyed by the stage, the brief fields the stage reads, the
+    stage's model configuration and the output of the stage before it. Changing
+    any of those starts that stage, and every stage after it, from scratch.
+    """
+
+    def __init__(self, cache: SQLiteCache):
+        self.cache = cache
+
+    def key(
+        self,
+        stage: str,
+        brief: BaseModel,
+        model_config: dict,
+        upstream: BaseModel | None = None,
+        fields=None,
+    ) -> str:
+        """
+        `fields` limits the brief to the fields the stage reads, so editing any
+        other field keeps the checkpoint valid. None uses the whole brief.
+        """
+        return make_cache_key(
+            "checkpoint",
+            stage,
+            normalize_brief(brief, fields),
+            model_config,
+            fingerprint(upstream) if upstream is not None else None,
+        )
+
+    def load(self, key: str, output_model: type[BaseModel]) -> BaseModel | None:
+        raw = self.cache.get(key)
+        if raw is None:
+            return None
+        try:
+            return output_model.model_validate_json(raw)
+        except ValidationError as e:
+            # Written by an older version of the model, treat it as missing
+            logger.warning(f"Discarding an unreadable checkpoint: {e}")
+            self.cache.delete(key)
+            return None
+
+    def save(self, key: str, output: BaseModel):
+        self.cache.set(key, output.model_dump_json())
+
+    def discard(self, keys):
+        for key in keys:
+            self.cache.delete(key)
+
+
+checkpoints = CheckpointStore(
+    SQLiteCache(
+        settings.CACHE_DIR / "checkpoints.sqlite3",
+        default_ttl=settings.CHECKPOINT_TTL_SECONDS or None,
+    )
+) if settings.CHECKPOINTS_ENABLED else None
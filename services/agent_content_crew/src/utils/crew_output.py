@@ -0,0 +1,82 @@
+import io
+import threading
+import time
+
+from crewai.events.event_listener import event_listener
+from rich.console import Console
+from rich.tree import Tree
+
+from ..config.logger import logger
+
+# Width verbose crew output is rendered at when it goes into log records
+LOG_RECORD_WIDTH = 120
+
+
+class OutputSampler:
+    """
+    Lets at most `max_per_second` blocks through in every one-second window
+    and counts the rest. 0 lets everything through.
+    """
+
+    def __init__(self, max_per_second: float):
+        self.max_per_second = max_per_second
+        self.skipped = 0
+        self._lock = threading.Lock()
+        self._window = 0
+        self._shown_in_window = 0
+        self._skipped_since_shown = 0
+
+    def allow(self) -> tuple[bool, int]:
+        """
+        Returns whether to show the next block and, if so, how many blocks were skipped before it.
+        """
+        with self._lock:
+            window = int(time.monotonic())
+            if window != self._window:
+                self._window, self._shown_in_window = window, 0
+            if self.max_per_second > 0 and self._shown_in_window >= self.max_per_second:
+                self.skipped += 1
+                self._skipped_since_shown += 1
+                return False, 0
+            self._shown_in_window += 1
+            skipped, self._skipped_since_shown = self._skipped_since_shown, 0
+            return True, skipped
+
+
+def _render(*args, **kwargs) -> str:
+    buffer = io.StringIO()
+    Console(file=buffer, width=LOG_RECORD_WIDTH, no_color=True, force_terminal=False).print(*args, **kwargs)
+    return buffer.getvalue().strip()
+
+
+def sample_crew_output(max_per_second: float, as_log_records: bool = False) -> OutputSampler:
+    """
+    Routes CrewAI's verbose console output through an OutputSampler, so
+    concurrent crews cannot flood the terminal. With `as_log_records` the
+    panels become log records instead, tagged with the run id like every
+    other record, and the live crew trees are left out.
+    """
+    formatter = event_listener.formatter
+    console_print = formatter.print
+    sampler = OutputSampler(max_per_second)
+
+    def sampled_print(*args, **kwargs):
+        live_tree = len(args) == 1 and isinstance(args[0], Tree)
+        if as_log_records and (live_tree or not args):
+            return
+
+        shown, skipped = sampler.allow()
+        if not shown:
+            return
+        if skipped:
+            logger.info(f"Skipped {skipped} verbose crew output blocks.")
+
+        if as_log_records:
+            text = _render(*args, **kwargs)
+            if text:
+                logger.info(text, extra={"source": "crew"})
+        else:
+            console_print(*args, **kwargs)
+
+    formatter.print = sampled_print
+    return sampler
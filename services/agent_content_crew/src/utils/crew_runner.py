@@ -1,18 +1,43 @@
-from halo import Halo
 from ..config.logger import logger
+from .tracing import tracer
 
-def run_crew(crew, inputs, start_text, success_text, failure_text):
+
+def _kickoff(crew, inputs):
+    # One span per crew run, with the token usage crewAI reports for it
+    with tracer.span("crew", getattr(crew, "name", None) or "crew") as attributes:
+        result = crew.kickoff(inputs=inputs)
+        usage = getattr(result, "token_usage", None)
+        if usage is not None:
+            attributes["prompt_tokens"] = usage.prompt_tokens
+            attributes["completion_tokens"] = usage.completion_tokens
+            attributes["llm_requests"] = usage.successful_requests
+        return result
+
+def run_crew(crew, inputs, start_text, success_text, failure_text, show_spinner=True):
     """
         Runs a crew.kickoff() method.
         Handles success, failure, and exceptions.
+        The spinner can be turned off when several crews share the terminal.
     """
+    if not show_spinner:
+        logger.info(start_text)
+        try:
+            result = _kickoff(crew, inputs)
+            logger.info(success_text)
+            return result
+        except Exception as e:
+            logger.error(f"{failure_text}: {e}", exc_info=True)
+            return None
+
+    from halo import Halo
+
     spinner = Halo(text=start_text, spinner='dots')
     try:
         spinner.start()
-        result = crew.kickoff(inputs=inputs)
+        result = _kickoff(crew, inputs)
         spinner.succeed(success_text)
         return result
     except Exception as e:
         spinner.fail(f"{failure_text}: {e}")
         logger.error(f"Error running crew: {e}", exc_info=True)
-        return None
\ No newline at end of file
+        return None
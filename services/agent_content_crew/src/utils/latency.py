@@ -0,0 +1,73 @@
+import threading
+from collections import deque
+
+from ..config.settings import settings
+
+
+def percentile(samples, p: float) -> float | None:
+    """
+    Returns the `p`th percentile (0-100) of `samples` by nearest rank, or None if there are none.
+    """
+    ordered = sorted(samples)
+    if not ordered:
+        return None
+    rank = max(0, min(len(ordered) - 1, round(p / 100 * len(ordered)) - 1))
+    return ordered[rank]
+
+
+class ModelLatency:
+    """
+    Keeps a rolling window of call latencies per model, plus how often each
+    model failed, was hedged against and won a hedged race.
+    """
+
+    def __init__(self, window: int = 200):
+        self.window = window
+        self._lock = threading.Lock()
+        self._samples: dict[str, deque] = {}
+        self._counters: dict[str, dict[str, int]] = {}
+
+    def _counter(self, model: str) -> dict[str, int]:
+        return self._counters.setdefault(model, {"calls": 0, "errors": 0, "invalid": 0, "hedged": 0, "wins": 0})
+
+    def record(self, model: str, seconds: float, outcome: str = "ok"):
+        """
+        Records one finished call. `outcome` is 'ok', 'error' or 'invalid'.
+        """
+        with self._lock:
+            self._samples.setdefault(model, deque(maxlen=self.window)).append(seconds)
+            counter = self._counter(model)
+            counter["calls"] += 1
+            if outcome == "error":
+                counter["errors"] += 1
+            elif outcome == "invalid":
+                counter["invalid"] += 1
+
+    def count(self, model: str, name: str):
+        with self._lock:
+            self._counter(model)[name] += 1
+
+    def percentile(self, model: str, p: float, min_samples: int = 1) -> float | None:
+        with self._lock:
+            samples = list(self._samples.get(model, ()))
+        return percentile(samples, p) if len(samples) >= min_samples else None
+
+    def stats(self) -> dict:
+        """
+        Returns p50/p95/p99 latency and the counters of every model seen so far.
+        """
+        with self._lock:
+            samples = {model: list(values) for model, values in self._samples.items()}
+            counters = {model: dict(values) for model, values in self._counters.items()}
+
+        stats = {}
+        for model, counter in counters.items():
+            values = samples.get(model, [])
+            stats[model] = {
+                **counter,
+                **{f"p{p}_s": round(percentile(values, p), 2) if values else None for p in (50, 95, 99)},
+            }
+        return stats
+
+
+model_latency = ModelLatency(settings.LLM_LATENCY_WINDOW)
@@ -0,0 +1,91 @@
+import os
+import threading
+
+import certifi
+import urllib3
+from minio import Minio
+from minio.error import S3Error
+
+from ..config.logger import logger
+from ..config.settings import settings
+
+_client: Minio | None = None
+_client_lock = threading.Lock()
+
+_known_buckets: set[str] = set()
+_bucket_lock = threading.Lock()
+
+
+def _build_http_client() -> urllib3.PoolManager:
+    """
+    Builds the shared urllib3 pool. Connections are HTTP/1.1 keep-alive, so
+    consecutive uploads reuse the same TCP (and TLS) session.
+    """
+    timeout = settings.MINIO_TIMEOUT_SECONDS
+    return urllib3.PoolManager(
+        maxsize=settings.MINIO_POOL_MAXSIZE,
+        block=True,  # wait for a free connection instead of opening throwaway ones
+        timeout=urllib3.Timeout(connect=timeout, read=timeout),
+        cert_reqs="CERT_REQUIRED",
+        ca_certs=os.environ.get("SSL_CERT_FILE") or certifi.where(),
+        retries=urllib3.Retry(
+            total=5,
+            backoff_factor=0.2,
+            status_forcelist=[500, 502, 503, 504],
+        ),
+    )
+
+
+def get_minio_client() -> Minio:
+    """
+    Returns the process-wide MinIO client, creating it on first use.
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = Minio(
+                    settings.MINIO_ENDPOINT,
+                    access_key=settings.MINIO_ACCESS_KEY,
+                    secret_key=settings.MINIO_SECRET_KEY.get_secret_value(),
+                    secure=settings.MINIO_SECURE,
+                    http_client=_build_http_client(),
+                )
+    return _client
+
+
+def ensure_bucket(client: Minio, bucket_name: str):
+    """
+    Creates the bucket if it does not exist yet.
+    The check runs once per bucket and process, later calls return immediately.
+    """
+    if bucket_name in _known_buckets:
+        return
+
+    with _bucket_lock:
+        if bucket_name in _known_buckets:
+            return
+
+        if client.bucket_exists(bucket_name):
+            logger.info(f"Bucket '{bucket_name}' already exists.")
+        else:
+            try:
+                client.make_bucket(bucket_name)
+                logger.info(f"Bucket '{bucket_name}' did not exist. Created successfully.")
+            except S3Error as e:
+                # Another worker may have created it between the check and the create
+                if e.code not in ("BucketAlreadyOwnedByYou", "BucketAlreadyExists"):
+                    raise
+
+        _known_buckets.add(bucket_name)
+
+
+def _reset_after_fork():
+    # Pooled sockets must not be shared with a forked child process
+    global _client, _client_lock, _bucket_lock
+    _client = None
+    _client_lock = threading.Lock()
+    _bucket_lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_reset_after_fork)
@@ -0,0 +1,290 @@
+import ast
+import json
+import re
+import threading
+from typing import Any, Literal, get_args, get_origin
+
+from pydantic import BaseModel, ValidationError
+
+PYTHON_LITERAL_PATTERN = re.compile(r"(True|False|None)\b")
+PYTHON_TO_JSON_LITERALS = {"True": "true", "False": "false", "None": "null"}
+NUMBER_PATTERN = re.compile(r"-?\d+(?:\.\d+)?")
+BULLET_PATTERN = re.compile(r"^\s*(?:[-*•]|\d+[.)])\s*")
+
+# Fix-up rounds before giving up, each round can only make the output smaller or more typed
+MAX_REPAIR_ROUNDS = 5
+# Opening braces tried as the start of the JSON object
+MAX_JSON_CANDIDATES = 5
+
+
+def _relax(raw: str) -> str:
+    """
+    Drops trailing commas and turns Python's True/False/None into JSON,
+    leaving the contents of strings alone.
+    """
+    out = []
+    in_string = escaped = False
+    i = 0
+    while i < len(raw):
+        char = raw[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == ",":
+            rest = raw[i + 1:].lstrip()
+            if rest[:1] in ("}", "]"):
+                i += 1
+                continue
+        else:
+            match = PYTHON_LITERAL_PATTERN.match(raw, i)
+            if match and not (i and (raw[i - 1].isalnum() or raw[i - 1] == "_")):
+                out.append(PYTHON_TO_JSON_LITERALS[match.group(1)])
+                i = match.end()
+                continue
+        out.append(char)
+        i += 1
+    return "".join(out)
+
+
+def _object_end(text: str, start: int) -> int | None:
+    """
+    Index just past the object that opens at `start`, or None if it is never closed.
+    """
+    depth = 0
+    in_string = escaped = False
+    for i in range(start, len(text)):
+        char = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char in "{[":
+            depth += 1
+        elif char in "}]":
+            depth -= 1
+            if depth == 0:
+                return i + 1
+    return None
+
+
+def loads_lenient(raw: str) -> Any:
+    """
+    Parses JSON, falling back to a relaxed parse that accepts trailing
+    commas, Python literals and single quotes. Returns None if nothing works.
+    """
+    for candidate in (raw, _relax(raw)):
+        try:
+            return json.loads(candidate, strict=False)
+        except json.JSONDecodeError:
+            pass
+    try:
+        return ast.literal_eval(raw)
+    except (ValueError, SyntaxError, MemoryError, RecursionError):
+        return None
+
+
+def extract_json(text: str) -> tuple[Any, bool]:
+    """
+    Finds the first JSON object in a model's answer, inside or outside a code
+    fence, and parses it leniently. Returns the data and whether anything
+    other than plain JSON had to be dealt with. Only the text around the
+    object is dropped, fences inside its string values (e.g. code blocks in
+    a blog post) are kept as they are. Truncated objects are not closed, a
+    cut-off answer has to be regenerated.
+    """
+    stripped = text.strip()
+    try:
+        return json.loads(stripped, strict=False), False
+    except json.JSONDecodeError:
+        pass
+
+    start = stripped.find("{")
+    for _ in range(MAX_JSON_CANDIDATES):
+        if start == -1:
+            break
+        end = _object_end(stripped, start)
+        if end is None:
+            break
+        data = loads_lenient(stripped[start:end])
+        if isinstance(data, dict):
+            return data, True
+        start = stripped.find("{", start + 1)
+    return None, True
+
+
+def _annotation_at(model: type[BaseModel], loc: tuple) -> Any:
+    """
+    The type annotation of the value at an error location, or None.
+    """
+    annotation: Any = model
+    for part in loc:
+        if isinstance(part, str) and isinstance(annotation, type) and issubclass(annotation, BaseModel):
+            field = annotation.model_fields.get(part)
+            if field is None:
+                return None
+            annotation = field.annotation
+        elif isinstance(part, int) and get_origin(annotation) in (list, tuple):
+            annotation = get_args(annotation)[0]
+        else:
+            return None
+    return annotation
+
+
+def _locate(data: Any, loc: tuple) -> tuple[Any, Any] | None:
+    """
+    The container and key of the value at an error location, or None.
+    """
+    if not loc:
+        return None
+    parent = data
+    for part in loc[:-1]:
+        try:
+            parent = parent[part]
+        except (KeyError, IndexError, TypeError):
+            return None
+    try:
+        parent[loc[-1]]
+    except (KeyError, IndexError, TypeError):
+        return None
+    return parent, loc[-1]
+
+
+def _fix(error: dict, model: type[BaseModel], data: Any) -> str | None:
+    """
+    Applies the safe fix for one validation error to `data` in place.
+    Returns the name of the fix, or None if the error cannot be fixed
+    without making up content.
+    """
+    location = _locate(data, error["loc"])
+    if location is None:
+        return None
+    parent, key = location
+    value, kind, ctx = parent[key], error["type"], error.get("ctx") or {}
+
+    if kind == "too_long" and isinstance(value, list):
+        parent[key] = value[:ctx["max_length"]]
+        return "trimmed_list"
+
+    if kind in ("greater_than_equal", "less_than_equal") and isinstance(value, (int, float)):
+        parent[key] = ctx["ge"] if kind == "greater_than_equal" else ctx["le"]
+        return "clamped_number"
+
+    if kind in ("int_parsing", "float_parsing", "int_from_float"):
+        # "85/100", "85%", 85.0
+        match = NUMBER_PATTERN.search(str(value))
+        if match is None:
+            return None
+        number = float(match.group())
+        parent[key] = round(number) if kind != "float_parsing" else number
+        return "parsed_number"
+
+    if kind == "literal_error" and isinstance(value, str):
+        annotation = _annotation_at(model, error["loc"])
+        choices = [choice for choice in get_args(annotation) if isinstance(choice, str)] \
+            if get_origin(annotation) is Literal else []
+        matches = [choice for choice in choices if choice.lower() == value.strip().lower()] or \
+            [choice for choice in choices if re.search(rf"\b{re.escape(choice.lower())}\b", value.lower())]
+        if len(matches) != 1:
+            return None
+        parent[key] = matches[0]
+        return "matched_literal"
+
+    if kind == "list_type" and isinstance(value, str):
+        items = [BULLET_PATTERN.sub("", line).strip() for line in value.splitlines()]
+        parent[key] = [item for item in items if item] or [value]
+        return "split_list"
+
+    if kind == "string_type" and isinstance(value, list) and all(isinstance(item, str) for item in value):
+        parent[key] = "\n".join(value)
+        return "joined_text"
+
+    return None
+
+
+def _unwrap(data: Any, model: type[BaseModel]) -> tuple[Any, bool]:
+    """
+    Unwraps {"ModelName": {...}} and [{...}] answers around the actual object.
+    """
+    if isinstance(data, list) and len(data) == 1 and isinstance(data[0], dict):
+        return data[0], True
+    if isinstance(data, dict) and len(data) == 1 and not data.keys() & model.model_fields.keys():
+        inner = next(iter(data.values()))
+        if isinstance(inner, dict):
+            return inner, True
+    return data, False
+
+
+def repair_output(text: str, model: type[BaseModel]) -> tuple[BaseModel | None, list[str]]:
+    """
+    Turns a model's answer into `model` without another LLM call: extracts
+    the JSON, parses it leniently and fixes what can be fixed safely, like
+    trimming an overlong list to its maximum or clamping a number into its
+    range. Returns the output (None if it cannot be repaired) and the names
+    of the fixes applied.
+    """
+    fixes: list[str] = []
+    data, extracted = extract_json(text)
+    if data is None:
+        return None, fixes
+    if extracted:
+        fixes.append("extracted_json")
+
+    data, unwrapped = _unwrap(data, model)
+    if unwrapped:
+        fixes.append("unwrapped")
+
+    for _ in range(MAX_REPAIR_ROUNDS):
+        try:
+            return model.model_validate(data), fixes
+        except ValidationError as e:
+            errors = e.errors()
+        for error in errors:
+            fix = _fix(error, model, data)
+            if fix is None:
+                return None, fixes
+            fixes.append(fix)
+    return None, fixes
+
+
+class OutputRepairStats:
+    """
+    Counts the answers repaired locally, by fix, and the ones that still
+    needed an LLM re-prompt.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.repaired = 0
+        self.reprompted = 0
+        self.fixes: dict[str, int] = {}
+
+    def record(self, fixes: list[str] | None):
+        """
+        Records one answer: its fixes, or None if it had to be re-prompted.
+        """
+        with self._lock:
+            if fixes is None:
+                self.reprompted += 1
+                return
+            self.repaired += 1
+            for fix in fixes:
+                self.fixes[fix] = self.fixes.get(fix, 0) + 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"repaired": self.repaired, "reprompted": self.reprompted, "fixes": dict(self.fixes)}
+
+
+output_repairs = OutputRepairStats()
+
@@ -0,0 +1,185 @@
+import json
+import re
+import threading
+from functools import lru_cache
+
+from pydantic import BaseModel
+
+from ..crew import crew_templates
+
+try:
+    import tiktoken
+except ImportError:  # Optional, token counts fall back to a character estimate
+    tiktoken = None
+
+# Same placeholder syntax crewAI interpolates, JSON braces are left alone
+PLACEHOLDER_PATTERN = re.compile(r"\{([A-Za-z_][A-Za-z0-9_]*)\}")
+
+TASK_TEXT_FIELDS = ("description", "expected_output")
+AGENT_TEXT_FIELDS = ("role", "goal", "backstory")
+
+NOT_SPECIFIED = "not specified"
+
+CHARS_PER_TOKEN = 4
+TOKEN_ENCODING = "cl100k_base"
+
+
+def _placeholders(config, fields: tuple[str, ...]) -> set[str]:
+    found = set()
+    for field in fields:
+        value = config.get(field)
+        if isinstance(value, str):
+            found.update(PLACEHOLDER_PATTERN.findall(value))
+    return found
+
+
+@lru_cache(maxsize=None)
+def task_placeholders(task_name: str) -> frozenset[str]:
+    """
+    Returns every placeholder a task's prompt needs, including the ones in
+    the role, goal and backstory of the agent assigned to it.
+    """
+    task = crew_templates.tasks[task_name]
+    found = _placeholders(task.config, TASK_TEXT_FIELDS)
+    found |= _placeholders(crew_templates.agents[task.agent].config, AGENT_TEXT_FIELDS)
+    return frozenset(found)
+
+
+def fields_read_by(task_names) -> frozenset[str]:
+    """
+    Returns every input the given tasks read.
+    """
+    found = set()
+    for task_name in task_names:
+        found |= task_placeholders(task_name)
+    return frozenset(found)
+
+
+def format_value(value) -> str | int | float:
+    """
+    Renders a single input value the way it should read inside a prompt.
+    Empty values become 'not specified', lists are joined on one line and
+    nested data is dumped as compact JSON without empty fields.
+    """
+    if isinstance(value, BaseModel):
+        value = value.model_dump(exclude_none=True)
+
+    if value is None or value == "" or value == [] or value == {}:
+        return NOT_SPECIFIED
+    if isinstance(value, bool):
+        return "yes" if value else "no"
+    if isinstance(value, (int, float)):
+        return value
+    if isinstance(value, str):
+        return value.strip()
+    if isinstance(value, (list, tuple)) and all(isinstance(item, str) for item in value):
+        return "; ".join(item.strip() for item in value if item.strip()) or NOT_SPECIFIED
+    return json.dumps(_drop_empty(value), ensure_ascii=False, separators=(",", ":"))
+
+
+def _drop_empty(value):
+    if isinstance(value, dict):
+        return {k: _drop_empty(v) for k, v in value.items() if v not in (None, "", [], {})}
+    if isinstance(value, (list, tuple)):
+        return [_drop_empty(item) for item in value]
+    return value
+
+
+def build_task_inputs(task_names, values: dict, extra: dict | None = None) -> dict:
+    """
+    Builds the kickoff inputs for a crew running `task_names`.
+
+    Only the values referenced by those tasks (and their agents) are passed,
+    each rendered with `format_value`. A referenced value that is missing is
+    rendered as 'not specified'. `extra` entries are passed through as-is.
+    """
+    inputs = {name: format_value(values.get(name)) for name in sorted(fields_read_by(task_names))}
+    inputs.update(extra or {})
+    return inputs
+
+
+def render_task_template(task_name: str, inputs: dict) -> str:
+    """
+    Renders the text of a task and its agent from the templates with the
+    given inputs, the same way crewAI interpolates them at kickoff.
+    """
+    task = crew_templates.tasks[task_name]
+    task_config, agent_config = task.config, crew_templates.agents[task.agent].config
+
+    def interpolate(text) -> str:
+        if not isinstance(text, str):
+            return ""
+        return PLACEHOLDER_PATTERN.sub(
+            lambda m: str(inputs[m.group(1)]) if m.group(1) in inputs else m.group(0), text
+        )
+
+    parts = [interpolate(agent_config.get(field)) for field in AGENT_TEXT_FIELDS]
+    parts += [interpolate(task_config.get(field)) for field in TASK_TEXT_FIELDS]
+    return "\n".join(part for part in parts if part)
+
+
+@lru_cache(maxsize=1)
+def _encoding():
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.get_encoding(TOKEN_ENCODING)
+    except Exception:  # The encoding file may not be downloadable offline
+        return None
+
+
+def count_tokens(text: str) -> int:
+    """
+    Counts the tokens in `text` with tiktoken when it is available,
+    otherwise estimates them from the character count.
+    """
+    encoding = _encoding()
+    if encoding is not None:
+        return len(encoding.encode(text, disallowed_special=()))
+    return max(1, len(text) // CHARS_PER_TOKEN) if text else 0
+
+
+class TemplateTokenCounter:
+    """
+    Keeps per-task statistics of the rendered template sizes for this process.
+
+    These cover only the task and agent text from the YAML templates, which
+    the inputs change. CrewAI wraps them in a system prompt, tool schemas and
+    output format instructions, so the prompts it sends are larger. The
+    'prompt_tokens' of the traced LLM spans count the messages actually sent.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._tasks: dict[str, dict] = {}
+
+    def record(self, task_name: str, tokens: int):
+        with self._lock:
+            stats = self._tasks.setdefault(task_name, {"renders": 0, "total_tokens": 0, "max_tokens": 0})
+            stats["renders"] += 1
+            stats["total_tokens"] += tokens
+            stats["max_tokens"] = max(stats["max_tokens"], tokens)
+
+    def stats(self) -> dict:
+        """
+        Returns the render count, total, average and max tokens per task.
+        """
+        with self._lock:
+            return {
+                task_name: {**stats, "avg_tokens": round(stats["total_tokens"] / stats["renders"])}
+                for task_name, stats in self._tasks.items()
+            }
+
+
+template_tokens = TemplateTokenCounter()
+
+
+def record_template_tokens(task_names, inputs: dict) -> dict[str, int]:
+    """
+    Renders each task's templates, records their token count and returns the counts.
+    """
+    counts = {}
+    for task_name in task_names:
+        counts[task_name] = count_tokens(render_task_template(task_name, inputs))
+        template_tokens.record(task_name, counts[task_name])
+    return counts
@@ -0,0 +1,280 @@
+import asyncio
+import contextvars
+import random
+import re
+import threading
+import time
+from contextlib import contextmanager
+
+from ..config.logger import logger
+from ..config.settings import settings
+
+# Messages providers use for rate limiting when no status code is attached
+RATE_LIMIT_MARKERS = ("rate limit", "ratelimit", "rate_limit", "resource_exhausted", "too many requests")
+
+# Spent quota or credit that waiting does not bring back, even when it comes with a 429
+QUOTA_EXHAUSTED_MARKERS = ("insufficient_quota", "exceeded your current quota", "billing", "usagelimitexceeded")
+
+# A 429 status in the message: "Error code: 429", "status_code=429", "'code': 429", "HTTP/1.1 429"
+STATUS_429_PATTERN = re.compile(r"\b(?:status(?:[_ ]?code)?|code|http(?:/\d(?:\.\d)?)?)[\s\"':=]*429\b", re.IGNORECASE)
+
+# "retry in 12.5s", "retryDelay': '12s'", "Retry-After: 30"
+RETRY_AFTER_PATTERN = re.compile(r"retry[\s_-]*(?:in|after|delay)[\"'\s:=]*(\d+(?:\.\d+)?)\s*(ms|s)?", re.IGNORECASE)
+
+
+class CallAbandoned(Exception):
+    """Raised instead of retrying a call that nobody waits for anymore."""
+
+
+class CallMeter:
+    """
+    Follows one logical call through call_with_rate_limit: the seconds it
+    spent waiting for slots and backing off, and whether the caller has
+    given up on it, e.g. because a hedged call to another model won.
+    """
+
+    def __init__(self):
+        self.waited_seconds = 0.0
+        self.abandoned = threading.Event()
+
+
+_call_meter: contextvars.ContextVar[CallMeter | None] = contextvars.ContextVar("call_meter", default=None)
+
+
+@contextmanager
+def metered_call(meter: CallMeter):
+    """
+    Reports the rate limited calls made inside the block to `meter`.
+    """
+    token = _call_meter.set(meter)
+    try:
+        yield meter
+    finally:
+        _call_meter.reset(token)
+
+
+def _check_abandoned(meter: CallMeter | None):
+    if meter is not None and meter.abandoned.is_set():
+        raise CallAbandoned("The call was abandoned by its caller.")
+
+
+class TokenBucket:
+    """
+    A thread-safe token bucket shared by every caller of one provider and model.
+
+    Callers reserve the next free slot in arrival order (GCRA), so concurrent
+    crews get the quota in turn instead of racing for it. A rate limit reply
+    pauses the bucket for its retry-after and halves the rate, and every
+    success afterwards wins some of it back (AIMD). The rate is halved at
+    most once per burst of rate limit replies: replies to requests reserved
+    before the last decrease were sent at the old rate and are not counted.
+    """
+
+    MIN_RATE_FACTOR = 0.1
+    RECOVERY_STEP = 0.05
+
+    def __init__(self, name: str, requests_per_minute: float, burst: int = 1):
+        self.name = name
+        self.interval = 60.0 / max(requests_per_minute, 1e-9)
+        self.burst = max(1, burst)
+        self.rate_factor = 1.0
+        self.throttled = 0
+        self.waited_seconds = 0.0
+
+        self._lock = threading.Lock()
+        self._theoretical_arrival = 0.0
+        self._paused_until = 0.0
+        self._decreased_at = float("-inf")
+
+    def reserve(self) -> float:
+        """
+        Takes the next free slot and returns how many seconds to wait for it.
+        """
+        with self._lock:
+            now = time.monotonic()
+            interval = self.interval / self.rate_factor
+            ready = max(now, self._theoretical_arrival - interval * (self.burst - 1), self._paused_until)
+            self._theoretical_arrival = max(self._theoretical_arrival, ready) + interval
+            delay = ready - now
+            self.waited_seconds += delay
+            return delay
+
+    def throttle(self, retry_after: float | None = None, reserved_at: float | None = None):
+        """
+        Records a rate limit reply: pauses every caller and slows the bucket
+        down. `reserved_at` is the time.monotonic() at which the failed request
+        reserved its slot, if it was before the last decrease the rate is kept.
+        """
+        with self._lock:
+            self.throttled += 1
+            now = time.monotonic()
+            decrease = reserved_at is None or reserved_at >= self._decreased_at
+            if decrease:
+                self.rate_factor = max(self.MIN_RATE_FACTOR, self.rate_factor / 2)
+                self._decreased_at = now
+            if retry_after:
+                self._paused_until = max(self._paused_until, now + retry_after)
+        if decrease:
+            logger.warning(
+                f"Rate limited by {self.name}, slowing down to {self.rate_factor:.0%} of the configured rate"
+                + (f" and pausing {retry_after:.1f}s." if retry_after else ".")
+            )
+
+    def succeeded(self):
+        if self.rate_factor < 1.0:
+            with self._lock:
+                self.rate_factor = min(1.0, self.rate_factor + self.RECOVERY_STEP)
+
+    def stats(self) -> dict:
+        return {
+            "requests_per_minute": round(60.0 / self.interval * self.rate_factor, 2),
+            "rate_factor": round(self.rate_factor, 2),
+            "throttled": self.throttled,
+            "waited_seconds": round(self.waited_seconds, 2),
+        }
+
+
+_buckets: dict[str, TokenBucket] = {}
+_buckets_lock = threading.Lock()
+
+
+def get_bucket(name: str, requests_per_minute: float, burst: int = 1) -> TokenBucket:
+    """
+    Returns the process-wide bucket for `name`, creating it on first use.
+    """
+    with _buckets_lock:
+        if name not in _buckets:
+            _buckets[name] = TokenBucket(name, requests_per_minute, burst)
+        return _buckets[name]
+
+
+def llm_bucket(provider: str, model_id: str) -> TokenBucket:
+    """
+    The bucket shared by every agent that uses the same provider and model.
+    LLM_RATE_LIMITS overrides LLM_REQUESTS_PER_MINUTE for single models.
+    """
+    name = f"{provider}/{model_id}"
+    rpm = settings.LLM_RATE_LIMITS.get(name, settings.LLM_REQUESTS_PER_MINUTE)
+    return get_bucket(name, rpm, settings.RATE_LIMIT_BURST)
+
+
+def tavily_bucket() -> TokenBucket:
+    return get_bucket("tavily", settings.TAVILY_REQUESTS_PER_MINUTE, settings.RATE_LIMIT_BURST)
+
+
+def rate_limit_stats() -> dict:
+    with _buckets_lock:
+        return {name: bucket.stats() for name, bucket in _buckets.items()}
+
+
+def is_rate_limit_error(error: BaseException) -> bool:
+    """
+    True for errors that go away by waiting: a 429 status or a rate limit
+    message. Spent quota and billing errors fail at once, unless the
+    provider says when to retry, as Gemini does for its per-minute quotas.
+    """
+    text = f"{type(error).__name__} {error}".lower()
+    if any(marker in text for marker in QUOTA_EXHAUSTED_MARKERS) and retry_after_seconds(error) is None:
+        return False
+    status = getattr(error, "status_code", None) or getattr(error, "code", None)
+    response = getattr(error, "response", None)
+    status = status or getattr(response, "status_code", None)
+    if status == 429:
+        return True
+    return any(marker in text for marker in RATE_LIMIT_MARKERS) or bool(STATUS_429_PATTERN.search(text))
+
+
+def retry_after_seconds(error: BaseException) -> float | None:
+    """
+    Reads the provider's retry-after hint from the error's response headers
+    or, failing that, from its message.
+    """
+    headers = getattr(getattr(error, "response", None), "headers", None) or {}
+    try:
+        value = headers.get("retry-after") or headers.get("Retry-After")
+        if value is not None:
+            return float(value)
+    except (TypeError, ValueError):
+        pass
+
+    match = RETRY_AFTER_PATTERN.search(str(error))
+    if match:
+        seconds = float(match.group(1))
+        return seconds / 1000 if (match.group(2) or "").lower() == "ms" else seconds
+    return None
+
+
+def backoff_delay(attempt: int, retry_after: float | None = None) -> float:
+    """
+    Full-jitter exponential backoff. A retry-after hint is a lower bound,
+    with a little jitter on top so paused callers do not all return at once.
+    """
+    if retry_after:
+        return retry_after + random.uniform(0, settings.RATE_LIMIT_BACKOFF_BASE_SECONDS)
+    ceiling = min(settings.RATE_LIMIT_BACKOFF_MAX_SECONDS, settings.RATE_LIMIT_BACKOFF_BASE_SECONDS * 2 ** attempt)
+    return random.uniform(0, ceiling)
+
+
+def call_with_rate_limit(bucket: TokenBucket, fn, *args, **kwargs):
+    """
+    Calls `fn` once a slot in `bucket` is free. Rate limit errors throttle the
+    bucket and are retried with backoff, up to RATE_LIMIT_MAX_RETRIES times.
+    """
+    meter = _call_meter.get()
+    attempt = 0
+    while True:
+        reserved_at = time.monotonic()
+        delay = bucket.reserve()
+        if delay > 0:
+            time.sleep(delay)
+        if meter is not None:
+            meter.waited_seconds += delay
+        _check_abandoned(meter)
+        try:
+            result = fn(*args, **kwargs)
+        except Exception as e:
+            if not is_rate_limit_error(e) or attempt >= settings.RATE_LIMIT_MAX_RETRIES:
+                raise
+            retry_after = retry_after_seconds(e)
+            bucket.throttle(retry_after, reserved_at)
+            backoff = backoff_delay(attempt, retry_after)
+            time.sleep(backoff)
+            if meter is not None:
+                meter.waited_seconds += backoff
+            _check_abandoned(meter)
+            attempt += 1
+        else:
+            bucket.succeeded()
+            return result
+
+
+async def acall_with_rate_limit(bucket: TokenBucket, fn, *args, **kwargs):
+    """
+    Async variant of call_with_rate_limit for coroutine functions.
+    """
+    meter = _call_meter.get()
+    attempt = 0
+    while True:
+        reserved_at = time.monotonic()
+        delay = bucket.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        if meter is not None:
+            meter.waited_seconds += delay
+        _check_abandoned(meter)
+        try:
+            result = await fn(*args, **kwargs)
+        except Exception as e:
+            if not is_rate_limit_error(e) or attempt >= settings.RATE_LIMIT_MAX_RETRIES:
+                raise
+            retry_after = retry_after_seconds(e)
+            bucket.throttle(retry_after, reserved_at)
+            backoff = backoff_delay(attempt, retry_after)
+            await asyncio.sleep(backoff)
+            if meter is not None:
+                meter.waited_seconds += backoff
+            _check_abandoned(meter)
+            attempt += 1
+        else:
+            bucket.succeeded()
+            return result
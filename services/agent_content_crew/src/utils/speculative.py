@@ -0,0 +1,66 @@
+import multiprocessing
+import os
+
+
+def _run_silently(conn, fn, args):
+    """
+    Child process entry point. Output is discarded so the background crew
+    does not draw over the interactive prompts in the parent's terminal.
+    """
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    os.dup2(devnull, 1)
+    os.dup2(devnull, 2)
+
+    try:
+        conn.send((True, fn(*args)))
+    except BaseException as e:
+        conn.send((False, f"{type(e).__name__}: {e}"))
+    finally:
+        conn.close()
+
+
+class SpeculativeTask:
+    """
+    Runs a function in a separate process so that its work can start early
+    and still be cancelled for real if its result turns out not to be needed.
+    `fn` and its arguments must be picklable.
+    """
+
+    def __init__(self, fn, *args):
+        context = multiprocessing.get_context("spawn")
+        self._conn, child_conn = context.Pipe(duplex=False)
+        self._process = context.Process(target=_run_silently, args=(child_conn, fn, args), daemon=True)
+        self._process.start()
+        child_conn.close()
+
+    def done(self) -> bool:
+        return self._conn.poll() or not self._process.is_alive()
+
+    def result(self, timeout: float | None = None):
+        """
+        Waits for the function to finish and returns its result.
+        Raises RuntimeError if it failed and TimeoutError if it is still running.
+        """
+        if not self._conn.poll(timeout):
+            raise TimeoutError("Speculative task is still running.")
+
+        try:
+            ok, value = self._conn.recv()
+        except EOFError:
+            # The process died (or was killed) before sending anything back
+            raise RuntimeError("Speculative task exited without a result.") from None
+        finally:
+            self._process.join()
+
+        if not ok:
+            raise RuntimeError(value)
+        return value
+
+    def cancel(self):
+        """
+        Stops the background process if it is still running.
+        """
+        if self._process.is_alive():
+            self._process.terminate()
+        self._process.join()
+        self._conn.close()
@@ -0,0 +1,183 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+
+def make_cache_key(*parts) -> str:
+    """
+    Builds a stable cache key from any JSON-serializable parts.
+    Dict keys are sorted so that equivalent parameter sets hash the same.
+    """
+    payload = json.dumps(parts, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class SQLiteCache:
+    """
+    A small persistent key/value cache backed by a local SQLite file.
+
+    Every entry carries its own expiry time. Once the cache grows beyond
+    `max_entries` or `max_bytes`, the least recently used entries are evicted.
+    The store is safe to share between threads and between processes.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        max_entries: int | None = None,
+        max_bytes: int | None = None,
+        default_ttl: float | None = None,
+    ):
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            str(self.path),
+            timeout=30,
+            check_same_thread=False,
+            isolation_level=None,  # autocommit, we manage transactions explicitly
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS entries (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                expires_at REAL,
+                last_access REAL NOT NULL,
+                hits INTEGER NOT NULL DEFAULT 0
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_entries_lru ON entries (last_access)")
+
+    def get(self, key: str) -> str | None:
+        """
+        Returns the cached value for `key`, or None on a miss or an expired entry.
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            value, expires_at = row
+            if expires_at is not None and expires_at <= now:
+                self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                self.misses += 1
+                return None
+
+            self._conn.execute(
+                "UPDATE entries SET last_access = ?, hits = hits + 1 WHERE key = ?",
+                (now, key),
+            )
+            self.hits += 1
+            return value
+
+    def set(self, key: str, value: str, ttl: float | None = None):
+        """
+        Stores `value` under `key`. `ttl` overrides the cache's default TTL;
+        an entry without any TTL never expires on its own.
+        """
+        now = time.time()
+        ttl = self.default_ttl if ttl is None else ttl
+        expires_at = now + ttl if ttl else None
+        size = len(value.encode("utf-8"))
+
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute(
+                    """
+                    INSERT OR REPLACE INTO entries (key, value, size, created_at, expires_at, last_access)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    """,
+                    (key, value, size, now, expires_at, now),
+                )
+                self._evict(now)
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def delete(self, key: str):
+        with self._lock:
+            self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM entries")
+
+    def stats(self) -> dict:
+        """
+        Returns the hit/miss counters of this process plus the current store size.
+        """
+        with self._lock:
+            entries, total_bytes = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries"
+            ).fetchone()
+
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "evictions": self.evictions,
+            "entries": entries,
+            "bytes": total_bytes,
+        }
+
+    def _evict(self, now: float):
+        """
+        Drops expired entries, then the least recently used ones until the
+        cache fits within its limits. Must be called inside a transaction.
+        """
+        cursor = self._conn.execute(
+            "DELETE FROM entries WHERE expires_at IS NOT NULL AND expires_at <= ?", (now,)
+        )
+        self.evictions += max(cursor.rowcount, 0)
+
+        if self.max_entries is not None:
+            cursor = self._conn.execute(
+                """
+                DELETE FROM entries WHERE key IN (
+                    SELECT key FROM entries ORDER BY last_access DESC LIMIT -1 OFFSET ?
+                )
+                """,
+                (self.max_entries,),
+            )
+            self.evictions += max(cursor.rowcount, 0)
+
+        if self.max_bytes is not None:
+            (total_bytes,) = self._conn.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM entries"
+            ).fetchone()
+            if total_bytes <= self.max_bytes:
+                return
+
+            rows = self._conn.execute(
+                "SELECT key, size FROM entries ORDER BY last_access ASC"
+            ).fetchall()
+            for key, size in rows:
+                if total_bytes <= self.max_bytes:
+                    break
+                self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                total_bytes -= size
+                self.evictions += 1
@@ -0,0 +1,344 @@
+import json
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from .prompt_inputs import count_tokens
+
+METRIC_PREFIX = "content_crew"
+
+# Columns of the end-of-run summary table
+SUMMARY_COLUMNS = ("kind", "name", "count", "errors", "retries", "total_s", "avg_s", "p95_s", "max_s",
+                   "prompt_tokens", "completion_tokens")
+
+
+@dataclass
+class Span:
+    """
+    One timed unit of work: a crew, agent, task, LLM call, tool call,
+    Tavily request or MinIO upload.
+    """
+    kind: str
+    name: str
+    start: float
+    end: float
+    status: str = "ok"
+    attributes: dict = field(default_factory=dict)
+
+    @property
+    def duration(self) -> float:
+        return max(0.0, self.end - self.start)
+
+    def to_dict(self) -> dict:
+        return {**asdict(self), "duration_ms": round(self.duration * 1000, 1)}
+
+
+class Tracer:
+    """
+    Collects spans for this process and exports them.
+
+    Spans are either recorded directly around a block of code with `span()`,
+    or assembled from separate start and finish events with `start()` and
+    `finish()`. Start and finish may arrive in any order, since crewAI runs
+    event handlers on a thread pool.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self._lock = threading.Lock()
+        self._spans: list[Span] = []
+        self._starts: dict[tuple, deque] = {}
+        self._finishes: dict[tuple, deque] = {}
+
+    def record(self, span: Span):
+        if not self.enabled:
+            return
+        with self._lock:
+            self._spans.append(span)
+
+    @contextmanager
+    def span(self, kind: str, name: str, **attributes):
+        """
+        Times the wrapped block. Yields the attributes dict so the block can
+        add to it; the span is marked as an error if the block raises.
+        """
+        if not self.enabled:
+            yield attributes
+            return
+
+        start = time.time()
+        status = "ok"
+        try:
+            yield attributes
+        except BaseException as e:
+            status = "error"
+            attributes["error"] = str(e)
+            raise
+        finally:
+            self.record(Span(kind, name, start, time.time(), status, attributes))
+
+    def start(self, kind: str, key: tuple, name: str, timestamp: float, **attributes):
+        self._pair(kind, key, starts=[(name, timestamp, attributes)])
+
+    def finish(self, kind: str, key: tuple, timestamp: float, status: str = "ok", **attributes):
+        self._pair(kind, key, finishes=[(timestamp, status, attributes)])
+
+    def _pair(self, kind: str, key: tuple, starts=(), finishes=()):
+        if not self.enabled:
+            return
+        key = (kind, *key)
+        with self._lock:
+            pending_starts = self._starts.setdefault(key, deque())
+            pending_finishes = self._finishes.setdefault(key, deque())
+            pending_starts.extend(starts)
+            pending_finishes.extend(finishes)
+
+            while pending_starts and pending_finishes:
+                name, start, start_attributes = pending_starts.popleft()
+                end, status, end_attributes = pending_finishes.popleft()
+                attributes = {**start_attributes, **end_attributes}
+                self._spans.append(Span(kind, name, start, max(start, end), status, attributes))
+
+            if not pending_starts and not pending_finishes:
+                del self._starts[key], self._finishes[key]
+
+    def spans(self) -> list[Span]:
+        with self._lock:
+            return list(self._spans)
+
+    def clear(self):
+        with self._lock:
+            self._spans.clear()
+            self._starts.clear()
+            self._finishes.clear()
+
+    def summary(self) -> list[dict]:
+        """
+        Aggregates the spans per kind and name.
+        """
+        groups: dict[tuple, list[Span]] = {}
+        for span in self.spans():
+            groups.setdefault((span.kind, span.name), []).append(span)
+
+        rows = []
+        for (kind, name), spans in sorted(groups.items()):
+            durations = sorted(span.duration for span in spans)
+            total = sum(durations)
+            rows.append({
+                "kind": kind,
+                "name": name,
+                "count": len(spans),
+                "errors": sum(1 for span in spans if span.status != "ok"),
+                "retries": sum(span.attributes.get("retries", 0) for span in spans),
+                "total_s": round(total, 3),
+                "avg_s": round(total / len(spans), 3),
+                "p95_s": round(durations[min(len(durations) - 1, int(len(durations) * 0.95))], 3),
+                "max_s": round(durations[-1], 3),
+                "prompt_tokens": sum(span.attributes.get("prompt_tokens", 0) for span in spans),
+                "completion_tokens": sum(span.attributes.get("completion_tokens", 0) for span in spans),
+            })
+        return rows
+
+    def summary_table(self) -> str:
+        """
+        Renders the summary as a plain text table.
+        """
+        rows = [[str(row[column]) for column in SUMMARY_COLUMNS] for row in self.summary()]
+        widths = [max([len(column)] + [len(row[i]) for row in rows]) for i, column in enumerate(SUMMARY_COLUMNS)]
+
+        def line(values):
+            return "  ".join(value.ljust(width) for value, width in zip(values, widths))
+
+        lines = [line(SUMMARY_COLUMNS), line(["-" * width for width in widths])]
+        lines += [line(row) for row in rows]
+        return "\n".join(lines)
+
+    def export_jsonl(self, path: str | Path) -> Path:
+        """
+        Appends every span to a JSON lines file.
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "a", encoding="utf-8") as f:
+            for span in self.spans():
+                f.write(json.dumps(span.to_dict(), ensure_ascii=False, default=str) + "\n")
+        return path
+
+    def export_prometheus(self, path: str | Path) -> Path:
+        """
+        Writes the aggregated metrics in the Prometheus text exposition format,
+        e.g. for the node_exporter textfile collector.
+        """
+        rows = self.summary()
+        metrics = [
+            ("span_duration_seconds", "summary", "Time spent per span kind and name."),
+            ("span_errors_total", "counter", "Spans that finished with an error."),
+            ("span_retries_total", "counter", "Retries recorded on spans."),
+            ("tokens_total", "counter", "Prompt and completion tokens per span kind and name."),
+        ]
+
+        lines = []
+        for metric, metric_type, help_text in metrics:
+            full_name = f"{METRIC_PREFIX}_{metric}"
+            lines.append(f"# HELP {full_name} {help_text}")
+            lines.append(f"# TYPE {full_name} {metric_type}")
+            for row in rows:
+                labels = f'kind="{_escape_label(row["kind"])}",name="{_escape_label(row["name"])}"'
+                if metric == "span_duration_seconds":
+                    lines.append(f"{full_name}_sum{{{labels}}} {row['total_s']}")
+                    lines.append(f"{full_name}_count{{{labels}}} {row['count']}")
+                elif metric == "span_errors_total":
+                    lines.append(f"{full_name}{{{labels}}} {row['errors']}")
+                elif metric == "span_retries_total":
+                    lines.append(f"{full_name}{{{labels}}} {row['retries']}")
+                else:
+                    lines.append(f'{full_name}{{{labels},type="prompt"}} {row["prompt_tokens"]}')
+                    lines.append(f'{full_name}{{{labels},type="completion"}} {row["completion_tokens"]}')
+
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write then rename, so a scraper never reads a half written file
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        tmp_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        tmp_path.replace(path)
+        return path
+
+
+def _escape_label(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _message_text(messages) -> str:
+    if isinstance(messages, str):
+        return messages
+    if isinstance(messages, list):
+        return "\n".join(str(message.get("content", "")) for message in messages if isinstance(message, dict))
+    return ""
+
+
+tracer = Tracer()
+_listener = None
+
+
+def enable_tracing():
+    """
+    Turns on span collection and subscribes to the crewAI event bus.
+    Safe to call more than once.
+    """
+    global _listener
+    tracer.enabled = True
+    if _listener is None:
+        _listener = _create_listener()
+
+
+def _create_listener():
+    from crewai.events import BaseEventListener
+    from crewai.events.types.agent_events import (
+        AgentExecutionCompletedEvent,
+        AgentExecutionErrorEvent,
+        AgentExecutionStartedEvent,
+    )
+    from crewai.events.types.llm_events import LLMCallCompletedEvent, LLMCallFailedEvent, LLMCallStartedEvent
+    from crewai.events.types.task_events import TaskCompletedEvent, TaskFailedEvent, TaskStartedEvent
+    from crewai.events.types.tool_usage_events import (
+        ToolUsageErrorEvent,
+        ToolUsageFinishedEvent,
+        ToolUsageStartedEvent,
+    )
+
+    class TracingListener(BaseEventListener):
+        """
+        Turns crewAI agent, task, LLM and tool events into spans.
+        """
+
+        def setup_listeners(self, crewai_event_bus):
+            @crewai_event_bus.on(TaskStartedEvent)
+            def on_task_started(source, event):
+                task = event.task
+                tracer.start("task", (_id(task),), _task_name(task), event.timestamp.timestamp())
+
+            @crewai_event_bus.on(TaskCompletedEvent)
+            def on_task_completed(source, event):
+                task = event.task
+                tracer.finish("task", (_id(task),), event.timestamp.timestamp(),
+                              retries=getattr(task, "retry_count", 0) or 0)
+
+            @crewai_event_bus.on(TaskFailedEvent)
+            def on_task_failed(source, event):
+                task = event.task
+                tracer.finish("task", (_id(task),), event.timestamp.timestamp(), status="error",
+                              error=event.error, retries=getattr(task, "retry_count", 0) or 0)
+
+            @crewai_event_bus.on(AgentExecutionStartedEvent)
+            def on_agent_started(source, event):
+                tracer.start("agent", (_id(event.agent), _id(event.task)), event.agent.role,
+                             event.timestamp.timestamp(), task=_task_name(event.task))
+
+            @crewai_event_bus.on(AgentExecutionCompletedEvent)
+            def on_agent_completed(source, event):
+                tracer.finish("agent", (_id(event.agent), _id(event.task)), event.timestamp.timestamp())
+
+            @crewai_event_bus.on(AgentExecutionErrorEvent)
+            def on_agent_error(source, event):
+                tracer.finish("agent", (_id(event.agent), _id(event.task)), event.timestamp.timestamp(),
+                              status="error", error=event.error)
+
+            @crewai_event_bus.on(LLMCallStartedEvent)
+            def on_llm_started(source, event):
+                tracer.start("llm", (event.task_id, event.agent_id), event.model or "llm",
+                             event.timestamp.timestamp(), task=event.task_name, agent=event.agent_role,
+                             prompt_tokens=count_tokens(_message_text(event.messages)))
+
+            @crewai_event_bus.on(LLMCallCompletedEvent)
+            def on_llm_completed(source, event):
+                response = event.response if isinstance(event.response, str) else str(event.response)
+                tracer.finish("llm", (event.task_id, event.agent_id), event.timestamp.timestamp(),
+                              completion_tokens=count_tokens(response))
+
+            @crewai_event_bus.on(LLMCallFailedEvent)
+            def on_llm_failed(source, event):
+                tracer.finish("llm", (event.task_id, event.agent_id), event.timestamp.timestamp(),
+                              status="error", error=event.error)
+
+            @crewai_event_bus.on(ToolUsageStartedEvent)
+            def on_tool_started(source, event):
+                tracer.start("tool", (event.agent_id, event.task_id, event.tool_name), event.tool_name,
+                             event.timestamp.timestamp(), task=event.task_name, agent=event.agent_role)
+
+            @crewai_event_bus.on(ToolUsageFinishedEvent)
+            def on_tool_finished(source, event):
+                tracer.finish("tool", (event.agent_id, event.task_id, event.tool_name),
+                              event.timestamp.timestamp(), from_cache=event.from_cache,
+                              retries=max(0, (event.run_attempts or 1) - 1))
+
+            @crewai_event_bus.on(ToolUsageErrorEvent)
+            def on_tool_error(source, event):
+                tracer.finish("tool", (event.agent_id, event.task_id, event.tool_name),
+                              event.timestamp.timestamp(), status="error", error=str(event.error),
+                              retries=max(0, (event.run_attempts or 1) - 1))
+
+    return TracingListener()
+
+
+def _id(obj) -> str | None:
+    return str(obj.id) if obj is not None and getattr(obj, "id", None) is not None else None
+
+
+def _task_name(task) -> str:
+    return getattr(task, "name", None) or "task"
+
+
+def export_traces(trace_dir: str | Path) -> dict[str, Path]:
+    """
+    Writes this run's spans as JSON lines and its metrics as a Prometheus
+    text file into `trace_dir`, and returns the written paths.
+    """
+    trace_dir = Path(trace_dir)
+    run_id = time.strftime("%Y%m%d-%H%M%S")
+    return {
+        "spans": tracer.export_jsonl(trace_dir / f"spans-{run_id}.jsonl"),
+        "metrics": tracer.export_prometheus(trace_dir / "metrics.prom"),
+    }
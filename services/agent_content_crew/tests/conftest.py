@@ -0,0 +1,61 @@
+import pytest
+
+from benchmarks import fixtures
+from src.models.content_models import MarketingBrief
+from src.pipeline import ContentPipeline
+from src.storage import factory
+from src.storage.memory_storage import MemoryStorage
+from src.utils.brief_index import BriefIndex
+from src.utils.checkpoints import CheckpointStore
+from src.utils.sqlite_cache import SQLiteCache
+
+
+@pytest.fixture
+def brief() -> MarketingBrief:
+    return MarketingBrief(**fixtures.SAMPLE_BRIEF)
+
+
+@pytest.fixture
+def validation_report():
+    return fixtures.VALIDATION_REPORT
+
+
+@pytest.fixture
+def research_report():
+    return fixtures.RESEARCH_REPORT
+
+
+@pytest.fixture
+def marketing_content():
+    return fixtures.MARKETING_CONTENT
+
+
+@pytest.fixture
+def storage(monkeypatch) -> MemoryStorage:
+    """
+    Replaces the process-wide storage backend with an empty in-memory one.
+    """
+    storage = MemoryStorage()
+    monkeypatch.setattr(factory, "_storage", storage)
+    return storage
+
+
+@pytest.fixture
+def checkpoint_store(tmp_path) -> CheckpointStore:
+    return CheckpointStore(SQLiteCache(tmp_path / "checkpoints.sqlite3"))
+
+
+@pytest.fixture
+def index(tmp_path) -> BriefIndex:
+    return BriefIndex(tmp_path / "brief_index.sqlite3")
+
+
+@pytest.fixture
+def pipeline(checkpoint_store, index) -> ContentPipeline:
+    """
+    A pipeline with its own checkpoints and brief index, no crew is ever built.
+    """
+    pipeline = ContentPipeline(show_spinner=False)
+    pipeline.checkpoints = checkpoint_store
+    pipeline.brief_index = index
+    return pipeline
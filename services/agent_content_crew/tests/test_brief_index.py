@@ -0,0 +1,126 @@
+import time
+
+import pytest
+
+from src.config.settings import settings
+from src.models.content_models import MarketingBrief
+from src.utils.brief_index import minhash, shingles, similarity
+
+
+def reworded(brief: MarketingBrief, **changes) -> MarketingBrief:
+    return brief.model_copy(update=changes)
+
+
+@pytest.fixture
+def other_brief(brief) -> MarketingBrief:
+    return reworded(
+        brief,
+        product_name="InboxZero",
+        category="Productivity Software",
+        problem_statement="Knowledge workers lose hours a day sorting email by hand.",
+        usp="The only mail client that files your email before you open it.",
+    )
+
+
+# --- similarity ---
+
+def test_identical_briefs_have_the_same_signature(brief):
+    assert similarity(minhash(shingles(brief)), minhash(shingles(brief.model_copy()))) == 1.0
+
+
+def test_only_the_identifying_fields_count(brief):
+    changed = reworded(brief, detailed_description="Something else entirely.", budget_range="$50k")
+    assert shingles(changed) == shingles(brief)
+
+
+# --- find ---
+
+def test_find_returns_a_near_duplicate(index, brief, validation_report):
+    index.add(brief, validation_report)
+    match = index.find(reworded(brief, product_name="TrailMate App"), min_similarity=0.7)
+    assert match is not None
+    assert match.report == validation_report
+    assert match.product_name == brief.product_name
+    assert 0.7 <= match.similarity < 1.0
+
+
+def test_find_ignores_unrelated_briefs(index, brief, other_brief, validation_report):
+    index.add(brief, validation_report)
+    assert index.find(other_brief, min_similarity=0.5) is None
+
+
+def test_find_returns_the_most_similar_brief(index, brief, validation_report):
+    closer = validation_report.model_copy(update={"viability_score": 90})
+    index.add(reworded(brief, product_name="TrailMate Pro Max Edition"), validation_report)
+    index.add(reworded(brief, product_name="TrailMate Pro"), closer)
+    match = index.find(reworded(brief, product_name="TrailMate Pro"), min_similarity=0.5)
+    assert match.report == closer
+
+
+def test_find_skips_briefs_older_than_the_max_age(index, brief, validation_report, monkeypatch):
+    index.add(brief, validation_report)
+    monkeypatch.setattr(time, "time", lambda: 10_000_000_000.0)
+    assert index.find(brief, min_similarity=0.8, max_age_seconds=3600) is None
+    assert index.find(brief, min_similarity=0.8) is not None
+
+
+def test_adding_a_brief_again_replaces_its_report(index, brief, validation_report):
+    index.add(brief, validation_report)
+    index.add(brief, validation_report.model_copy(update={"viability_score": 10}))
+    assert len(index) == 1
+    assert index.find(brief, min_similarity=0.8).report.viability_score == 10
+
+
+def test_prune_removes_old_briefs(index, brief, other_brief, validation_report, monkeypatch):
+    index.add(brief, validation_report)
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + 7200)
+    index.add(other_brief, validation_report)
+    assert index.prune(max_age_seconds=3600) == 1
+    assert len(index) == 1
+
+
+# --- reuse in the pipeline ---
+
+@pytest.fixture
+def auto_reuse(monkeypatch):
+    monkeypatch.setattr(settings, "VALIDATION_REUSE", "auto")
+
+
+def test_validation_is_checkpointed(pipeline, brief, validation_report, monkeypatch):
+    monkeypatch.setattr(pipeline, "_run_validation", lambda _: validation_report)
+    assert pipeline.run_validation(brief) == validation_report
+    key = pipeline._checkpoint_key("validation", ("validation_task",), brief, None)
+    assert pipeline.checkpoints.load(key, type(validation_report)) == validation_report
+
+
+def test_reused_validation_is_not_checkpointed_or_indexed(
+    pipeline, auto_reuse, brief, validation_report, monkeypatch
+):
+    pipeline.brief_index.add(brief, validation_report)
+    duplicate = reworded(brief, product_name="TrailMate App")
+    monkeypatch.setattr(pipeline, "_run_validation", lambda _: pytest.fail("the validator should not run"))
+    events = []
+    pipeline.on_progress = lambda event, stage: events.append(event)
+
+    assert pipeline.run_validation(duplicate) == validation_report
+    assert events == ["stage_reused"]
+    assert len(pipeline.brief_index) == 1
+    key = pipeline._checkpoint_key("validation", ("validation_task",), duplicate, None)
+    assert pipeline.checkpoints.load(key, type(validation_report)) is None
+
+
+def test_own_checkpoint_wins_over_reuse(pipeline, auto_reuse, brief, validation_report):
+    own = validation_report.model_copy(update={"viability_score": 33})
+    key = pipeline._checkpoint_key("validation", ("validation_task",), brief, None)
+    pipeline.checkpoints.save(key, own)
+    pipeline.brief_index.add(reworded(brief, product_name="TrailMate App"), validation_report)
+    assert pipeline.run_validation(brief) == own
+
+
+def test_fresh_runs_never_reuse(pipeline, auto_reuse, brief, validation_report, monkeypatch):
+    pipeline.fresh = True
+    pipeline.brief_index.add(brief, validation_report)
+    fresh_report = validation_report.model_copy(update={"viability_score": 12})
+    monkeypatch.setattr(pipeline, "_run_validation", lambda _: fresh_report)
+    assert pipeline.run_validation(brief) == fresh_report
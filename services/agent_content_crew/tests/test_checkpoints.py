@@ -0,0 +1,151 @@
+import pytest
+
+from src.config.settings import settings
+from src.models.validation_models import ValidationReport
+from src.utils.prompt_inputs import fields_read_by
+
+
+class StageCalls:
+    """Stands in for the crews of a pipeline and counts how often each stage runs."""
+
+    def __init__(self, pipeline, monkeypatch, validation_report, research_report, marketing_content):
+        self.counts = {"validation": 0, "research": 0, "writing": 0, "editing": 0}
+        outputs = {
+            "validation": validation_report,
+            "research": research_report,
+            "writing": marketing_content,
+            "editing": marketing_content.model_copy(update={"blog_post_markdown": "# Edited"}),
+        }
+        for stage, output in outputs.items():
+            monkeypatch.setattr(pipeline, f"_run_{stage}", self._stub(stage, output))
+        monkeypatch.setattr(pipeline, "run_publishing", lambda *args, **kwargs: True)
+
+    def _stub(self, stage, output):
+        def run(*args):
+            self.counts[stage] += 1
+            return output
+        return run
+
+
+@pytest.fixture
+def stages(pipeline, monkeypatch, validation_report, research_report, marketing_content):
+    monkeypatch.setattr(settings, "RESEARCH_MODE", "sequential")
+    monkeypatch.setattr(settings, "WRITING_MODE", "sequential")
+    monkeypatch.setattr(settings, "VALIDATION_REUSE", "off")
+    return StageCalls(pipeline, monkeypatch, validation_report, research_report, marketing_content)
+
+
+# --- keys ---
+
+def test_cosmetic_brief_edits_keep_the_key(checkpoint_store, brief):
+    edited = brief.model_copy(update={"problem_statement": f"  {brief.problem_statement}\n"})
+    assert checkpoint_store.key("validation", edited, {}) == checkpoint_store.key("validation", brief, {})
+
+
+def test_key_changes_with_the_model_config(checkpoint_store, brief):
+    before = checkpoint_store.key("validation", brief, {"validator": {"model_id": "a"}})
+    after = checkpoint_store.key("validation", brief, {"validator": {"model_id": "b"}})
+    assert before != after
+
+
+def test_key_changes_with_the_upstream_output(checkpoint_store, brief, validation_report):
+    changed = validation_report.model_copy(update={"viability_score": 10})
+    assert checkpoint_store.key("research", brief, {}, validation_report) != checkpoint_store.key(
+        "research", brief, {}, changed
+    )
+
+
+# --- store ---
+
+def test_saved_output_loads_as_its_model(checkpoint_store, validation_report):
+    checkpoint_store.save("key", validation_report)
+    assert checkpoint_store.load("key", ValidationReport) == validation_report
+
+
+def test_unreadable_checkpoint_is_discarded(checkpoint_store):
+    checkpoint_store.cache.set("key", '{"viability_score": "not a report"}')
+    assert checkpoint_store.load("key", ValidationReport) is None
+    assert checkpoint_store.cache.get("key") is None
+
+
+# --- resume ---
+
+def test_rerun_resumes_every_stage(pipeline, stages, brief, validation_report):
+    pipeline.run_validation(brief)
+    pipeline.run_content_generation(brief, validation_report)
+    events = []
+    pipeline.on_progress = lambda event, stage: events.append((event, stage))
+
+    assert pipeline.run_validation(brief) == validation_report
+    assert pipeline.run_research(brief, validation_report) is not None
+    assert stages.counts["validation"] == 1
+    assert stages.counts["research"] == 1
+    assert events == [("stage_resumed", "validation"), ("stage_resumed", "research")]
+
+
+def test_fresh_runs_every_stage_and_still_checkpoints(pipeline, stages, brief, validation_report):
+    pipeline.run_validation(brief)
+    pipeline.fresh = True
+    pipeline.run_validation(brief)
+    assert stages.counts["validation"] == 2
+
+    pipeline.fresh = False
+    pipeline.run_validation(brief)
+    assert stages.counts["validation"] == 2
+
+
+def test_failed_stage_is_not_checkpointed(pipeline, stages, brief, monkeypatch):
+    monkeypatch.setattr(pipeline, "_run_validation", lambda _: None)
+    assert pipeline.run_validation(brief) is None
+    key = pipeline._checkpoint_key("validation", ("validation_task",), brief, None)
+    assert pipeline.checkpoints.load(key, ValidationReport) is None
+
+
+def test_published_content_drops_its_writing_and_editing_checkpoints(pipeline, stages, brief, validation_report):
+    pipeline.run_content_generation(brief, validation_report)
+    pipeline.run_content_generation(brief, validation_report)
+    assert stages.counts == {"validation": 0, "research": 1, "writing": 2, "editing": 2}
+
+
+def test_failed_publishing_keeps_the_content_checkpoints(pipeline, stages, brief, validation_report, monkeypatch):
+    monkeypatch.setattr(pipeline, "run_publishing", lambda *args, **kwargs: False)
+    assert pipeline.run_content_generation(brief, validation_report) is None
+    assert pipeline.run_content_generation(brief, validation_report) is None
+    assert stages.counts["writing"] == 1
+    assert stages.counts["editing"] == 1
+
+
+# --- only the fields a stage reads ---
+
+def run_all_stages(pipeline, brief):
+    report = pipeline.run_validation(brief)
+    research = pipeline.run_research(brief, report)
+    draft = pipeline.run_writing(brief, research)
+    pipeline.run_editing(brief, draft)
+
+
+def test_fields_read_by_covers_every_task():
+    fields = fields_read_by(("validation_task", "editing_task"))
+    assert fields == fields_read_by(("validation_task",)) | fields_read_by(("editing_task",))
+    assert "product_name" in fields
+    assert "main_goal" not in fields
+
+
+def test_field_no_stage_reads_reruns_nothing(pipeline, stages, brief):
+    run_all_stages(pipeline, brief)
+    run_all_stages(pipeline, brief.model_copy(update={"budget_range": "$50k"}))
+    assert stages.counts == {"validation": 1, "research": 1, "writing": 1, "editing": 1}
+
+
+def test_field_read_by_writing_reruns_writing_only(pipeline, stages, brief):
+    run_all_stages(pipeline, brief)
+    run_all_stages(pipeline, brief.model_copy(update={"main_goal": "Get newsletter sign-ups"}))
+    # The draft is unchanged and editing does not read main_goal, so editing resumes too
+    assert stages.counts == {"validation": 1, "research": 1, "writing": 2, "editing": 1}
+
+
+def test_field_read_by_validation_only_keeps_research(pipeline, stages, brief):
+    run_all_stages(pipeline, brief)
+    run_all_stages(pipeline, brief.model_copy(update={"usp": "The lightest boot finder there is."}))
+    # Research reads neither the USP nor a changed report, writing and editing read the USP
+    assert stages.counts == {"validation": 2, "research": 1, "writing": 2, "editing": 2}
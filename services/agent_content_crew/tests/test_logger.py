@@ -0,0 +1,111 @@
+import io
+import json
+import logging
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.config.logger import (
+    CustomFormatter,
+    JsonFormatter,
+    RunContextHandler,
+    console_handler,
+    flush_logs,
+    get_run_id,
+    logger,
+    propagate_context,
+    run_context,
+)
+
+
+@pytest.fixture
+def console(monkeypatch) -> io.StringIO:
+    """Captures what the background listener writes to the console."""
+    stream = io.StringIO()
+    flush_logs()
+    monkeypatch.setattr(console_handler, "stream", stream)
+    return stream
+
+
+def record_with(run_id: str | None, **extra) -> logging.LogRecord:
+    record = logging.LogRecord("agent.content_crew", logging.INFO, __file__, 1, "Hello %s", ("world",), None)
+    record.run_id = run_id
+    record.__dict__.update(extra)
+    return record
+
+
+# --- run context ---
+
+def test_run_context_sets_and_restores_the_run_id():
+    assert get_run_id() is None
+    with run_context("outer") as outer:
+        assert outer == get_run_id() == "outer"
+        with run_context() as inner:
+            assert get_run_id() == inner != "outer"
+        assert get_run_id() == "outer"
+    assert get_run_id() is None
+
+
+def test_propagate_context_carries_the_run_id_into_pool_threads():
+    with run_context("brief-1"), ThreadPoolExecutor(max_workers=2) as pool:
+        propagated = pool.submit(propagate_context(get_run_id)).result()
+        plain = pool.submit(get_run_id).result()
+    assert propagated == "brief-1"
+    assert plain is None
+
+
+def test_propagated_calls_do_not_leak_into_each_other():
+    def tag_and_read(run_id):
+        with run_context(run_id):
+            return get_run_id()
+
+    with run_context("brief-1"):
+        wrapped = propagate_context(tag_and_read)
+    assert [wrapped("a"), wrapped("b")] == ["a", "b"]
+    assert get_run_id() is None
+
+
+# --- records ---
+
+def test_handler_captures_the_run_id_on_the_logging_thread():
+    records = queue.SimpleQueue()
+    handler = RunContextHandler(records)
+
+    def log():
+        handler.handle(record_with(None))
+
+    with run_context("brief-1"):
+        thread = threading.Thread(target=propagate_context(log))
+    thread.start()
+    thread.join()
+
+    record = records.get_nowait()
+    assert record.run_id == "brief-1"
+    assert record.getMessage() == "Hello world"
+
+
+def test_text_format_tags_the_run():
+    assert "[brief-1] Hello world" in CustomFormatter().format(record_with("brief-1"))
+    assert "] - Hello world" in CustomFormatter().format(record_with(None))
+
+
+def test_json_format_has_the_run_id_and_extra_fields():
+    entry = json.loads(JsonFormatter().format(record_with("brief-1", stage="research")))
+    assert entry["run_id"] == "brief-1"
+    assert entry["message"] == "Hello world"
+    assert entry["stage"] == "research"
+
+
+def test_records_from_worker_threads_reach_the_console_tagged(console):
+    def work(index):
+        logger.info(f"section {index} done")
+
+    with run_context("brief-1"), ThreadPoolExecutor(max_workers=2) as pool:
+        list(pool.map(propagate_context(work), range(2)))
+    flush_logs()
+
+    lines = [line for line in console.getvalue().splitlines() if "section" in line]
+    assert len(lines) == 2
+    assert all("[brief-1] section" in line for line in lines)
@@ -0,0 +1,143 @@
+import json
+
+import pytest
+
+from src.models.content_models import MarketingContent, ResearchReport
+from src.models.validation_models import ValidationReport
+from src.utils.output_repair import extract_json, repair_output
+
+VALIDATION = {
+    "market_demand": "Strong and growing search interest.",
+    "competitor_density": "Medium",
+    "monetization_potential": "Subscriptions with a hardware upsell.",
+    "viability_score": 72,
+    "recommendation": "High potential, proceed.",
+}
+
+RESEARCH = {
+    "audience_insights": "Hikers aged 25-45 who plan trips online.",
+    "market_trends": ["Lightweight gear", "Trip planning apps"],
+    "key_pain_points": ["Heavy packs", "Poor fit", "Unclear sizing"],
+    "competitor_analysis": "Three large brands dominate the market.",
+    "seo_keywords": [f"keyword {i}" for i in range(10)],
+}
+
+BLOG_POST = "# Setup\n\nInstall the CLI:\n\n```bash\npip install trailmate\n```\n\nThen run `trailmate init`."
+
+CONTENT = {
+    "blog_post_markdown": BLOG_POST,
+    "landing_page": {
+        "headline": "Hike lighter",
+        "sub_headline": "Gear that fits from the first mile.",
+        "feature_blurbs": ["Fits in minutes", "Weighs less", "Lasts longer"],
+        "call_to_action": "Get started",
+    },
+}
+
+
+def fenced(data: dict, language: str = "json") -> str:
+    return f"```{language}\n{json.dumps(data, indent=2)}\n```"
+
+
+def test_plain_json_needs_no_fixes():
+    output, fixes = repair_output(json.dumps(VALIDATION), ValidationReport)
+    assert output == ValidationReport(**VALIDATION)
+    assert fixes == []
+
+
+# --- fences ---
+
+@pytest.mark.parametrize("language", ["json", "JSON", ""])
+def test_fenced_answer_is_unwrapped(language):
+    output, fixes = repair_output(fenced(VALIDATION, language), ValidationReport)
+    assert output == ValidationReport(**VALIDATION)
+    assert fixes
+
+
+def test_answer_with_text_around_the_fence():
+    text = f"Here is the report:\n\n{fenced(VALIDATION)}\n\nLet me know if you need more."
+    output, _ = repair_output(text, ValidationReport)
+    assert output == ValidationReport(**VALIDATION)
+
+
+def test_fences_inside_string_values_are_kept():
+    output, _ = repair_output(fenced(CONTENT), MarketingContent)
+    assert output is not None
+    assert output.blog_post_markdown == BLOG_POST
+
+
+def test_markdown_with_braces_and_commas_is_kept():
+    blog_post = "Use `{\"debug\": true,}` in config.json, then run:\n\n```json\n{\"a\": [1, 2,]}\n```"
+    data = {**CONTENT, "blog_post_markdown": blog_post}
+    text = fenced(data).replace('"Lasts longer"', '"Lasts longer",')
+    output, _ = repair_output(text, MarketingContent)
+    assert output is not None
+    assert output.blog_post_markdown == blog_post
+    assert output.landing_page.feature_blurbs[-1] == "Lasts longer"
+
+
+# --- trailing commas and literals ---
+
+def test_trailing_commas_are_dropped():
+    text = '{"market_demand": "High", "competitor_density": "Low", "monetization_potential": "Ads", ' \
+           '"viability_score": 80, "recommendation": "Proceed",}'
+    output, _ = repair_output(text, ValidationReport)
+    assert output is not None
+    assert output.viability_score == 80
+
+
+def test_trailing_comma_in_a_list():
+    text = json.dumps(RESEARCH).replace('"Unclear sizing"]', '"Unclear sizing",]')
+    output, _ = repair_output(text, ResearchReport)
+    assert output is not None
+    assert output.key_pain_points == RESEARCH["key_pain_points"]
+
+
+def test_python_literals_outside_strings_only():
+    data, _ = extract_json('{"a": True, "b": None, "c": "True or None",}')
+    assert data == {"a": True, "b": None, "c": "True or None"}
+
+
+# --- list length ---
+
+def test_overlong_seo_keywords_are_trimmed():
+    data = {**RESEARCH, "seo_keywords": [f"keyword {i}" for i in range(14)]}
+    output, fixes = repair_output(json.dumps(data), ResearchReport)
+    assert output is not None
+    assert output.seo_keywords == [f"keyword {i}" for i in range(10)]
+    assert fixes
+
+
+def test_too_few_seo_keywords_cannot_be_repaired():
+    data = {**RESEARCH, "seo_keywords": ["only", "three", "keywords"]}
+    output, _ = repair_output(json.dumps(data), ResearchReport)
+    assert output is None
+
+
+# --- score bounds ---
+
+@pytest.mark.parametrize("score, expected", [(130, 100), (-5, 0)])
+def test_viability_score_is_clamped(score, expected):
+    output, fixes = repair_output(json.dumps({**VALIDATION, "viability_score": score}), ValidationReport)
+    assert output is not None
+    assert output.viability_score == expected
+    assert fixes
+
+
+def test_competitor_density_case_is_fixed():
+    output, _ = repair_output(json.dumps({**VALIDATION, "competitor_density": "high"}), ValidationReport)
+    assert output is not None
+    assert output.competitor_density == "High"
+
+
+# --- unrepairable ---
+
+def test_truncated_answer_is_not_repaired():
+    text = fenced(VALIDATION)[:-40]
+    output, _ = repair_output(text, ValidationReport)
+    assert output is None
+
+
+def test_answer_without_json_is_not_repaired():
+    output, _ = repair_output("I could not find enough data to write the report.", ValidationReport)
+    assert output is None
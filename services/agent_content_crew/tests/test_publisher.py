@@ -0,0 +1,98 @@
+import json
+
+from src.publisher import (
+    BLOG_POST_OBJECT,
+    LANDING_PAGE_OBJECT,
+    MANIFEST_OBJECT,
+    VALIDATION_REPORT_OBJECT,
+    build_manifest,
+    campaign_id_for,
+    campaign_prefix,
+    publish_content,
+)
+
+CAMPAIGN = "trailmate-test"
+
+
+def uploads(storage, monkeypatch) -> list[str]:
+    """Records the name of every object put into `storage`."""
+    names = []
+    put_text = storage.put_text
+
+    def recording_put_text(object_name, content, content_type=None):
+        names.append(object_name)
+        put_text(object_name, content, content_type)
+
+    monkeypatch.setattr(storage, "put_text", recording_put_text)
+    return names
+
+
+def manifest_of(storage, campaign_id: str = CAMPAIGN) -> dict:
+    return json.loads(storage.get_text(campaign_prefix(campaign_id) + MANIFEST_OBJECT))
+
+
+# --- campaign ids and manifests ---
+
+def test_campaign_id_ignores_cosmetic_edits(brief):
+    edited = brief.model_copy(update={"product_name": f" {brief.product_name} "})
+    assert campaign_id_for(edited) == campaign_id_for(brief)
+    assert campaign_id_for(brief).startswith("trailmate-")
+
+
+def test_campaign_id_differs_between_briefs(brief):
+    assert campaign_id_for(brief) != campaign_id_for(brief.model_copy(update={"main_goal": "Sell boots"}))
+
+
+def test_manifest_names_artifacts_by_content():
+    manifest = build_manifest(CAMPAIGN, {BLOG_POST_OBJECT: "one", LANDING_PAGE_OBJECT: "two"})
+    blog_post, landing_page = manifest["artifacts"]
+    assert blog_post["object_name"].startswith(campaign_prefix(CAMPAIGN) + "blog_post.")
+    assert blog_post["object_name"].endswith(".md")
+    assert blog_post["size"] == 3
+    assert blog_post["stage"] == "editing"
+    assert blog_post["object_name"] != landing_page["object_name"]
+
+    same = build_manifest(CAMPAIGN, {BLOG_POST_OBJECT: "one"})["artifacts"][0]
+    assert same["object_name"] == blog_post["object_name"]
+
+
+# --- deduplication ---
+
+def test_publish_uploads_every_artifact_then_the_manifest(storage, monkeypatch, marketing_content, validation_report):
+    names = uploads(storage, monkeypatch)
+    assert publish_content(marketing_content, CAMPAIGN, validation_report)
+
+    manifest = manifest_of(storage)
+    assert [entry["name"] for entry in manifest["artifacts"]] == [
+        VALIDATION_REPORT_OBJECT, BLOG_POST_OBJECT, LANDING_PAGE_OBJECT,
+    ]
+    assert sorted(names[:-1]) == sorted(entry["object_name"] for entry in manifest["artifacts"])
+    assert names[-1] == campaign_prefix(CAMPAIGN) + MANIFEST_OBJECT
+
+
+def test_republishing_the_same_content_uploads_only_the_manifest(storage, monkeypatch, marketing_content):
+    assert publish_content(marketing_content, CAMPAIGN)
+    names = uploads(storage, monkeypatch)
+    assert publish_content(marketing_content, CAMPAIGN)
+    assert names == [campaign_prefix(CAMPAIGN) + MANIFEST_OBJECT]
+
+
+def test_changed_content_uploads_only_the_changed_artifact(storage, monkeypatch, marketing_content):
+    assert publish_content(marketing_content, CAMPAIGN)
+    names = uploads(storage, monkeypatch)
+    edited = marketing_content.model_copy(update={"blog_post_markdown": "# A new post"})
+    assert publish_content(edited, CAMPAIGN)
+
+    assert len(names) == 2
+    assert names[0].startswith(campaign_prefix(CAMPAIGN) + "blog_post.")
+    blog_post = next(entry for entry in manifest_of(storage)["artifacts"] if entry["name"] == BLOG_POST_OBJECT)
+    assert blog_post["object_name"] == names[0]
+
+
+def test_failed_upload_publishes_no_manifest(storage, monkeypatch, marketing_content):
+    def failing_put_text(object_name, content, content_type=None):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(storage, "put_text", failing_put_text)
+    assert not publish_content(marketing_content, CAMPAIGN)
+    assert storage.get_text(campaign_prefix(CAMPAIGN) + MANIFEST_OBJECT) is None
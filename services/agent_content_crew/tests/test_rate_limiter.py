@@ -0,0 +1,220 @@
+import pytest
+
+from src.utils import rate_limiter
+from src.utils.rate_limiter import (
+    CallAbandoned,
+    CallMeter,
+    TokenBucket,
+    call_with_rate_limit,
+    is_rate_limit_error,
+    metered_call,
+    retry_after_seconds,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(rate_limiter, "time", clock)
+    return clock
+
+
+class FakeResponse:
+    def __init__(self, status_code=None, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+class FakeAPIError(Exception):
+    def __init__(self, message: str, response: FakeResponse | None = None):
+        super().__init__(message)
+        self.response = response
+
+
+# --- reserve ---
+
+def test_reserve_lets_the_burst_through_then_spaces_requests(clock):
+    bucket = TokenBucket("test", requests_per_minute=60, burst=3)
+    assert [bucket.reserve() for _ in range(3)] == [0, 0, 0]
+    assert bucket.reserve() == pytest.approx(1.0)
+    assert bucket.reserve() == pytest.approx(2.0)
+
+
+def test_reserve_refills_while_idle(clock):
+    bucket = TokenBucket("test", requests_per_minute=60, burst=1)
+    bucket.reserve()
+    assert bucket.reserve() == pytest.approx(1.0)
+    clock.now += 10
+    assert bucket.reserve() == 0
+
+
+def test_reserve_waits_out_a_pause(clock):
+    bucket = TokenBucket("test", requests_per_minute=60, burst=5)
+    bucket.throttle(retry_after=30)
+    assert bucket.reserve() == pytest.approx(30.0)
+
+
+def test_reserve_spaces_requests_at_the_reduced_rate(clock):
+    bucket = TokenBucket("test", requests_per_minute=60, burst=1)
+    bucket.throttle()
+    bucket.reserve()
+    assert bucket.reserve() == pytest.approx(2.0)
+
+
+# --- throttle ---
+
+def test_throttle_halves_the_rate_and_successes_recover_it(clock):
+    bucket = TokenBucket("test", requests_per_minute=60)
+    bucket.throttle()
+    assert bucket.rate_factor == 0.5
+    for _ in range(10):
+        bucket.succeeded()
+    assert bucket.rate_factor == pytest.approx(1.0)
+
+
+def test_throttle_decreases_once_for_a_burst_of_rate_limit_replies(clock):
+    bucket = TokenBucket("test", requests_per_minute=15)
+    # Five concurrent requests, all reserved before the provider answered 429
+    reserved_at = [clock.monotonic() for _ in range(5)]
+    clock.now += 1
+    for reserved in reserved_at:
+        bucket.throttle(reserved_at=reserved)
+    assert bucket.rate_factor == 0.5
+    assert bucket.throttled == 5
+
+
+def test_throttle_decreases_again_for_requests_reserved_after_the_decrease(clock):
+    bucket = TokenBucket("test", requests_per_minute=15)
+    bucket.throttle(reserved_at=clock.monotonic())
+    clock.now += 1
+    reserved = clock.monotonic()
+    clock.now += 1
+    bucket.throttle(reserved_at=reserved)
+    assert bucket.rate_factor == 0.25
+
+
+def test_throttle_never_goes_below_the_floor(clock):
+    bucket = TokenBucket("test", requests_per_minute=15)
+    for _ in range(10):
+        bucket.throttle()
+    assert bucket.rate_factor == TokenBucket.MIN_RATE_FACTOR
+
+
+def test_throttle_keeps_the_longest_pause(clock):
+    bucket = TokenBucket("test", requests_per_minute=60, burst=5)
+    bucket.throttle(retry_after=30)
+    bucket.throttle(retry_after=5)
+    assert bucket.reserve() == pytest.approx(30.0)
+
+
+# --- retry_after_seconds ---
+
+def test_retry_after_seconds_prefers_the_header():
+    error = FakeAPIError("retry in 99s", FakeResponse(429, {"retry-after": "12"}))
+    assert retry_after_seconds(error) == 12.0
+
+
+@pytest.mark.parametrize("message, expected", [
+    ("Please retry in 12.5s.", 12.5),
+    ("{'retryDelay': '7s'}", 7.0),
+    ("Retry-After: 30", 30.0),
+    ("retry after 1500ms", 1.5),
+])
+def test_retry_after_seconds_reads_the_message(message, expected):
+    assert retry_after_seconds(FakeAPIError(message)) == pytest.approx(expected)
+
+
+def test_retry_after_seconds_without_a_hint():
+    assert retry_after_seconds(FakeAPIError("Too many requests")) is None
+    assert retry_after_seconds(FakeAPIError("x", FakeResponse(429, {"retry-after": "soon"}))) is None
+
+
+# --- is_rate_limit_error ---
+
+@pytest.mark.parametrize("message", [
+    "Error code: 429 - {'error': 'slow down'}",
+    "status_code=429",
+    "{'code': 429, 'status': 'RESOURCE_EXHAUSTED'}",
+    "HTTP/1.1 429",
+    "RateLimitError: rate_limit_exceeded",
+    "429 RESOURCE_EXHAUSTED. You exceeded your current quota. Please retry in 12.5s.",
+])
+def test_is_rate_limit_error_matches_rate_limit_messages(message):
+    assert is_rate_limit_error(FakeAPIError(message))
+
+
+def test_is_rate_limit_error_reads_the_response_status():
+    assert is_rate_limit_error(FakeAPIError("failed", FakeResponse(429)))
+
+
+@pytest.mark.parametrize("message", [
+    "Request 84291 failed with status 500",
+    "Invalid token 4290 in the prompt",
+    "Connection reset after 429 bytes",
+])
+def test_is_rate_limit_error_ignores_429_inside_other_text(message):
+    assert not is_rate_limit_error(FakeAPIError(message))
+
+
+@pytest.mark.parametrize("message", [
+    "Error code: 429 - {'error': {'type': 'insufficient_quota', 'code': 'insufficient_quota'}}",
+    "You exceeded your current quota, please check your plan and billing details.",
+    "UsageLimitExceededError: This request exceeds your plan's set usage limit.",
+])
+def test_is_rate_limit_error_fails_spent_quota_at_once(message):
+    assert not is_rate_limit_error(FakeAPIError(message))
+
+
+def test_is_rate_limit_error_fails_spent_quota_despite_a_429_status():
+    assert not is_rate_limit_error(FakeAPIError("insufficient_quota", FakeResponse(429)))
+
+
+def test_call_with_rate_limit_does_not_retry_spent_quota(clock):
+    bucket = TokenBucket("test", requests_per_minute=60, burst=5)
+    attempts = []
+
+    def out_of_quota():
+        attempts.append(1)
+        raise FakeAPIError("Error code: 429 - insufficient_quota")
+
+    with pytest.raises(FakeAPIError):
+        call_with_rate_limit(bucket, out_of_quota)
+    assert len(attempts) == 1
+    assert bucket.rate_factor == 1.0
+    assert bucket.throttled == 0
+
+
+# --- call_with_rate_limit ---
+
+def test_call_with_rate_limit_reports_the_wait_to_the_meter(clock):
+    bucket = TokenBucket("test", requests_per_minute=60, burst=1)
+    bucket.reserve()
+    with metered_call(CallMeter()) as meter:
+        assert call_with_rate_limit(bucket, lambda: "ok") == "ok"
+    assert meter.waited_seconds == pytest.approx(1.0)
+
+
+def test_call_with_rate_limit_stops_retrying_an_abandoned_call(clock):
+    bucket = TokenBucket("test", requests_per_minute=60, burst=5)
+    meter = CallMeter()
+    attempts = []
+
+    def rate_limited():
+        attempts.append(1)
+        meter.abandoned.set()
+        raise FakeAPIError("Error code: 429")
+
+    with metered_call(meter), pytest.raises(CallAbandoned):
+        call_with_rate_limit(bucket, rate_limited)
+    assert len(attempts) == 1
@@ -0,0 +1,135 @@
+from types import SimpleNamespace
+
+import pytest
+from minio.error import S3Error
+
+from src.config.settings import SettingsError, settings
+from src.storage import minio_storage
+from src.storage.factory import build_storage
+from src.storage.local_storage import LocalStorage
+from src.storage.memory_storage import MemoryStorage
+from src.storage.minio_storage import MinioStorage
+from src.storage.objects import put_text_objects
+
+
+class FakeMinioClient:
+    """Keeps objects in a dict and answers the few calls MinioStorage makes."""
+
+    def __init__(self):
+        self.objects: dict[tuple[str, str], tuple[bytes, str]] = {}
+
+    def put_object(self, bucket_name, object_name, data, length, content_type=None):
+        self.objects[(bucket_name, object_name)] = (data.read(length), content_type)
+
+    def get_object(self, bucket_name, object_name):
+        if (bucket_name, object_name) not in self.objects:
+            raise S3Error(None, "NoSuchKey", "The object does not exist.", object_name, "", "")
+        data = self.objects[(bucket_name, object_name)][0]
+        return SimpleNamespace(read=lambda: data, close=lambda: None, release_conn=lambda: None)
+
+    def list_objects(self, bucket_name, prefix="", recursive=False):
+        return [
+            SimpleNamespace(object_name=name)
+            for bucket, name in sorted(self.objects) if bucket == bucket_name and name.startswith(prefix)
+        ]
+
+
+@pytest.fixture
+def minio_client(monkeypatch) -> FakeMinioClient:
+    client = FakeMinioClient()
+    monkeypatch.setattr(minio_storage, "get_minio_client", lambda: client)
+    monkeypatch.setattr(minio_storage, "ensure_bucket", lambda client, bucket_name: None)
+    return client
+
+
+@pytest.fixture(params=["memory", "local", "minio"])
+def backend(request, tmp_path):
+    if request.param == "memory":
+        return MemoryStorage()
+    if request.param == "local":
+        return LocalStorage(tmp_path / "storage")
+    request.getfixturevalue("minio_client")
+    return MinioStorage("campaigns")
+
+
+# --- every backend ---
+
+def test_put_then_get(backend):
+    backend.put_text("campaigns/a/blog_post.md", "# Hello")
+    assert backend.get_text("campaigns/a/blog_post.md") == "# Hello"
+
+
+def test_put_replaces_the_object(backend):
+    backend.put_text("campaigns/a/blog_post.md", "old")
+    backend.put_text("campaigns/a/blog_post.md", "new")
+    assert backend.get_text("campaigns/a/blog_post.md") == "new"
+
+
+def test_missing_object_is_none(backend):
+    assert backend.get_text("campaigns/a/missing.md") is None
+
+
+def test_list_names_under_a_prefix(backend):
+    for name in ("campaigns/a/one.md", "campaigns/a/sub/two.json", "campaigns/b/three.md"):
+        backend.put_text(name, name)
+    assert backend.list_names("campaigns/a/") == ["campaigns/a/one.md", "campaigns/a/sub/two.json"]
+    assert len(backend.list_names()) == 3
+
+
+# --- local ---
+
+def test_local_storage_rejects_names_outside_its_root(tmp_path):
+    storage = LocalStorage(tmp_path / "storage")
+    with pytest.raises(ValueError):
+        storage.put_text("../escaped.md", "nope")
+    assert not (tmp_path / "escaped.md").exists()
+
+
+def test_local_storage_leaves_no_temporary_files(tmp_path):
+    storage = LocalStorage(tmp_path / "storage")
+    storage.put_text("campaigns/a/blog_post.md", "# Hello")
+    assert [path.name for path in (tmp_path / "storage" / "campaigns" / "a").iterdir()] == ["blog_post.md"]
+
+
+# --- minio ---
+
+def test_minio_storage_sets_the_content_type(minio_client):
+    storage = MinioStorage("campaigns")
+    storage.put_text("a/manifest.json", "{}")
+    storage.put_text("a/blog_post.md", "# Hello")
+    assert minio_client.objects[("campaigns", "a/manifest.json")] == (b"{}", "application/json")
+    assert minio_client.objects[("campaigns", "a/blog_post.md")][1] == "text/markdown"
+
+
+# --- factory and uploads ---
+
+@pytest.mark.parametrize("name, backend_class", [("memory", MemoryStorage), ("local", LocalStorage)])
+def test_build_storage(name, backend_class, monkeypatch, tmp_path):
+    monkeypatch.setattr(settings, "STORAGE_LOCAL_DIR", tmp_path)
+    assert isinstance(build_storage(name), backend_class)
+
+
+def test_minio_backend_needs_its_settings(monkeypatch):
+    monkeypatch.setattr(settings, "MINIO_ENDPOINT", None)
+    with pytest.raises(SettingsError, match="MINIO_ENDPOINT"):
+        build_storage("minio")
+
+
+def test_unknown_backend_is_rejected():
+    with pytest.raises(ValueError, match="Unknown storage backend"):
+        build_storage("s3")
+
+
+def test_put_text_objects_reports_each_failure(storage, monkeypatch):
+    put_text = storage.put_text
+
+    def put_text_failing_for_json(object_name, content, content_type=None):
+        if object_name.endswith(".json"):
+            raise OSError("disk full")
+        put_text(object_name, content, content_type)
+
+    monkeypatch.setattr(storage, "put_text", put_text_failing_for_json)
+    errors = put_text_objects({"a/one.md": "1", "a/two.json": "2"})
+    assert errors["a/one.md"] is None
+    assert isinstance(errors["a/two.json"], OSError)
+    assert storage.list_names() == ["a/one.md"]
@@ -0,0 +1,54 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from crewai.llms.base_llm import BaseLLM
+
+from src.config.logger import propagate_context
+from src.llm.usage_scoped_llm import UsageScopedLLM, report_usage_to_scope
+
+
+class CountingLLM(BaseLLM):
+    """Reports `tokens` prompt tokens on every call, like a provider's usage block."""
+
+    def __init__(self, tokens: int = 10):
+        super().__init__(model="fake/counting")
+        self.tokens = tokens
+
+    def call(self, messages, tools=None, callbacks=None, available_functions=None, from_task=None, from_agent=None):
+        self._track_token_usage_internal(
+            {"prompt_tokens": self.tokens, "completion_tokens": 1, "total_tokens": self.tokens + 1}
+        )
+        return "ok"
+
+
+def test_each_wrapper_counts_only_its_own_calls():
+    shared = report_usage_to_scope(CountingLLM())
+    first, second = UsageScopedLLM(shared), UsageScopedLLM(shared)
+    first.call("hello")
+    first.call("hello")
+    second.call("hello")
+
+    assert first.get_token_usage_summary().prompt_tokens == 20
+    assert first.get_token_usage_summary().successful_requests == 2
+    assert second.get_token_usage_summary().prompt_tokens == 10
+    assert shared.get_token_usage_summary().prompt_tokens == 30
+
+
+def test_usage_from_other_threads_reaches_the_calling_wrapper():
+    shared = report_usage_to_scope(CountingLLM())
+
+    class ThreadedLLM(BaseLLM):
+        # Calls the shared model from a worker thread, as RoutedLLM does when hedging
+        def call(self, messages, *args, **kwargs):
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                return pool.submit(propagate_context(shared.call), messages).result()
+
+    scoped = UsageScopedLLM(ThreadedLLM(model="fake/threaded"))
+    scoped.call("hello")
+    assert scoped.get_token_usage_summary().prompt_tokens == 10
+
+
+def test_calls_outside_a_wrapper_are_not_attributed():
+    shared = report_usage_to_scope(CountingLLM())
+    scoped = UsageScopedLLM(shared)
+    shared.call("hello")
+    assert scoped.get_token_usage_summary().prompt_tokens == 0